@@ -0,0 +1,146 @@
+# Description: This file contains the animation support of the client.
+# The sprite sheets (dynamiteAnimation.png, explosion.png, smoke.png, ...) are sliced once into lists of frames, and
+# the rotated and flipped variants of the frames (for the aim directions) are rendered once and cached, so playing an
+# animation never slices, rotates or flips a surface. The animations advance on a fixed clock (ticks), independent
+# from the frame rate.
+
+from __future__ import annotations
+
+import pygame
+
+from assets import AssetManager, assets as default_assets
+
+TICK_RATE = 60 # The number of ticks per second of the animation clock
+ANGLE_STEP = 15 # The rotated variants are rendered every ANGLE_STEP degrees
+
+
+def slice_sheet(sheet: pygame.Surface, frame_size: tuple[int, int] | None = None) -> list[pygame.Surface]:
+    """
+    Slice a sprite sheet into frames.
+
+    The frames are read left to right, then top to bottom. Without frame size, the sheet is a strip of square frames
+    (vertical if it is taller than wide, horizontal otherwise).
+
+    Parameters:
+    - sheet: pygame.Surface - The sprite sheet.
+    - frame_size: tuple[int, int] | None - The (width, height) of a frame.
+
+    Returns:
+    - list[pygame.Surface] - The frames, as subsurfaces of the sheet.
+    """
+    if frame_size is None:
+        side = min(sheet.get_size())
+        frame_size = (side, side)
+    width, height = frame_size
+    return [
+        sheet.subsurface((x, y, width, height))
+        for y in range(0, sheet.get_height() - height + 1, height)
+        for x in range(0, sheet.get_width() - width + 1, width)
+    ]
+
+
+def quantize_angle(angle: float, step: int = ANGLE_STEP) -> int:
+    """
+    Round an angle (in degrees) to the closest rendered variant.
+
+    Parameters:
+    - angle: float - The angle, in degrees (counterclockwise, like pygame.transform.rotate).
+    - step: int - The precision of the variants, in degrees.
+
+    Returns:
+    - int - The angle of the variant, between 0 and 360 (excluded).
+    """
+    return int(round(angle / step) * step) % 360
+
+
+class FrameCache:
+    """
+    Cache of the frames of the sprite sheets, and of their rotated and flipped variants.
+
+    Attributes:
+    - manager: AssetManager - The asset manager loading the sheets.
+
+    Methods:
+    - frames(path: str, angle: float, flip: bool, frame_size: tuple) -> tuple - Get the frames of a sheet.
+    - clear() - Forget every cached frame.
+    """
+
+    def __init__(self, manager: AssetManager = default_assets) -> None:
+        """
+        Initialize the cache.
+
+        Parameters:
+        - manager: AssetManager - The asset manager loading the sheets.
+        """
+        self.manager = manager
+        self._frames: dict[tuple, tuple[pygame.Surface, ...]] = dict() # (path, angle, flip, frame_size) -> frames
+
+    def frames(
+        self, path: str, angle: float = 0, flip: bool = False, frame_size: tuple[int, int] | None = None
+    ) -> tuple[pygame.Surface, ...]:
+        """
+        Get the frames of a sprite sheet, rotated and flipped.
+
+        Parameters:
+        - path: str - The path of the sprite sheet.
+        - angle: float - The rotation, in degrees (rounded to ANGLE_STEP).
+        - flip: bool - Flip the frames horizontally (before the rotation), for the sprites looking left.
+        - frame_size: tuple[int, int] | None - The size of a frame (see slice_sheet).
+
+        Returns:
+        - tuple[pygame.Surface, ...] - The frames. They are shared, do not draw on them.
+        """
+        angle = quantize_angle(angle)
+        key = (path, angle, flip, frame_size)
+        frames = self._frames.get(key)
+        if frames is None:
+            if angle == 0 and not flip:
+                frames = tuple(slice_sheet(self.manager.load(path), frame_size))
+            else:
+                frames = self.frames(path, 0, False, frame_size) # The sliced frames, cached too
+                if flip:
+                    frames = tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+                if angle:
+                    frames = tuple(pygame.transform.rotate(frame, angle) for frame in frames)
+            self._frames[key] = frames
+        return frames
+
+    def clear(self) -> None:
+        """
+        Forget every cached frame.
+        """
+        self._frames.clear()
+
+
+class FixedClock:
+    """
+    Convert the variable duration of the frames into a whole number of fixed ticks.
+
+    Attributes:
+    - tick_rate: int - The number of ticks per second.
+
+    Methods:
+    - advance(dt: float) -> int - Get the number of ticks elapsed.
+    """
+
+    def __init__(self, tick_rate: int = TICK_RATE) -> None:
+        self.tick_rate = tick_rate
+        self._remainder = 0.0 # The time not converted into ticks yet, in seconds
+
+    def advance(self, dt: float) -> int:
+        """
+        Get the number of ticks elapsed during dt, keeping the remainder for the next call.
+
+        Parameters:
+        - dt: float - The duration of the frame, in seconds.
+
+        Returns:
+        - int - The number of ticks.
+        """
+        self._remainder += dt
+        ticks = int(self._remainder * self.tick_rate)
+        self._remainder -= ticks / self.tick_rate
+        return ticks
+
+
+frame_cache = FrameCache() # The frame cache shared by the client
@@ -0,0 +1,229 @@
+# Description: This file contains the asset manager of the client.
+# Every image is loaded from the disk once, converted to the format of the display (so blitting it does not convert
+# its pixels every time), and cached. The scaled variants of the images are cached by (path, size), and the small
+# sprites (weapons icons, crosshair, pickups) are packed into texture atlases.
+
+from __future__ import annotations
+
+import os
+
+import pygame
+
+ASSETS_DIR = '../assets' # The assets folder, relative to the client folder
+
+# The sprites smaller than this (in both dimensions) are packed into atlases
+ATLAS_MAX_SPRITE = 64
+
+
+def _key(path: str) -> str:
+    """
+    Normalize a path, so '../assets/a.png' and '../assets/./a.png' are the same asset.
+    """
+    return os.path.normpath(path)
+
+
+class AssetManager:
+    """
+    Load, convert and cache the images of the client.
+
+    The display mode must be set before loading an image, since the images are converted to its format.
+
+    Attributes:
+    - atlas_size: int - The size of the texture atlases.
+    - atlases: list - The texture atlases.
+    - loads: int - The number of images loaded from the disk.
+
+    Methods:
+    - add(path: str, image: pygame.Surface, alpha: bool) -> pygame.Surface - Convert and cache an image decoded elsewhere.
+    - load(path: str, alpha: bool) -> pygame.Surface - Get a converted image.
+    - scaled(path: str, size: tuple, alpha: bool, smooth: bool) -> pygame.Surface - Get a converted and scaled image.
+    - sprite(path: str) -> pygame.Surface - Get a small image, from its atlas if it is packed.
+    - pack(paths: list) - Pack small images into texture atlases.
+    - pack_directory(directory: str) - Pack the small images of a folder into texture atlases.
+    - forget(path: str) - Forget the cached versions of an image (when the file changed).
+    - clear() - Forget every cached image.
+    """
+
+    def __init__(self, atlas_size: int = 512) -> None:
+        """
+        Initialize the asset manager.
+
+        Parameters:
+        - atlas_size: int - The size of the texture atlases.
+        """
+        self.atlas_size = atlas_size
+        self.atlases: list[pygame.Surface] = list()
+        self.loads = 0
+        self._images: dict[tuple[str, bool], pygame.Surface] = dict() # (path, alpha) -> converted image
+        self._scaled: dict[tuple[str, tuple[int, int], bool], pygame.Surface] = dict() # (path, size, alpha) -> image
+        self._sprites: dict[str, pygame.Surface] = dict() # path -> subsurface of an atlas
+        self._packed_directories: set[str] = set()
+
+    def add(self, path: str, image: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """
+        Convert and cache an image decoded elsewhere (see preloader.py).
+
+        Parameters:
+        - path: str - The path of the image.
+        - image: pygame.Surface - The decoded image, not converted.
+        - alpha: bool - Keep the transparency of the image.
+
+        Returns:
+        - pygame.Surface - The converted image.
+        """
+        key = (_key(path), alpha)
+        if key not in self._images:
+            self._images[key] = image.convert_alpha() if alpha else image.convert()
+        return self._images[key]
+
+    def load(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Get a converted image, loading it from the disk the first time.
+
+        Parameters:
+        - path: str - The path of the image.
+        - alpha: bool - Keep the transparency of the image (convert_alpha), else the image is opaque (convert),
+        which is faster to blit (backgrounds).
+
+        Returns:
+        - pygame.Surface - The converted image. It is shared, do not draw on it.
+        """
+        key = (_key(path), alpha)
+        image = self._images.get(key)
+        if image is None:
+            image = self._images.get((key[0], not alpha)) # Already loaded with the other transparency
+            if image is None:
+                image = pygame.image.load(path)
+                self.loads += 1
+            image = image.convert_alpha() if alpha else image.convert()
+            self._images[key] = image
+        return image
+
+    def __contains__(self, path: str) -> bool:
+        return (_key(path), True) in self._images or (_key(path), False) in self._images
+
+    def scaled(self, path: str, size: tuple[int, int], alpha: bool = True, smooth: bool = False) -> pygame.Surface:
+        """
+        Get a converted image scaled to the given size, scaling it the first time.
+
+        Parameters:
+        - path: str - The path of the image.
+        - size: tuple - The (width, height) of the scaled image.
+        - alpha: bool - Keep the transparency of the image.
+        - smooth: bool - Use smoothscale instead of scale.
+
+        Returns:
+        - pygame.Surface - The scaled image. It is shared, do not draw on it.
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (_key(path), size, alpha)
+        image = self._scaled.get(key)
+        if image is None:
+            image = self.load(path, alpha)
+            if image.get_size() != size:
+                scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+                image = scale(image, size)
+            self._scaled[key] = image
+        return image
+
+    def sprite(self, path: str) -> pygame.Surface:
+        """
+        Get a small image, from its atlas if it is packed.
+
+        Parameters:
+        - path: str - The path of the image.
+
+        Returns:
+        - pygame.Surface - The image (a subsurface of an atlas if it is packed).
+        """
+        sprite = self._sprites.get(_key(path))
+        if sprite is None:
+            return self.load(path)
+        return sprite
+
+    def pack(self, paths: list[str]) -> None:
+        """
+        Pack small images into texture atlases.
+
+        The images are sorted by height and placed on shelves (rows), a new atlas is started when one is full.
+        The images bigger than the atlas are not packed.
+
+        Parameters:
+        - paths: list[str] - The paths of the images.
+        """
+        images = list()
+        for path in paths:
+            if _key(path) in self._sprites:
+                continue
+            image = self.load(path)
+            if image.get_width() <= self.atlas_size and image.get_height() <= self.atlas_size:
+                images.append((_key(path), image))
+        images.sort(key=lambda item: item[1].get_height(), reverse=True)
+
+        atlas = None
+        x = y = shelf_height = 0
+        for key, image in images:
+            width, height = image.get_size()
+            if atlas is not None and x + width > self.atlas_size: # Next shelf
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if atlas is None or y + height > self.atlas_size: # Next atlas
+                atlas = pygame.Surface((self.atlas_size, self.atlas_size), pygame.SRCALPHA).convert_alpha()
+                atlas.fill((0, 0, 0, 0))
+                self.atlases.append(atlas)
+                x = y = shelf_height = 0
+            atlas.blit(image, (x, y))
+            self._sprites[key] = atlas.subsurface((x, y, width, height))
+            x += width
+            shelf_height = max(shelf_height, height)
+
+    def pack_directory(self, directory: str = ASSETS_DIR) -> None:
+        """
+        Pack the small images (see ATLAS_MAX_SPRITE) of a folder into texture atlases.
+        A folder is only packed once.
+
+        Parameters:
+        - directory: str - The folder of the images.
+        """
+        if _key(directory) in self._packed_directories:
+            return
+        paths = list()
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')) or not os.path.isfile(path):
+                continue
+            key = (_key(path), True)
+            image = self._images.get(key) or pygame.image.load(path) # The big images are not kept
+            width, height = image.get_size()
+            if width <= ATLAS_MAX_SPRITE and height <= ATLAS_MAX_SPRITE:
+                if key not in self._images:
+                    self._images[key] = image.convert_alpha()
+                    self.loads += 1
+                paths.append(path)
+        self.pack(paths)
+        self._packed_directories.add(_key(directory))
+
+    def forget(self, path: str) -> None:
+        """
+        Forget the cached versions of an image (when the file changed). An atlas sprite stays packed.
+
+        Parameters:
+        - path: str - The path of the image.
+        """
+        key = _key(path)
+        self._images.pop((key, True), None)
+        self._images.pop((key, False), None)
+        for scaled in [scaled for scaled in self._scaled if scaled[0] == key]:
+            del self._scaled[scaled]
+
+    def clear(self) -> None:
+        """
+        Forget every cached image (for example when the display mode changes).
+        """
+        self._images.clear()
+        self._scaled.clear()
+        self._sprites.clear()
+        self._packed_directories.clear()
+        self.atlases.clear()
+
+
+assets = AssetManager() # The asset manager shared by the client
@@ -0,0 +1,240 @@
+# Description: This file contains the headless bots used to load test the server.
+# A bot is a client without display: it uses the protocol of network.py (without pygame), logs in (or registers),
+# plays a script of lobby actions, streams match inputs, then quits. Thousands of bots run in one process with asyncio,
+# and the latency of each command (time between the request and the answer of the server) is reported as histograms.
+#
+# Run it from the client folder, the server must be running:
+#     python bot.py --bots 1000 --register      (the first time, to create the accounts)
+#     python bot.py --bots 1000 --duration 30
+# With thousands of bots, raise the limit of open files first (ulimit -n).
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict, deque
+
+from network import Message, MessageDecoder, encode
+from updater import ASSETS_DIR, HashIndex, manifest_digest
+
+# The upper bounds of the buckets of the latency histograms, in milliseconds
+BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf'))
+WEAPONS = ('rifle', 'bazooka', 'pumpgun', 'revolver', 'grenade', 'mine') # The items of the HOTBAR SET commands
+
+
+class Latencies:
+    """
+    Latencies of the commands of all the bots.
+
+    Attributes:
+    - samples: dict - The latencies of each command, in milliseconds.
+    - errors: dict - The number of failures of each command (timeout, error answer, closed connection).
+
+    Methods:
+    - add(command: str, latency: float) - Add a latency.
+    - report() -> str - Format the histograms and percentiles of each command.
+    """
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def add(self, command: str, latency: float) -> None:
+        """
+        Add a latency.
+
+        Parameters:
+        - command: str - The command (LOGIN, HOTBAR SET, ...).
+        - latency: float - The latency, in seconds.
+        """
+        self.samples[command].append(latency * 1000)
+
+    def report(self) -> str:
+        """
+        Format the histograms and percentiles of each command.
+
+        Returns:
+        - str - The report.
+        """
+        lines = list()
+        for command in sorted(set(self.samples) | set(self.errors)):
+            samples = sorted(self.samples[command])
+            count = len(samples)
+            if count:
+                p50, p90, p99 = (samples[min(int(fraction * count), count - 1)] for fraction in (0.5, 0.9, 0.99))
+                lines.append(f'{command}: {count} answers, {self.errors[command]} errors, '
+                             f'p50 {p50:.2f} ms, p90 {p90:.2f} ms, p99 {p99:.2f} ms, max {samples[-1]:.2f} ms')
+            else:
+                lines.append(f'{command}: no answer, {self.errors[command]} errors')
+            start = 0
+            lower = 0
+            for upper in BUCKETS:
+                end = start
+                while end < count and samples[end] <= upper:
+                    end += 1
+                if end > start:
+                    label = f'<= {upper:g} ms' if upper != float('inf') else f'> {lower:g} ms'
+                    lines.append(f'  {label:>12} {end - start:8} {"#" * max(1, round(40 * (end - start) / count))}')
+                start, lower = end, upper
+        return '\n'.join(lines)
+
+
+class Bot:
+    """
+    A headless client.
+
+    Attributes:
+    - index: int - The number of the bot (its account is bot<index>@bots.test).
+    - latencies: Latencies - The latencies shared by all the bots.
+    - timeout: float - The maximum time to wait for an answer, in seconds.
+
+    Methods:
+    - request(command: str, message: str, heads: tuple) -> Message | None - Send a message and wait for its answer.
+    - run(options: argparse.Namespace) - Connect, play the script and quit.
+    """
+
+    def __init__(self, index: int, latencies: Latencies, timeout: float = 10.0) -> None:
+        self.index = index
+        self.latencies = latencies
+        self.timeout = timeout
+        self._writer: asyncio.StreamWriter | None = None
+        self._pending: deque[tuple[tuple[str, ...], asyncio.Future]] = deque() # The requests waiting for an answer
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        """
+        Decode the messages of the server and answer the pending requests, in order.
+        """
+        decoder = MessageDecoder()
+        while data := await reader.read(65536):
+            for message in decoder.feed(data):
+                if self._pending and message.head in self._pending[0][0]:
+                    _, future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(message)
+                # The other messages (SHOP OPEN, broadcasts, ...) are not answers
+        while self._pending: # The server closed the connection
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(ConnectionError('The server closed the connection'))
+
+    async def request(self, command: str, message: str, heads: tuple[str, ...]) -> Message | None:
+        """
+        Send a message and wait for its answer, recording the latency.
+
+        Parameters:
+        - command: str - The name of the command in the report.
+        - message: str - The message.
+        - heads: tuple - The heads of the possible answers.
+
+        Returns:
+        - Message - The answer.
+        - None - If the request failed (the failure is counted).
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((heads, future))
+        start = time.perf_counter()
+        self._writer.write(encode(message))
+        try:
+            await self._writer.drain()
+            answer = await asyncio.wait_for(future, self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            if (heads, future) in self._pending: # Else, the next answers would be matched to this request
+                self._pending.remove((heads, future))
+            self.latencies.errors[command] += 1
+            return None
+        self.latencies.add(command, time.perf_counter() - start)
+        if answer.head == 'ERROR' or answer.args[-1:] == ['ERROR']:
+            self.latencies.errors[command] += 1
+        return answer
+
+    async def run(self, options: argparse.Namespace) -> None:
+        """
+        Connect, log in (or register), play the lobby actions, stream the match inputs, and quit.
+
+        Parameters:
+        - options: argparse.Namespace - The options of the command line.
+        """
+        start = time.perf_counter()
+        try:
+            reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(options.host, options.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            self.latencies.errors['CONNECT'] += 1
+            return
+        self.latencies.add('CONNECT', time.perf_counter() - start)
+        receiving = asyncio.create_task(self._receive(reader))
+        email, password = f'bot{self.index}@bots.test', f'bot{self.index}'
+        try:
+            if options.register:
+                answer = await self.request('REGISTER', f'REGISTER bot{self.index} {email} {password}', ('REGISTER',))
+            else:
+                answer = await self.request('LOGIN', f'{email} {password}', ('LOGIN',))
+            if answer is None or answer.args != ['OK']:
+                return
+
+            for _ in range(options.actions):
+                await self.request('HOTBAR OPEN', 'HOTBAR OPEN', ('HOTBAR', 'ERROR'))
+                slot = random.randrange(6)
+                await self.request('HOTBAR SET', f'HOTBAR SET {slot} {random.choice(WEAPONS)}', ('OK', 'ERROR'))
+                await self.request('HOTBAR CLOSE', 'HOTBAR CLOSE', ('HOTBAR', 'ERROR'))
+                await self.request('UPDATE MANIFEST', f'UPDATE MANIFEST {options.digest}', ('MANIFEST', 'ERROR'))
+
+            # The match inputs are streamed without answer: only their sending is measured
+            interval = 1 / options.input_rate
+            end = time.perf_counter() + options.duration
+            sequence = 0
+            while time.perf_counter() < end:
+                sequence += 1
+                keys = ''.join(random.choice(('', key)) for key in 'wasd') or '-'
+                message = f'INPUT {sequence} {keys} {random.randrange(1920)} {random.randrange(1080)} {random.random() < 0.1:d}'
+                sent = time.perf_counter()
+                self._writer.write(encode(message))
+                await self._writer.drain()
+                self.latencies.add('INPUT (send)', time.perf_counter() - sent)
+                await asyncio.sleep(interval)
+
+            self._writer.write(encode('QUIT'))
+            await self._writer.drain()
+        except OSError:
+            self.latencies.errors['CONNECTION'] += 1
+        finally:
+            self._writer.close()
+            receiving.cancel()
+
+
+async def main(options: argparse.Namespace) -> None:
+    """
+    Start the bots, spreading the connections over the ramp time, and print the report.
+    """
+    latencies = Latencies()
+    bots = [Bot(index, latencies, options.timeout) for index in range(options.first, options.first + options.bots)]
+    tasks = list()
+    start = time.perf_counter()
+    for number, bot in enumerate(bots):
+        await asyncio.sleep(max(0.0, start + options.ramp * number / len(bots) - time.perf_counter()))
+        tasks.append(asyncio.create_task(bot.run(options)))
+    await asyncio.gather(*tasks)
+    print(f'{options.bots} bots in {time.perf_counter() - start:.1f} s')
+    print(latencies.report())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless bots to load test the server.')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=5555)
+    parser.add_argument('--bots', type=int, default=100, help='number of bots')
+    parser.add_argument('--first', type=int, default=0, help='number of the first bot account')
+    parser.add_argument('--register', action='store_true', help='register the accounts instead of logging in')
+    parser.add_argument('--actions', type=int, default=5, help='number of rounds of lobby actions per bot')
+    parser.add_argument('--duration', type=float, default=10.0, help='duration of the match input stream, in seconds')
+    parser.add_argument('--input-rate', type=float, default=30.0, help='match inputs per second per bot')
+    parser.add_argument('--ramp', type=float, default=5.0, help='time to connect all the bots, in seconds')
+    parser.add_argument('--timeout', type=float, default=10.0, help='maximum time to wait for an answer, in seconds')
+    parser.add_argument('--full-manifest', action='store_true', help='ask for the whole manifest (outdated clients)')
+    arguments = parser.parse_args()
+    # Up to date clients send the digest of their files, and the server answers MANIFEST OK
+    arguments.digest = manifest_digest([] if arguments.full_manifest else HashIndex().files(ASSETS_DIR))
+    asyncio.run(main(arguments))
@@ -6,15 +6,20 @@
 from __future__ import annotations
 
 import sys
-import threading
-import socket
 
 import pygame_menu
 import pygame
 import pygame_menu.themes
+from pygame_menu.font import preload_fonts
 
 from theme import login_theme
 from pgui.widget import Button
+from render import DirtyRenderer
+from assets import assets
+from updater import Updater
+from preloader import Preloader
+from network import Connection, Message
+from profiler import profiler
 # Check if pygame is already initialized
 if not pygame.get_init():
     pygame.init()
@@ -22,6 +27,9 @@ if not pygame.get_init():
 # Set the host and port for the client
 HOST, PORT = 'localhost', 5555
 
+# Event posted by the receiving thread to wake up the frame loop when messages arrive
+MESSAGE_RECEIVED = pygame.event.custom_type()
+
 
 class Client:
     """
@@ -30,18 +38,24 @@ class Client:
     Attributes:
     - host: str - The host of the server.
     - port: int - The port of the server.
-    - client_socket: socket - The client socket to connect to the server.
+    - connection: Connection - The connection to the server, receiving the messages in a thread.
     - state: str - The state of the client (login, lobby, shop).
     - pause: bool - The pause state of the client.
-    - threads: list - The list of threads for the client.
+    - waiting: bool - True while a login or register request is waiting for the answer of the server.
+    - preloader: Preloader - The preloader of the assets, decoding them while the login screen is showing.
     
     Methods:
     - send(message: str) - Send a message to the server.
-    - receive() -> str - Receive a message from the server.
+    - receive_payload(head: str) -> bytes | None - Wait for a message followed by binary data.
+    - update_assets() -> bool - Download the game files which changed.
+    - draw_loading(surface: pygame.Surface) - Draw the progress of the preloading.
+    - finish_loading() - Display the loading screen until the assets are preloaded.
     - login_ui() - Display the login user interface.
     - register() - Register a new user.
     - login() - Login a user.
-    - handle_inputs_from_server() - Handle inputs from the server.
+    - on_login(message: Message) - Handle the answer of the server to a login.
+    - on_register(message: Message) - Handle the answer of the server to a registration.
+    - on_shop(message: Message) - Handle the opening and closing of the shop.
     - lobby() - Display the lobby user interface.
     - run() - Run the client.
     """
@@ -57,12 +71,19 @@ class Client:
 
         self.host = host # The host of the server
         self.port = port # The port of the server
-        self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM) # The client socket to connect to the server
-        self.client_socket.connect((self.host, self.port)) # Connect to the server
+        # The connection to the server, its thread wakes up the frame loop when messages arrive
+        self.connection = Connection(self.host, self.port, lambda: pygame.event.post(pygame.event.Event(MESSAGE_RECEIVED)))
+        self.connection.on('LOGIN', self.on_login)
+        self.connection.on('REGISTER', self.on_register)
+        self.connection.on('SHOP', self.on_shop)
+        self.connection.start()
 
         self.state = 'login' # The state of the client (login, lobby, shop, etc.)
         self.pause = False # The pause state of the client
-        self.threads:list[threading.Thread] = list() # The list of threads for the client
+        self.waiting = False # A login or register request is waiting for the answer of the server
+        self.preloader = Preloader(assets) # The preloader of the assets, started with the login screen
+        # Resolve the fonts of the menus and of the pgui buttons (a scan of the system fonts) while the client starts
+        preload_fonts([login_theme.title_font, login_theme.widget_font, 'Calibri'])
 
     def load_preferences(self) -> None:
         """
@@ -79,19 +100,27 @@ class Client:
         Parameters:
         - message: str - The message to send to the server.
         """
-        message = message.encode('utf-8') # Encode the message to utf-8 
-        self.client_socket.send(message) # Send the message to the server
+        self.connection.send(message) # Send the message to the server
 
-    def receive(self) -> str:
+    def receive_payload(self, head: str) -> bytes | None:
         """
-        Receive a message from the server.
+        Wait for a message followed by binary data: a '<head> <size>' line, then size bytes.
+
+        This blocks the caller, it is only used by the loading steps (see updater.py).
+
+        Parameters:
+        - head: str - The expected head of the message.
 
         Returns:
-        - str - The message received from the server.
+        - bytes - The binary data.
+        - None - If the server answered '<head> OK' (nothing to send).
         """
-        response = self.client_socket.recv(1024) # Receive a message from the server
-        response = response.decode('utf-8') # Decode the message from utf-8
-        return response # Return the message
+        message = self.connection.wait((head, 'ERROR'))
+        if message.payload is not None:
+            return message.payload
+        if message.args == ['OK']:
+            return None
+        raise ConnectionError(f"Unexpected answer from the server: {message.head} {' '.join(message.args)}")
 
     def login_ui(self) -> None:
         """
@@ -101,6 +130,8 @@ class Client:
         """
         self.state = 'login' # Set the state to login
         surface = pygame.display.set_mode((800,600)) # Set the display surface
+        if not self.preloader.is_started(): # Decode the assets while the user logs in
+            self.preloader.start()
         email = str() # The email of the user
         password = str() # The password of the user
 
@@ -116,12 +147,24 @@ class Client:
             events = pygame.event.get() # Get the events (exit manager)
             for event in events:
                 if event.type == pygame.QUIT:
-                    self.send('QUIT')
-                    pygame.quit()
-                    sys.exit()
+                    self.stop()
+                profiler.handle_event(event)
+            profiler.mark('events')
+            self.connection.dispatch() # Handle the answers of the server (on_login)
+            profiler.mark('network')
+            self.preloader.poll() # Convert the images decoded by the preloader
+            profiler.mark('assets')
+            if self.state != 'login': # Logged in, or switched to the register screen
+                break
             self.menu.update(events)
             self.menu.draw(surface)
+            profiler.mark('menu')
+            self.draw_loading(surface)
+            profiler.draw(surface)
+            profiler.mark('render')
             pygame.display.flip()
+            profiler.mark('flip')
+            profiler.end_frame()
 
         print("[DBG] from client.py.Client.login : login_ui.done")
 
@@ -145,12 +188,24 @@ class Client:
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
-                    self.send('QUIT')
-                    pygame.quit()
-                    sys.exit()
+                    self.stop()
+                profiler.handle_event(event)
+            profiler.mark('events')
+            self.connection.dispatch() # Handle the answers of the server (on_register)
+            profiler.mark('network')
+            self.preloader.poll() # Convert the images decoded by the preloader
+            profiler.mark('assets')
+            if self.state != 'register':
+                break
             self.menu.update(events)
             self.menu.draw(surface)
+            profiler.mark('menu')
+            self.draw_loading(surface)
+            profiler.draw(surface)
+            profiler.mark('render')
             pygame.display.flip()
+            profiler.mark('flip')
+            profiler.end_frame()
         self.state = 'lobby'
         
     def register(self) -> None:
@@ -163,19 +218,27 @@ class Client:
         """
         data:dict = self.menu.get_input_data()
 
-        if not data['username'] or not data['email'] or not data['password']:
+        if not data['username'] or not data['email'] or not data['password'] or self.waiting:
             return
         print("[DBG] from client.py.Client.register : Registering user")
         print(f"[DBG] from client.py.Client.register : {data=}")
         self.send(f"REGISTER {data['username']} {data['email']} {data['password']}")
-        response = self.receive()
-        if response == 'REGISTER ERROR':
+        self.waiting = True # The answer is handled by on_register, the screen keeps rendering meanwhile
+
+    def on_register(self, message: Message) -> None:
+        """
+        Handle the answer of the server to a registration, either 'REGISTER OK' or 'REGISTER ERROR'.
+
+        Parameters:
+        - message: Message - The answer of the server.
+        """
+        self.waiting = False
+        if message.args == ['ERROR']:
             print('[DBG] from client.py.Client.register : Register failed')
-        else:   
+        else:
             print('[DBG] from client.py.Client.register : Register success')
             self.menu.close()
             self.state = 'lobby'
-            
 
     def login(self) -> None:
         """
@@ -189,38 +252,38 @@ class Client:
         data:dict = self.menu.get_input_data() # Get the input data from the menu
         if not data['email'] or not data['password']: # case where the email or password is empty
             return
-        
+        if self.waiting: # case where the previous request was not answered yet
+            return
+
         self.send(f"{data['email']} {data['password']}")  # Send the email and password to the server
-        response = self.receive() # Receive a response from the server, either 'LOGIN OK' or 'LOGIN ERROR'
+        self.waiting = True # The answer is handled by on_login, the screen keeps rendering meanwhile
 
-        if response == 'LOGIN ERROR': # case where the login failed
+    def on_login(self, message: Message) -> None:
+        """
+        Handle the answer of the server to a login, either 'LOGIN OK' or 'LOGIN ERROR'.
+
+        Parameters:
+        - message: Message - The answer of the server.
+        """
+        self.waiting = False
+        if message.args == ['ERROR']: # case where the login failed
             print('[DBG] from client.py.Client.login : Login failed')
         else: # case where the login succeeded
             print('[DBG] from client.py.Client.login : Login success')
             self.menu.close() # Close the menu
             self.state = 'lobby' # Change the state to lobby
 
-    def handle_inputs_from_server(self) -> None:
+    def on_shop(self, message: Message) -> None:
         """
-        Handle inputs from the server.
-        
-        The handle_inputs_from_server method listens for messages from the server and updates the game state accordingly.
-        
-        WARNING: This method is blocking and should be run in a separate thread.
-        DO NEVER USE THIS METHOD ALONE, AS <ctrl+c> IS NOT CERTAIN TO STOP THE PROGRAM.
-        """
-        while self.client_socket: # While the client socket is open
-            if self.done: # If the client is done
-                break # Break the loop
-            message = self.receive() # Receive a message from the server
-            if ' '  in message: # If the message contains a space
-                if len(message.split(' ')) >= 2: # If the message contains at least 2 elements
-                    command, data = message.split(' ') # Split the message into command and data
-                    if command == 'SHOP': # Command logic for the shop
-                        if data == 'OPEN':
-                            self.state = 'shop'
-                        elif data == 'CLOSE':
-                            self.state = 'lobby'
+        Handle the opening and closing of the shop, 'SHOP OPEN' or 'SHOP CLOSE'.
+
+        Parameters:
+        - message: Message - The message of the server.
+        """
+        if message.args == ['OPEN']:
+            self.state = 'shop'
+        elif message.args == ['CLOSE']:
+            self.state = 'lobby'
 
     def lobby(self) -> None:
         """
@@ -231,17 +294,16 @@ class Client:
 
         surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN) # Set the display surface to fullscreen
 
-        background = pygame.image.load('../assets/lobby.png') # Load the lobby background
-        background = pygame.transform.scale(background, (1920, 1080)) # Scale the background to the display size
+        background = assets.scaled('../assets/lobby.png', (1920, 1080), alpha=False) # Load the lobby background, scaled to the display size
 
         # * This part will change when the shop and hotbar will be implemented
-        shop_button_image = pygame.image.load('../assets/shop_button.png') # Load the shop button image
-        shop_button_image = shop_button_image.convert_alpha() # Convert the shop button image to alpha
+        shop_button_image = assets.load('../assets/shop_button.png') # Load the shop button image
         shop_button_area = pygame.Rect(0, 0, *shop_button_image.get_size()) # Create a rectangle for the shop button area
 
 
-        hotbar_button_image = pygame.image.load('../assets/hotbar.png') # Load the hotbar button image
-        hotbar_button_image = hotbar_button_image.convert_alpha() # Convert the hotbar button image to alpha
+        hotbar_button_image = assets.load('../assets/hotbar.png') # Load the hotbar button image
+
+        assets.pack_directory() # Pack the small sprites into atlases (only the first time)
 
         custom_cursor_map = (
             '................',
@@ -272,23 +334,31 @@ class Client:
         pygame.display.set_caption('Microtrooopers - lobby') # Set the display caption
         pygame.mouse.set_visible(True) # Ensure that the mouse is visible
 
-        rcv_thread = threading.Thread(target=self.handle_inputs_from_server) # Create a thread for handling inputs from the server
-        self.threads.append(rcv_thread) # Append the thread to the list of threads
-        rcv_thread.start() # Start the thread 
-
         resume_button_topleft = (surface.get_width() / 2 - 200, surface.get_height() / 2 - 50) # Resume button topleft
         resume_button = Button(*resume_button_topleft, 400, 50, 'Resume', self.do_unpause, font_color=(255, 255, 255), bg_color=(0, 0, 0, 255), outline_color=(255, 255, 255)) # Create a resume button
         exit_button_topleft = (surface.get_width() / 2 - 200, surface.get_height() / 2 + 50) # Exit button topleft
         exit_button = Button(*exit_button_topleft, 400, 50, 'Exit', self.stop, font_color=(255, 255, 255), bg_color=(0, 0, 0, 255), outline_color=(255, 255, 255)) # Create an exit button
 
+        renderer = DirtyRenderer(surface, profiler=profiler) # Only the changed regions of the screen are updated
+        pause_filter = pygame.Surface((surface.get_width(), surface.get_height())) # Pause filter, created once
+        pause_filter.set_alpha(128)
+        pause_filter.fill((0, 0, 0))
+        drawn = None # The (state, pause) drawn on the screen, a change means a full redraw
+
         while not self.done: # While the client is not done, do the lobby logic
-            events = pygame.event.get() # Get the events (exit manager)
+            events = renderer.get_events() # Get the events (sleeps while nothing changes)
+            profiler.mark('events')
+            self.connection.dispatch() # Handle the messages of the server (on_shop)
+            profiler.mark('network')
+            if self.connection.closed:
+                print('[DBG] from client.py.Client.lobby : the server closed the connection')
+                pygame.quit()
+                sys.exit()
             for event in events: # keyboard events handling loop
                 if event.type == pygame.QUIT:
-                    self.done = True
-                    self.send('QUIT')
-                    pygame.quit()
-                    sys.exit()
+                    self.stop()
+                if profiler.handle_event(event): # The overlay is drawn with the full redraw
+                    drawn = None
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if not self.pause:
@@ -296,39 +366,45 @@ class Client:
                         else:
                             self.pause = False
 
-            if self.state == 'lobby': # If the state is lobby, display the lobby user interface
-                surface.blit(background, (0, 0)) # Blit the background to the surface
-                surface.blit(shop_button_image, (0, 0)) # Blit the shop button image to the surface
-                surface.blit(
-                    hotbar_button_image,
-                    ((surface.get_width() / 2)- (hotbar_button_image.get_width() / 2),
-                    (surface.get_height()- 50 - hotbar_button_image.get_height()))
-                ) # Blit the hotbar button image to the surface
-            
-            # Pause menu
-            if self.pause:
-                surface_filter = pygame.Surface((surface.get_width(), surface.get_height())) # Create a surface filter
-                surface_filter.set_alpha(128)
-                surface_filter.fill((0, 0, 0))
-                surface.blit(surface_filter, (0, 0))
-                
-                # Resume button
-                resume_button.draw(surface)
-                
-
-                # Exit button
-                exit_button.draw(surface)
-
+            if profiler.overlay_due(): # Refresh the overlay (twice per second)
+                drawn = None
+            profiler.mark('simulation')
 
+            if self.pause:
+                # Handle button clicks
                 resume_button.handle_event(events)
                 exit_button.handle_event(events)
-
-                # Handle button clicks
-                
-
-
-            
-            pygame.display.flip() # Update the display
+            profiler.mark('menu')
+
+            if drawn != (self.state, self.pause): # Full redraw
+                drawn = (self.state, self.pause)
+                if self.state == 'lobby': # If the state is lobby, display the lobby user interface
+                    surface.blit(background, (0, 0)) # Blit the background to the surface
+                    surface.blit(shop_button_image, (0, 0)) # Blit the shop button image to the surface
+                    surface.blit(
+                        hotbar_button_image,
+                        ((surface.get_width() / 2)- (hotbar_button_image.get_width() / 2),
+                        (surface.get_height()- 50 - hotbar_button_image.get_height()))
+                    ) # Blit the hotbar button image to the surface
+
+                # Pause menu
+                if self.pause:
+                    surface.blit(pause_filter, (0, 0))
+                    resume_button.draw(surface) # Resume button
+                    exit_button.draw(surface) # Exit button
+                profiler.draw(surface)
+                renderer.invalidate()
+
+            elif self.pause: # Only the hovered buttons change
+                mouse_position = pygame.mouse.get_pos()
+                for button in (resume_button, exit_button):
+                    if button.update_hover(mouse_position):
+                        button.draw(surface) # The buttons are opaque, no need to redraw below them
+                        renderer.invalidate(button.get_rect())
+            profiler.mark('render')
+
+            renderer.flush() # Update the changed regions of the display
+            profiler.end_frame()
 
     def run(self) -> None:
         """
@@ -340,8 +416,69 @@ class Client:
 
         self.login_ui()
         print('[DBG] from client.py.Client.run : login_ui done')
+        self.update_assets()
+        self.finish_loading()
         self.lobby()
 
+    def draw_loading(self, surface: pygame.Surface) -> None:
+        """
+        Draw the progress of the preloading of the assets at the bottom of the surface.
+
+        Parameters:
+        - surface: pygame.Surface - The surface to draw on.
+        """
+        if self.preloader.is_done():
+            return
+        icon = assets.load('../assets/loading.png') # The loading icon
+        width, height = surface.get_size()
+        bar = pygame.Rect(icon.get_width() + 20, height - 10 - icon.get_height() // 2 - 5, width - icon.get_width() - 40, 10)
+        surface.blit(icon, (10, height - 10 - icon.get_height()))
+        pygame.draw.rect(surface, (255, 255, 255), (bar.x, bar.y, int(bar.width * self.preloader.progress()), bar.height))
+        pygame.draw.rect(surface, (255, 255, 255), bar, 1)
+
+    def finish_loading(self) -> None:
+        """
+        Display the loading screen until the assets are preloaded.
+        """
+        surface = pygame.display.get_surface()
+        clock = pygame.time.Clock()
+        while not self.preloader.is_done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.preloader.stop()
+                    self.stop()
+            profiler.mark('events')
+            self.preloader.poll(0.016)
+            profiler.mark('assets')
+            surface.fill((0, 0, 0))
+            self.draw_loading(surface)
+            profiler.draw(surface)
+            profiler.mark('render')
+            pygame.display.flip()
+            profiler.mark('flip')
+            clock.tick(60)
+            profiler.mark('idle')
+            profiler.end_frame()
+        if self.preloader.failed:
+            print(f'[DBG] from client.py.Client.finish_loading : could not load {self.preloader.failed}')
+
+    def update_assets(self) -> bool:
+        """
+        Download the game files which changed on the server.
+
+        Unchanged files are not hashed again (see updater.HashIndex), so this is fast when nothing changed.
+
+        Returns:
+        - bool - True if the game files are up to date.
+        """
+        updater = Updater(self)
+        up_to_date = updater.run()
+        for path in updater.updated: # Do not use the images loaded before the update
+            assets.forget(path)
+        self.preloader.forget(updater.updated)
+        print(f'[DBG] from client.py.Client.update_assets : {up_to_date=}, {updater.downloaded} bytes downloaded')
+        return up_to_date
+
     def do_unpause(self) -> None:
         """
         Pause the client.
@@ -354,10 +491,13 @@ class Client:
         self.pause = True
     def stop(self):
         self.done = True
-        self.send('QUIT')
+        if not self.connection.closed:
+            self.send('QUIT')
+            self.connection.close()
         pygame.quit()
         sys.exit()
 
 
-client = Client(HOST, PORT)
-client.run()
+if __name__ == '__main__':
+    client = Client(HOST, PORT)
+    client.run()
@@ -0,0 +1,211 @@
+# Description: This file contains the visual effects of the match view (explosions, smoke, shells).
+# The effects are pooled: every effect object is created once, with a fixed capacity, and reused when it expires.
+# The frames of the effects come from the frame cache (see animation.py), so spawning an effect never loads, converts,
+# slices or rotates a surface. The effects advance on the fixed animation clock and are drawn with one Surface.blits
+# call per frame.
+
+from __future__ import annotations
+
+import pygame
+
+from animation import FixedClock, FrameCache, TICK_RATE, frame_cache
+
+# Sprite sheets of the effects, as (path, frame duration in seconds)
+# The sheets are vertical strips of square frames
+EFFECT_SHEETS = {
+    'explosion': ('../assets/explosion.png', 0.06),
+    'smoke': ('../assets/smoke.png', 0.12),
+    'shell': ('../assets/shell.png', 0.5),
+    'dynamite': ('../assets/dynamiteAnimation.png', 0.1),
+}
+
+
+class Effect:
+    """
+    A running effect (one explosion, one smoke puff, one shell).
+
+    Attributes:
+    - frames: tuple - The frames of the effect (rotated and flipped).
+    - ticks_per_frame: int - The duration of a frame, in ticks of the animation clock.
+    - x: float - The x coordinate of the center of the effect.
+    - y: float - The y coordinate of the center of the effect.
+    - vx: float - The horizontal speed of the effect, in pixels per second.
+    - vy: float - The vertical speed of the effect, in pixels per second.
+    - age: int - The number of ticks since the effect started.
+    """
+    __slots__ = ('frames', 'ticks_per_frame', 'x', 'y', 'vx', 'vy', 'age')
+
+    def __init__(self) -> None:
+        self.frames: tuple[pygame.Surface, ...] = tuple()
+        self.ticks_per_frame = 1
+        self.x = self.y = self.vx = self.vy = 0.0
+        self.age = 0
+
+    def frame(self) -> pygame.Surface:
+        """
+        Get the current frame of the effect.
+        """
+        return self.frames[self.age // self.ticks_per_frame]
+
+    def update(self, ticks: int, dt: float) -> bool:
+        """
+        Update the effect.
+
+        Parameters:
+        - ticks: int - The number of ticks since the last update.
+        - dt: float - The same duration, in seconds.
+
+        Returns:
+        - bool - False if the effect is over.
+        """
+        self.age += ticks
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        return self.age < self.ticks_per_frame * len(self.frames)
+
+
+class EffectPool:
+    """
+    Fixed capacity pool of effects.
+
+    When every effect is in use, spawn() drops the new effect and counts it in the exhausted metric:
+    a missing smoke puff is better than a frame drop.
+
+    Attributes:
+    - capacity: int - The maximum number of effects running at the same time.
+    - active: list - The running effects.
+    - spawned: int - The total number of effects spawned.
+    - exhausted: int - The number of effects dropped because the pool was full.
+    - high_water: int - The highest number of effects running at the same time.
+
+    Methods:
+    - spawn(kind: str, x: float, y: float, vx: float, vy: float, angle: float, flip: bool) -> Effect | None - Start an
+    effect.
+    - preload(angles: list) - Render the rotated and flipped frames of every effect in advance.
+    - update(dt: float) - Update the running effects and recycle the expired ones.
+    - draw(surface: pygame.Surface, offset: tuple) - Draw the running effects.
+    - stats() -> dict - Get the usage metrics of the pool.
+    """
+
+    def __init__(self, capacity: int = 1024, cache: FrameCache = frame_cache) -> None:
+        """
+        Initialize the pool and slice the sprite sheets of the effects.
+
+        The display must be initialized, since the frames are converted to its format.
+
+        Parameters:
+        - capacity: int - The maximum number of effects running at the same time.
+        - cache: FrameCache - The cache of the frames.
+        """
+        self.capacity = capacity
+        self.cache = cache
+        self.clock = FixedClock()
+        # The duration of a frame of each kind of effect, in ticks
+        self.ticks_per_frame = {
+            kind: max(round(frame_duration * TICK_RATE), 1) for kind, (_, frame_duration) in EFFECT_SHEETS.items()
+        }
+        self.preload()
+
+        self._free = [Effect() for _ in range(capacity)] # The effects ready to be reused
+        self.active: list[Effect] = list() # The running effects
+
+        self.spawned = 0
+        self.exhausted = 0
+        self.high_water = 0
+        self._blits: list[tuple[pygame.Surface, tuple[float, float]]] = list() # Reused list of the blits of a frame
+
+    def preload(self, angles: list[float] = (0,)) -> None:
+        """
+        Render the frames of every effect in advance, for the given angles, looking left and right.
+
+        Parameters:
+        - angles: list[float] - The angles, in degrees.
+        """
+        for path, _ in EFFECT_SHEETS.values():
+            for angle in angles:
+                self.cache.frames(path, angle, False)
+                self.cache.frames(path, angle, True)
+
+    def spawn(
+        self, kind: str, x: float, y: float, vx: float = 0.0, vy: float = 0.0, angle: float = 0.0, flip: bool = False
+    ) -> Effect | None:
+        """
+        Start an effect.
+
+        Parameters:
+        - kind: str - The kind of effect (explosion, smoke, shell).
+        - x: float - The x coordinate of the center of the effect.
+        - y: float - The y coordinate of the center of the effect.
+        - vx: float - The horizontal speed of the effect.
+        - vy: float - The vertical speed of the effect.
+        - angle: float - The rotation of the effect, in degrees (the aim direction for the shells).
+        - flip: bool - Flip the effect horizontally (the soldier is looking left).
+
+        Returns:
+        - Effect - The effect.
+        - None - If the pool is exhausted.
+        """
+        if not self._free:
+            self.exhausted += 1
+            return None
+        effect = self._free.pop()
+        effect.frames = self.cache.frames(EFFECT_SHEETS[kind][0], angle, flip)
+        effect.ticks_per_frame = self.ticks_per_frame[kind]
+        effect.x, effect.y, effect.vx, effect.vy, effect.age = x, y, vx, vy, 0
+        self.active.append(effect)
+        self.spawned += 1
+        self.high_water = max(self.high_water, len(self.active))
+        return effect
+
+    def update(self, dt: float) -> None:
+        """
+        Update the running effects and recycle the expired ones.
+
+        The time is converted into ticks of the animation clock, so the animations play at the same speed whatever
+        the frame rate.
+
+        Parameters:
+        - dt: float - The time since the last update, in seconds.
+        """
+        ticks = self.clock.advance(dt)
+        if not ticks:
+            return
+        dt = ticks / self.clock.tick_rate
+        active = self.active
+        for index in range(len(active) - 1, -1, -1): # Backwards, expired effects are swapped with the last one
+            effect = active[index]
+            if not effect.update(ticks, dt):
+                active[index] = active[-1]
+                active.pop()
+                self._free.append(effect)
+
+    def draw(self, surface: pygame.Surface, offset: tuple[float, float] = (0, 0)) -> None:
+        """
+        Draw the running effects.
+
+        Parameters:
+        - surface: pygame.Surface - The surface to draw on.
+        - offset: tuple - The offset of the camera, subtracted from the positions of the effects.
+        """
+        ox, oy = offset
+        blits = self._blits
+        blits.clear()
+        for effect in self.active:
+            frame = effect.frames[effect.age // effect.ticks_per_frame]
+            blits.append((frame, (effect.x - ox - frame.get_width() / 2, effect.y - oy - frame.get_height() / 2)))
+        surface.blits(blits, doreturn=False)
+
+    def stats(self) -> dict:
+        """
+        Get the usage metrics of the pool.
+
+        Returns:
+        - dict - The capacity, in use, high water, spawned and exhausted counters.
+        """
+        return {
+            'capacity': self.capacity,
+            'in_use': len(self.active),
+            'high_water': self.high_water,
+            'spawned': self.spawned,
+            'exhausted': self.exhausted,
+        }
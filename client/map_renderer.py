@@ -0,0 +1,186 @@
+# Description: This file contains the renderer of the map of the match view.
+# The map is split into square tiles, rendered once per zoom level and cached. Each frame, only the tiles intersecting
+# the camera (centered on the player) are blitted. When the terrain changes (explosions, debris), only the tiles
+# touched by the change are dropped and rendered again when they are visible. The tile caches are bounded with LRU
+# eviction.
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.5, 2.0) # The zoom levels of the camera (mouse wheel)
+DEFAULT_ZOOM = 2 # The index of the default zoom level (1.0)
+
+
+class MapRenderer:
+    """
+    Camera culled, tile chunked renderer of the map.
+
+    Attributes:
+    - map_surface: pygame.Surface - The map (terrain with transparency), modified by the explosions.
+    - tile_size: int - The size of the tiles on the screen, in pixels.
+    - max_tiles: int - The maximum number of tiles cached, for all the zoom levels.
+    - zoom_index: int - The index of the current zoom level in ZOOM_LEVELS.
+    - rendered: int - The number of tiles rendered since the creation of the renderer.
+
+    Methods:
+    - zoom() -> float - Get the current zoom level.
+    - handle_event(event: pygame.event.Event) -> bool - Zoom with the mouse wheel.
+    - invalidate(rect: pygame.Rect) - Drop the tiles touched by a change of the map.
+    - carve(x: float, y: float, radius: float) - Remove a disk of terrain (explosion).
+    - draw(surface: pygame.Surface, center: tuple) - Draw the visible tiles around the camera center.
+    - screen_to_map(surface: pygame.Surface, center: tuple, position: tuple) -> tuple - Convert a screen position.
+    """
+
+    def __init__(self, map_surface: pygame.Surface, tile_size: int = 256, max_tiles: int = 256) -> None:
+        """
+        Initialize the renderer.
+
+        Parameters:
+        - map_surface: pygame.Surface - The map, converted with convert_alpha. It is modified by carve().
+        - tile_size: int - The size of the tiles on the screen, in pixels.
+        - max_tiles: int - The maximum number of tiles cached, for all the zoom levels.
+        """
+        self.map_surface = map_surface
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.zoom_index = DEFAULT_ZOOM
+        self.rendered = 0
+        self._tiles: OrderedDict[tuple[int, int, int], pygame.Surface] = OrderedDict() # (zoom, i, j) -> tile
+        self._blits: list[tuple[pygame.Surface, tuple[int, int]]] = list() # Reused list of the blits of a frame
+
+    def zoom(self) -> float:
+        """
+        Get the current zoom level.
+        """
+        return ZOOM_LEVELS[self.zoom_index]
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Zoom in or out with the mouse wheel.
+
+        Parameters:
+        - event: pygame.event.Event - The event.
+
+        Returns:
+        - bool - True if the zoom changed.
+        """
+        if event.type != pygame.MOUSEWHEEL or not event.y:
+            return False
+        index = min(max(self.zoom_index + (1 if event.y > 0 else -1), 0), len(ZOOM_LEVELS) - 1)
+        changed = index != self.zoom_index
+        self.zoom_index = index
+        return changed
+
+    def _source_rect(self, zoom_index: int, i: int, j: int) -> pygame.Rect:
+        """
+        Get the rectangle of the map covered by a tile, clipped to the map.
+        """
+        span = self.tile_size / ZOOM_LEVELS[zoom_index] # The size of a tile in map pixels
+        left, top = int(i * span), int(j * span)
+        rect = pygame.Rect(left, top, int((i + 1) * span) - left, int((j + 1) * span) - top)
+        return rect.clip(self.map_surface.get_rect())
+
+    def _tile(self, zoom_index: int, i: int, j: int) -> pygame.Surface | None:
+        """
+        Get a tile, rendering it if it is not cached.
+
+        Returns:
+        - pygame.Surface - The tile.
+        - None - If the tile is outside the map.
+        """
+        key = (zoom_index, i, j)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key) # Most recently used
+            return tile
+
+        source = self._source_rect(zoom_index, i, j)
+        if source.width <= 0 or source.height <= 0:
+            return None
+        zoom = ZOOM_LEVELS[zoom_index]
+        area = self.map_surface.subsurface(source)
+        if zoom == 1:
+            tile = area.copy()
+        else:
+            size = (max(round(source.width * zoom), 1), max(round(source.height * zoom), 1))
+            tile = pygame.transform.smoothscale(area, size) if zoom < 1 else pygame.transform.scale(area, size)
+        self._tiles[key] = tile
+        self.rendered += 1
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False) # Least recently used
+        return tile
+
+    def invalidate(self, rect: pygame.Rect) -> None:
+        """
+        Drop the cached tiles touched by a change of the map, for every zoom level.
+
+        Parameters:
+        - rect: pygame.Rect - The changed rectangle, in map coordinates.
+        """
+        rect = pygame.Rect(rect)
+        for zoom_index, zoom in enumerate(ZOOM_LEVELS):
+            span = self.tile_size / zoom
+            for i in range(int(rect.left // span), int((rect.right - 1) // span) + 1):
+                for j in range(int(rect.top // span), int((rect.bottom - 1) // span) + 1):
+                    self._tiles.pop((zoom_index, i, j), None)
+
+    def carve(self, x: float, y: float, radius: float) -> None:
+        """
+        Remove a disk of terrain from the map (explosion), and drop the tiles it touches.
+
+        Parameters:
+        - x: float - The x coordinate of the center, in map pixels.
+        - y: float - The y coordinate of the center, in map pixels.
+        - radius: float - The radius of the explosion.
+        """
+        rect = pygame.draw.circle(self.map_surface, (0, 0, 0, 0), (x, y), radius) # draw does not blend: transparent
+        self.invalidate(rect)
+
+    def draw(self, surface: pygame.Surface, center: tuple[float, float]) -> None:
+        """
+        Draw the tiles intersecting the camera.
+
+        Parameters:
+        - surface: pygame.Surface - The surface to draw on (the screen).
+        - center: tuple - The center of the camera (the player), in map pixels.
+        """
+        zoom = self.zoom()
+        size = self.tile_size
+        width, height = surface.get_size()
+        # The top left corner of the screen, in zoomed pixels
+        origin_x = center[0] * zoom - width / 2
+        origin_y = center[1] * zoom - height / 2
+
+        blits = self._blits
+        blits.clear()
+        for i in range(math.floor(origin_x / size), math.floor((origin_x + width - 1) / size) + 1):
+            for j in range(math.floor(origin_y / size), math.floor((origin_y + height - 1) / size) + 1):
+                if i < 0 or j < 0:
+                    continue
+                tile = self._tile(self.zoom_index, i, j)
+                if tile is not None:
+                    source = self._source_rect(self.zoom_index, i, j)
+                    blits.append((tile, (round(source.x * zoom - origin_x), round(source.y * zoom - origin_y))))
+        surface.blits(blits, doreturn=False)
+
+    def screen_to_map(
+        self, surface: pygame.Surface, center: tuple[float, float], position: tuple[int, int]
+    ) -> tuple[float, float]:
+        """
+        Convert a position on the screen (the mouse, for aiming) to map coordinates.
+
+        Parameters:
+        - surface: pygame.Surface - The screen.
+        - center: tuple - The center of the camera, in map pixels.
+        - position: tuple - The position on the screen.
+
+        Returns:
+        - tuple - The position on the map.
+        """
+        zoom = self.zoom()
+        width, height = surface.get_size()
+        return (center[0] + (position[0] - width / 2) / zoom, center[1] + (position[1] - height / 2) / zoom)
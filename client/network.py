@@ -0,0 +1,227 @@
+# Description: This file contains the network layer of the client.
+# The messages of the protocol are text lines ('LOGIN OK\n', 'SHOP OPEN\n', ...). Some of them are followed by binary
+# data: a '<head> <size>' line, then size bytes (see PAYLOAD_HEADS).
+# A receiving thread reads the socket, decodes the messages and appends them to a queue. The frame loop drains the
+# queue with dispatch(), which calls the handlers of the messages: the game state is only changed by the main thread,
+# and the frame loop never waits for the server.
+# This file does not depend on pygame, so the protocol can be reused by tools without a display.
+
+from __future__ import annotations
+
+import socket
+import threading
+from collections import deque
+from typing import Callable, NamedTuple
+
+PAYLOAD_HEADS = ('MANIFEST', 'CHUNK') # The messages which can be followed by binary data
+
+
+class Message(NamedTuple):
+    """
+    A message received from the server.
+
+    Attributes:
+    - head: str - The first word of the message (LOGIN, SHOP, MANIFEST, ...).
+    - args: list[str] - The other words of the message.
+    - payload: bytes | None - The binary data following the message, if any.
+    """
+    head: str
+    args: list[str]
+    payload: bytes | None = None
+
+
+def encode(message: str) -> bytes:
+    """
+    Encode a message for the server.
+
+    Parameters:
+    - message: str - The message, without newline.
+
+    Returns:
+    - bytes - The utf-8 line.
+    """
+    return (message + '\n').encode('utf-8')
+
+
+class MessageDecoder:
+    """
+    Split the bytes received from the server into messages.
+
+    Attributes:
+    - payload_heads: tuple - The heads of the messages which can be followed by binary data.
+
+    Methods:
+    - feed(data: bytes) -> list - Add received bytes, and get the messages completed by them.
+    """
+
+    def __init__(self, payload_heads: tuple[str, ...] = PAYLOAD_HEADS) -> None:
+        self.payload_heads = payload_heads
+        self._buffer = bytearray() # The received bytes not decoded yet
+
+    def feed(self, data: bytes) -> list[Message]:
+        """
+        Add received bytes, and get the messages completed by them.
+
+        Parameters:
+        - data: bytes - The received bytes.
+
+        Returns:
+        - list[Message] - The complete messages, in order.
+        """
+        buffer = self._buffer
+        buffer += data
+        messages = list()
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end == -1:
+                break
+            words = bytes(buffer[start:end]).decode('utf-8').split()
+            if len(words) == 2 and words[0] in self.payload_heads and words[1].isdigit(): # Binary data follows
+                size = int(words[1])
+                if len(buffer) - end - 1 < size: # Not received yet
+                    break
+                messages.append(Message(words[0], words[1:], bytes(buffer[end + 1:end + 1 + size])))
+                start = end + 1 + size
+            else:
+                if words: # Empty lines are ignored
+                    messages.append(Message(words[0], words[1:]))
+                start = end + 1
+        del buffer[:start]
+        return messages
+
+
+class Connection:
+    """
+    Connection to the server, with a receiving thread.
+
+    Attributes:
+    - sock: socket.socket - The socket connected to the server.
+    - closed: bool - True when the connection is closed (by the client or the server).
+
+    Methods:
+    - start() - Start the receiving thread.
+    - send(message: str) - Send a message to the server.
+    - on(head: str, handler: Callable) - Call a handler for the messages with the given head.
+    - dispatch() -> int - Call the handlers of the received messages.
+    - wait(heads: tuple, timeout: float) -> Message - Wait for a message, without dispatching it.
+    - close() - Close the connection and stop the receiving thread.
+    """
+
+    def __init__(self, host: str, port: int, notify: Callable[[], None] | None = None) -> None:
+        """
+        Connect to the server. The receiving thread is started by start().
+
+        Parameters:
+        - host: str - The host of the server.
+        - port: int - The port of the server.
+        - notify: Callable | None - Called by the receiving thread when messages arrive (to wake up the frame loop).
+        """
+        self.sock = socket.create_connection((host, port))
+        self.closed = False
+        self._notify = notify
+        self._decoder = MessageDecoder()
+        self._messages: deque[Message] = deque() # Appended by the receiving thread, popped by the main thread
+        self._arrived = threading.Event() # Set by the receiving thread when messages arrive (for wait)
+        self._handlers: dict[str, Callable[[Message], None]] = dict()
+        self._thread = threading.Thread(target=self._receive, name='receive', daemon=True)
+
+    def start(self) -> None:
+        """
+        Start the receiving thread.
+        """
+        self._thread.start()
+
+    def _receive(self) -> None:
+        """
+        Read the socket until the connection is closed (receiving thread).
+        """
+        while not self.closed:
+            try:
+                data = self.sock.recv(65536)
+            except OSError: # The socket was closed by close()
+                data = b''
+            if not data:
+                self.closed = True
+            else:
+                self._messages.extend(self._decoder.feed(data))
+            self._arrived.set()
+            if self._notify is not None:
+                self._notify()
+
+    def send(self, message: str) -> None:
+        """
+        Send a message to the server.
+
+        Parameters:
+        - message: str - The message, without newline.
+        """
+        self.sock.sendall(encode(message))
+
+    def on(self, head: str, handler: Callable[[Message], None]) -> None:
+        """
+        Call a handler (on the main thread, from dispatch) for the messages with the given head.
+
+        Parameters:
+        - head: str - The head of the messages.
+        - handler: Callable - The handler, called with the message.
+        """
+        self._handlers[head] = handler
+
+    def dispatch(self) -> int:
+        """
+        Call the handlers of the messages received since the last call. Messages without handler are dropped.
+
+        Returns:
+        - int - The number of messages.
+        """
+        count = 0
+        messages = self._messages
+        while messages:
+            message = messages.popleft()
+            handler = self._handlers.get(message.head)
+            if handler is not None:
+                handler(message)
+            else:
+                print(f'[DBG] from network.py.Connection.dispatch : unhandled message {message.head} {message.args}')
+            count += 1
+        return count
+
+    def wait(self, heads: tuple[str, ...], timeout: float = 10.0) -> Message:
+        """
+        Wait for a message with one of the given heads, and return it instead of dispatching it.
+        The other messages stay queued for dispatch. Only used by the loading steps (see updater.py).
+
+        Parameters:
+        - heads: tuple[str, ...] - The expected heads.
+        - timeout: float - The maximum time to wait, in seconds.
+
+        Returns:
+        - Message - The message.
+        """
+        skipped = list()
+        try:
+            while True:
+                self._arrived.clear()
+                while self._messages:
+                    message = self._messages.popleft()
+                    if message.head in heads:
+                        return message
+                    skipped.append(message)
+                if self.closed:
+                    raise ConnectionError('The server closed the connection')
+                if not self._arrived.wait(timeout):
+                    raise ConnectionError(f'No answer from the server (expected {heads})')
+        finally:
+            self._messages.extendleft(reversed(skipped)) # Keep the order of the messages
+
+    def close(self) -> None:
+        """
+        Close the connection and stop the receiving thread.
+        """
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR) # Wake up the receiving thread
+        except OSError:
+            pass
+        self.sock.close()
@@ -1,4 +1,5 @@
 import pygame
+from pygame_menu.font import text_cache
 
 class Widget:
     """
@@ -92,15 +93,26 @@ class Button(Widget):
         self.font = pygame.font.SysFont(font, font_size)
         self.font_size = font_size
         self.outline_color = outline_color
+        self.hovered = False
+
+    def update_hover(self, pos:tuple) -> bool:
+        """
+        Update the hover state of the button, return True if it changed (the button must be redrawn)
+        """
+        hovered = self.rect.collidepoint(*pos)
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
         
     def draw(self, screen):
         if self.visible:
             color = self.bg_color
-            if self.rect.collidepoint(*pygame.mouse.get_pos()):
+            self.update_hover(pygame.mouse.get_pos())
+            if self.hovered:
                 color = (color[0] + 50, color[1] + 50, color[2] + 50)
             pygame.draw.rect(screen, color, self.rect)
             pygame.draw.rect(screen, self.outline_color, self.rect, 2)
-            text = self.font.render(self.text, True, self.font_color)
+            text = text_cache.render(self.font, self.text, self.font_color) # Shared with the menus, rendered once
             text_rect = text.get_rect(center=self.rect.center)
             screen.blit(text, text_rect)
     
@@ -0,0 +1,161 @@
+# Description: This file contains the preloader of the assets of the client.
+# The images are decoded in a pool of threads (pygame releases the GIL while decoding), while the login screen is
+# showing. The decoded images are handed to the main thread, which converts them to the display format and caches them
+# in the asset manager, a few per frame so the login screen stays responsive.
+
+from __future__ import annotations
+
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from assets import AssetManager, ASSETS_DIR
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+
+def list_images(directory: str = ASSETS_DIR) -> list[str]:
+    """
+    List the images of a folder and its subfolders.
+
+    Parameters:
+    - directory: str - The folder.
+
+    Returns:
+    - list[str] - The paths of the images.
+    """
+    paths = list()
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return paths
+
+
+class Preloader:
+    """
+    Decode images in background threads, and convert them on the main thread.
+
+    Attributes:
+    - manager: AssetManager - The asset manager receiving the images.
+    - paths: list - The paths of the images to preload.
+    - loaded: int - The number of images converted and cached.
+    - failed: list - The paths of the images which could not be decoded.
+
+    Methods:
+    - start() - Start decoding the images.
+    - is_started() -> bool - Check if the preloading started.
+    - poll(budget: float) - Convert the decoded images, for at most budget seconds.
+    - forget(paths: list[str]) - Decode again the images whose file changed.
+    - progress() -> float - Get the progress of the preloading, between 0 and 1.
+    - is_done() -> bool - Check if every image was handled.
+    - stop() - Stop the threads.
+    """
+
+    def __init__(self, manager: AssetManager, paths: list[str] | None = None, workers: int = 4) -> None:
+        """
+        Initialize the preloader.
+
+        Parameters:
+        - manager: AssetManager - The asset manager receiving the images.
+        - paths: list[str] | None - The paths of the images, all the images of the assets folder by default.
+        - workers: int - The number of decoding threads.
+        """
+        self.manager = manager
+        self.paths = list_images() if paths is None else list(paths)
+        self.loaded = 0
+        self.failed: list[str] = list()
+        self._workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._decoded: queue.SimpleQueue = queue.SimpleQueue() # (path, version, surface or None), filled by the threads
+        self._pending: dict[str, int] = dict() # The version of each image not handled yet, bumped when its file changes
+
+    def _decode(self, path: str, version: int) -> None:
+        """
+        Decode an image (run by a thread).
+        """
+        try:
+            self._decoded.put((path, version, pygame.image.load(path)))
+        except (pygame.error, OSError, FileNotFoundError):
+            self._decoded.put((path, version, None))
+
+    def start(self) -> None:
+        """
+        Start decoding the images which are not already in the asset manager.
+        """
+        self.paths = [path for path in self.paths if path not in self.manager]
+        self._pending = {os.path.normpath(path): 0 for path in self.paths}
+        self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix='preloader')
+        for path in self.paths:
+            self._executor.submit(self._decode, os.path.normpath(path), 0)
+        if self.is_done():
+            self._executor.shutdown(wait=False)
+
+    def is_started(self) -> bool:
+        """
+        Check if the preloading started.
+        """
+        return self._executor is not None
+
+    def poll(self, budget: float = 0.004) -> None:
+        """
+        Convert the decoded images and add them to the asset manager (main thread only).
+
+        Parameters:
+        - budget: float - The maximum time to spend converting, in seconds.
+        """
+        deadline = pygame.time.get_ticks() + budget * 1000
+        while pygame.time.get_ticks() <= deadline:
+            try:
+                path, version, image = self._decoded.get_nowait()
+            except queue.Empty:
+                return
+            if self._pending.get(path) != version: # Decoded before its file changed
+                continue
+            del self._pending[path]
+            if image is None:
+                self.failed.append(path)
+            else:
+                self.manager.add(path, image)
+            self.loaded += 1
+            if self.is_done():
+                self._executor.shutdown(wait=False) # The threads exit, every image was handled
+
+    def forget(self, paths: list[str]) -> None:
+        """
+        Decode again the images whose file changed (see Client.update_assets), if they were not handled yet.
+        The images already handled are forgotten by the asset manager.
+
+        Parameters:
+        - paths: list[str] - The paths of the changed files.
+        """
+        for path in map(os.path.normpath, paths):
+            if path in self._pending and self._executor is not None:
+                self._pending[path] += 1
+                self._executor.submit(self._decode, path, self._pending[path])
+
+    def progress(self) -> float:
+        """
+        Get the progress of the preloading.
+
+        Returns:
+        - float - The ratio of the images handled, between 0 and 1.
+        """
+        if not self.paths:
+            return 1.0
+        return self.loaded / len(self.paths)
+
+    def is_done(self) -> bool:
+        """
+        Check if every image was handled.
+        """
+        return self.loaded >= len(self.paths)
+
+    def stop(self) -> None:
+        """
+        Stop the threads, the images not decoded yet are dropped.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,240 @@
+# Description: This file contains the frame profiler of the client.
+# The frame loops call mark(phase) at the end of each phase of a frame (event pump, network drain, simulation, menu,
+# world render, display flip), and end_frame() once per frame. A mark costs one perf_counter call and one addition,
+# so the profiler stays enabled in every build. The last frames are kept in ring buffers, for the rolling
+# percentiles shown by the overlay (toggled with F3). The garbage collector pauses are counted with gc.callbacks.
+# Setting the MICROTROOPERS_PROFILE environment variable to a .csv or .json path records every frame and exports
+# them when the client exits (headless profiling).
+
+from __future__ import annotations
+
+import atexit
+import csv
+import gc
+import json
+import os
+import time
+
+import pygame
+
+# The phases of a frame, in the order of the overlay
+PHASES = ('events', 'network', 'assets', 'simulation', 'menu', 'render', 'flip', 'idle')
+OVERLAY_KEY = pygame.K_F3 # The key toggling the overlay
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Get a percentile of values (nearest rank).
+
+    Parameters:
+    - values: list[float] - The values, not sorted.
+    - fraction: float - The percentile, between 0 and 1.
+
+    Returns:
+    - float - The value, or 0 if there is no value.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+class FrameProfiler:
+    """
+    Measure the time spent in each phase of the frames.
+
+    Attributes:
+    - window: int - The number of frames of the rolling percentiles.
+    - frames: int - The number of frames measured.
+    - visible: bool - True if the overlay is shown.
+    - record: bool - True if every frame is kept for the export.
+    - gc_collections: list - The number of collections of each generation of the garbage collector.
+    - gc_pause_max: float - The longest pause of the garbage collector, in seconds.
+
+    Methods:
+    - mark(phase: str) - End a phase of the current frame.
+    - end_frame() - End the current frame.
+    - summary() -> dict - Get the rolling p50 and p99 of each phase, and the garbage collector pauses.
+    - handle_event(event: pygame.event.Event) -> bool - Toggle the overlay with its key.
+    - overlay_due() -> bool - Check if the visible overlay must be rendered again.
+    - draw(surface: pygame.Surface) -> pygame.Rect | None - Draw the overlay.
+    - export(path: str) - Export the recorded frames to a CSV or JSON file.
+    - close() - Stop counting the garbage collector pauses.
+    """
+
+    def __init__(self, window: int = 600, record: bool = False) -> None:
+        """
+        Initialize the profiler.
+
+        Parameters:
+        - window: int - The number of frames of the rolling percentiles.
+        - record: bool - Keep every frame for the export.
+        """
+        self.window = window
+        self.frames = 0
+        self.visible = False
+        self.record = record
+        self._last = time.perf_counter() # The end of the last phase
+        self._current = dict.fromkeys(PHASES, 0.0) # The time spent in each phase of the current frame, in seconds
+        self._history = {phase: [0.0] * window for phase in PHASES + ('frame',)} # Ring buffers of the last frames
+        self._frame_start = self._last
+        self._recorded: list[tuple[float, ...]] = list() # Every frame, if record is True
+
+        self.gc_collections = [0, 0, 0]
+        self.gc_pause_max = 0.0
+        self._gc_pauses = 0 # The number of pauses during the current frame
+        self._gc_start = 0.0
+        gc.callbacks.append(self._gc_callback)
+
+        self._overlay: pygame.Surface | None = None # The rendered overlay, refreshed twice per second
+        self._overlay_time = 0.0
+        self._font: pygame.font.Font | None = None
+
+    def _gc_callback(self, phase: str, info: dict) -> None:
+        """
+        Count the pauses of the garbage collector.
+        """
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        else:
+            self.gc_collections[info['generation']] += 1
+            self.gc_pause_max = max(self.gc_pause_max, time.perf_counter() - self._gc_start)
+            self._gc_pauses += 1
+
+    def mark(self, phase: str) -> None:
+        """
+        End a phase of the current frame: the time since the previous mark is added to the phase.
+
+        Parameters:
+        - phase: str - The phase, one of PHASES.
+        """
+        now = time.perf_counter()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """
+        End the current frame and store its phases in the ring buffers.
+        """
+        now = time.perf_counter()
+        index = self.frames % self.window
+        current = self._current
+        history = self._history
+        for phase in PHASES:
+            history[phase][index] = current[phase]
+            current[phase] = 0.0
+        history['frame'][index] = now - self._frame_start
+        if self.record:
+            self._recorded.append(
+                (now - self._frame_start,) + tuple(history[phase][index] for phase in PHASES) + (self._gc_pauses,)
+            )
+        self._gc_pauses = 0
+        self._frame_start = self._last = now
+        self.frames += 1
+
+    def summary(self) -> dict:
+        """
+        Get the rolling p50 and p99 of each phase (in milliseconds), and the garbage collector pauses.
+
+        Returns:
+        - dict - {'frames', 'frame': (p50, p99), <phase>: (p50, p99), ..., 'gc': {...}}.
+        """
+        count = min(self.frames, self.window)
+        summary = {'frames': self.frames}
+        for phase in ('frame',) + PHASES:
+            values = self._history[phase][:count]
+            summary[phase] = (percentile(values, 0.5) * 1000, percentile(values, 0.99) * 1000)
+        summary['gc'] = {'collections': list(self.gc_collections), 'max_pause_ms': self.gc_pause_max * 1000}
+        return summary
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Toggle the overlay with its key.
+
+        Parameters:
+        - event: pygame.event.Event - The event.
+
+        Returns:
+        - bool - True if the overlay was toggled.
+        """
+        if event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+            self.visible = not self.visible
+            self._overlay = None
+            return True
+        return False
+
+    def overlay_due(self) -> bool:
+        """
+        Check if the overlay is visible and its text is older than half a second, for the screens which only redraw
+        what changed (see render.py).
+        """
+        return self.visible and (self._overlay is None or time.perf_counter() - self._overlay_time > 0.5)
+
+    def _render_overlay(self) -> pygame.Surface:
+        """
+        Render the text of the overlay.
+        """
+        if self._font is None:
+            self._font = pygame.font.SysFont('monospace', 14)
+        summary = self.summary()
+        p50, p99 = summary['frame']
+        lines = [f'frame    {p50:6.2f} {p99:6.2f} ms ({1000 / p50 if p50 else 0:.0f} fps)', '         p50    p99']
+        lines += [f'{phase:<8} {summary[phase][0]:6.2f} {summary[phase][1]:6.2f}' for phase in PHASES]
+        collections = summary['gc']['collections']
+        lines.append(f"gc {collections[0]}/{collections[1]}/{collections[2]} max {summary['gc']['max_pause_ms']:.2f} ms")
+        images = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+        overlay = pygame.Surface((max(image.get_width() for image in images) + 8, sum(image.get_height() for image in images) + 8))
+        y = 4
+        for image in images:
+            overlay.blit(image, (4, y))
+            y += image.get_height()
+        return overlay
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """
+        Draw the overlay in the top right corner of the surface, if it is visible.
+        The text is rendered again twice per second.
+
+        Parameters:
+        - surface: pygame.Surface - The surface to draw on.
+
+        Returns:
+        - pygame.Rect - The rectangle drawn.
+        - None - If the overlay is hidden.
+        """
+        if not self.visible:
+            return None
+        if self.overlay_due():
+            self._overlay = self._render_overlay()
+            self._overlay_time = time.perf_counter()
+        return surface.blit(self._overlay, (surface.get_width() - self._overlay.get_width(), 0))
+
+    def export(self, path: str) -> None:
+        """
+        Export the recorded frames (in milliseconds) to a CSV file, or to a JSON file with the summary.
+
+        Parameters:
+        - path: str - The path of the file, ending with .csv or .json.
+        """
+        columns = ('frame',) + PHASES
+        rows = [[round(value * 1000, 4) for value in row[:-1]] + [row[-1]] for row in self._recorded]
+        if path.endswith('.json'):
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'summary': self.summary(), 'columns': columns + ('gc_pauses',), 'frames': rows}, file)
+        else:
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(columns + ('gc_pauses',))
+                writer.writerows(rows)
+
+    def close(self) -> None:
+        """
+        Stop counting the garbage collector pauses.
+        """
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+
+
+profiler = FrameProfiler(record='MICROTROOPERS_PROFILE' in os.environ) # The profiler shared by the client
+if profiler.record:
+    atexit.register(profiler.export, os.environ['MICROTROOPERS_PROFILE'])
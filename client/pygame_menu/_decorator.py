@@ -60,9 +60,8 @@ class Decorator(Base):
     :param verbose: Enable/disable verbose mode (warnings/errors)
     """
     _coord_cache: Dict[str, Tuple[int, int, Union[Tuple[Tuple2NumberType, ...], Tuple2NumberType]]]  # centerx, centery, coords
-    _cache_last_status: Dict[str, Tuple[int, int, int, int, int, int]]
+    _cache_layers: Dict[str, Optional[List['_DecorationLayer']]]
     _cache_needs_update: Dict[str, bool]
-    _cache_surface: Dict[str, Optional['pygame.Surface']]
     _decor: Dict[str, List[Tuple[int, str, Any]]]  # type, id, data
     _decor_enabled: Dict[str, bool]
     _decor_prev_id: List[str]
@@ -103,11 +102,12 @@ class Decorator(Base):
         # 10000 decoration, with cache: 0.599
         self.cache = False
 
-        # Previous (surf.width, surf.height, rect.x, rect.y, rect.centerx, rect.centery
-        self._cache_last_status = {DECOR_TYPE_PREV: (0, 0, 0, 0, 0, 0),
-                                   DECOR_TYPE_POST: (0, 0, 0, 0, 0, 0)}
+        # The cache splits the decorations in layers. Each run of static
+        # decorations is drawn on a surface of its own bounding box, placed
+        # relative to the object rect, thus moving the object only moves the
+        # layer. The callable decorations are drawn every time between them
+        self._cache_layers = {DECOR_TYPE_PREV: None, DECOR_TYPE_POST: None}
         self._cache_needs_update = {DECOR_TYPE_PREV: False, DECOR_TYPE_POST: False}
-        self._cache_surface = {DECOR_TYPE_PREV: None, DECOR_TYPE_POST: None}
 
     def __copy__(self) -> 'Decorator':
         """
@@ -558,13 +558,7 @@ class Decorator(Base):
         text = str(text)
         font_obj = pygame_menu.font.get_font(font, size)
         color = assert_color(color)
-        surface_font = font_obj.render(text, antialias, color)
-        surface = make_surface(
-            width=surface_font.get_width(),
-            height=surface_font.get_height(),
-            alpha=True
-        )
-        surface.blit(surface_font, (0, 0))
+        surface = pygame_menu.font.text_cache.render(font_obj, text, color, antialias, alpha=True)
         return self._add_decor(
             DECORATION_TEXT, prev, (tuple(coords), surface, centered, kwargs)
         )
@@ -650,10 +644,9 @@ class Decorator(Base):
 
         .. note::
 
-            If your callable function changes over time set ``decorator.cache=False``
-            or force cache manually by calling Decorator method
-            :py:meth:`pygame_menu._decorator.Decorator.force_cache_update`. Also,
-            the object should force the menu surface cache to update.
+            The callable is called on each draw, even if the decorator cache is
+            enabled. If it changes over time the object should force the menu
+            surface cache to update.
 
         :param fun: Function
         :param prev: If ``True`` draw previous the object, else draws post
@@ -896,7 +889,7 @@ class Decorator(Base):
         surface: 'pygame.Surface'
     ) -> None:
         """
-        Draw cache, assemble if needed.
+        Draw cache, assemble the layers if needed.
 
         :param prev: Mode
         :param deco: Decoration lists
@@ -905,30 +898,120 @@ class Decorator(Base):
         if len(deco) == 0:
             return
 
-        w, h = surface.get_size()
+        if self._cache_needs_update[prev] or self._cache_layers[prev] is None:
+            layers: List['_DecorationLayer'] = []
+            for d in deco:
+                dynamic = d[0] == DECORATION_CALLABLE or d[0] == DECORATION_CALLABLE_NO_ARGS
+                if dynamic or len(layers) == 0 or layers[-1].dynamic:
+                    layers.append(_DecorationLayer(dynamic))
+                layers[-1].add(d)
+            self._cache_layers[prev] = layers
+            self._cache_needs_update[prev] = False
+
         rect = self._obj.get_rect()
+        for layer in self._cache_layers[prev]:
+            if layer.dynamic:
+                self._draw(layer.decorations, surface, rect)
+                continue
 
-        # If it needs update, or the surface size changed, or the rect position changed
-        prev_surf_changed = self._cache_last_status[prev][0] != w or \
-                            self._cache_last_status[prev][1] != h
-        prev_rect_changed = self._cache_last_status[prev][2] != rect.x or \
-                            self._cache_last_status[prev][3] != rect.y or \
-                            self._cache_last_status[prev][4] != rect.width or \
-                            self._cache_last_status[prev][5] != rect.height
-
-        if (
-            self._cache_needs_update[prev] or
-            prev_surf_changed or
-            prev_rect_changed or
-            self._cache_surface[prev] is None
-        ):
-            self._cache_last_status[prev] = (w, h, rect.x, rect.y, rect.width, rect.height)
-            del self._cache_surface[prev]
-            self._cache_surface[prev] = make_surface(surface.get_width(), surface.get_height())
-            self._draw(deco, self._cache_surface[prev])
-            self._cache_needs_update[prev] = False
+            # The layer only depends on the rect size, unless its decorations
+            # are placed in absolute coordinates of the surface
+            status = (rect.size, (rect.topleft, surface.get_size()) if layer.position_dependent else None)
+            if layer.status != status:
+                layer.status = status
+                layer.surface = None
+                bounds = self._get_bounds(layer.decorations, rect)
+                if bounds is not None and layer.position_dependent:
+                    bounds = bounds.clip(surface.get_rect())
+                if bounds is not None and bounds.width > 0 and bounds.height > 0:
+                    layer.offset = (bounds.x - rect.x, bounds.y - rect.y)
+                    if layer.position_dependent:
+                        layer_surface = make_surface(*surface.get_size())
+                        self._draw(layer.decorations, layer_surface, rect)
+                        layer.surface = layer_surface.subsurface(bounds).copy()
+                    else:
+                        layer.surface = make_surface(bounds.width, bounds.height)
+                        self._draw(layer.decorations, layer.surface, rect.move(-bounds.x, -bounds.y))
+
+            if layer.surface is not None:
+                surface.blit(layer.surface, (rect.x + layer.offset[0], rect.y + layer.offset[1]))
 
-        surface.blit(self._cache_surface[prev], (0, 0))
+    def _get_bounds(
+        self,
+        deco: List[Tuple[int, str, Any]],
+        rect: 'pygame.Rect'
+    ) -> Optional['pygame.Rect']:
+        """
+        Return the area drawn by the enabled static decorations, with a margin
+        of some px for the antialias and line widths.
+
+        :param deco: Decoration list
+        :param rect: Object rect
+        :return: Bounding rect in the coordinates of the surface, or ``None`` if nothing is drawn
+        """
+        bounds = []
+        for d in deco:
+            dtype, decoid, data = d
+            if not self._decor_enabled[decoid]:
+                continue
+
+            if dtype == DECORATION_POLYGON or dtype == DECORATION_BEZIER or \
+                    dtype == DECORATION_TEXTURE_POLYGON or dtype == DECORATION_LINE:
+                width = data[3] if dtype == DECORATION_POLYGON else (data[2] if dtype == DECORATION_LINE else 0)
+                points = self._update_pos_list(rect, decoid, data[0], **data[-1])
+                x = [p[0] for p in points]
+                y = [p[1] for p in points]
+                d_rect = pygame.Rect(min(x), min(y), max(x) - min(x) + 1, max(y) - min(y) + 1)
+                d_rect.inflate_ip(2 * width, 2 * width)
+
+            elif dtype == DECORATION_CIRCLE or dtype == DECORATION_ARC or dtype == DECORATION_PIE:
+                x, y = self._update_pos_list(rect, decoid, data[0], **data[-1])[0]
+                r = data[1]
+                if dtype == DECORATION_ARC and not data[6]:
+                    d_rect = pygame.Rect(x - r, y - r, x + 2 * r, y + 2 * r)
+                    d_rect.normalize()
+                    d_rect.inflate_ip(2 * data[5], 2 * data[5])
+                else:
+                    d_rect = pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1)
+
+            elif dtype == DECORATION_SURFACE or dtype == DECORATION_BASEIMAGE or dtype == DECORATION_TEXT:
+                pos, surf, centered, kwargs = data
+                if isinstance(surf, pygame_menu.BaseImage):
+                    surf = surf.get_surface(new=False)
+                pos = self._update_pos_list(rect, decoid, pos, **kwargs)[0]
+                d_rect = surf.get_rect()
+                d_rect.x += pos[0]
+                d_rect.y += pos[1]
+                if centered:
+                    d_rect.x -= int(d_rect.width / 2)
+                    d_rect.y -= int(d_rect.height / 2)
+
+            elif dtype == DECORATION_ELLIPSE:
+                pos, rx, ry, color, filled, kwargs = data
+                x, y = self._update_pos_list(rect, decoid, pos, **kwargs)[0]
+                rx, ry = math.ceil(rx), math.ceil(ry)
+                d_rect = pygame.Rect(x - rx, y - ry, 2 * rx + 1, 2 * ry + 1)
+
+            elif dtype == DECORATION_FILL:
+                d_rect = rect.copy()
+
+            elif dtype == DECORATION_RECT:
+                pos, d_rect, color, width, kwargs = data
+                pos = self._update_pos_list(rect, decoid, pos, **kwargs)[0]
+                d_rect = d_rect.move(pos[0], pos[1])
+
+            elif dtype == DECORATION_PIXEL:
+                pos = self._update_pos_list(rect, decoid, data[0], **data[-1])[0]
+                d_rect = pygame.Rect(pos[0], pos[1], 1, 1)
+
+            else:  # Unknown types raise an error on draw
+                continue
+
+            bounds.append(d_rect.inflate(4, 4))
+
+        if len(bounds) == 0:
+            return None
+        return bounds[0].unionall(bounds[1:])
 
     def draw_prev(self, surface: 'pygame.Surface') -> 'Decorator':
         """
@@ -957,16 +1040,23 @@ class Decorator(Base):
         return self
 
     # noinspection PyArgumentList
-    def _draw(self, deco: List[Tuple[int, str, Any]], surface: 'pygame.Surface') -> None:
+    def _draw(
+        self,
+        deco: List[Tuple[int, str, Any]],
+        surface: 'pygame.Surface',
+        rect: Optional['pygame.Rect'] = None
+    ) -> None:
         """
         Draw.
 
         :param deco: Decoration list
         :param surface: Pygame surface
+        :param rect: Object rect. If ``None`` uses the object rect
         """
         if len(deco) == 0:
             return
-        rect = self._obj.get_rect()
+        if rect is None:
+            rect = self._obj.get_rect()
 
         for d in deco:
             dtype, decoid, data = d
@@ -1117,6 +1207,45 @@ class Decorator(Base):
         return new_pos
 
 
+class _DecorationLayer(object):
+    """
+    Run of decorations cached on the same surface, or a callable decoration.
+
+    :param dynamic: If ``True`` the layer is a callable, which is drawn every time
+    """
+    decorations: List[Tuple[int, str, Any]]
+    dynamic: bool
+    offset: Tuple2IntType  # Position of the surface relative to the object rect
+    position_dependent: bool
+    status: Optional[Tuple[Tuple2IntType, Optional[Tuple[Tuple2IntType, Tuple2IntType]]]]
+    surface: Optional['pygame.Surface']
+
+    def __init__(self, dynamic: bool) -> None:
+        self.decorations = []
+        self.dynamic = dynamic
+        self.offset = (0, 0)
+        self.position_dependent = False
+        self.status = None
+        self.surface = None
+
+    def add(self, decoration: Tuple[int, str, Any]) -> None:
+        """
+        Adds a decoration to the layer.
+
+        :param decoration: Decoration (type, id, data)
+        """
+        self.decorations.append(decoration)
+        dtype, _, data = decoration
+        if dtype == DECORATION_BEZIER or dtype == DECORATION_TEXTURE_POLYGON or \
+                (dtype == DECORATION_ARC and not data[6]):
+            # The bezier points are rounded from their position, the texture is
+            # aligned to the surface, and the arc rect depends on its position
+            self.position_dependent = True
+        elif dtype not in (DECORATION_CALLABLE, DECORATION_CALLABLE_NO_ARGS, DECORATION_FILL, DECORATION_NONE):
+            if not data[-1].get('use_center_positioning', True):
+                self.position_dependent = True
+
+
 class _DecoratorCopyException(Exception):
     """
     If user tries to copy a Decorator.
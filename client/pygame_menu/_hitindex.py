@@ -0,0 +1,176 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+HIT INDEX
+Spatial index of the Menu widgets, used to find the widgets below the pointer.
+"""
+
+__all__ = ['WidgetHitIndex']
+
+import pygame
+import pygame_menu
+
+from pygame_menu.utils import get_finger_pos
+from pygame_menu.widgets.core.widget import WIDGET_MOUSEOVER
+
+from pygame_menu._types import Dict, List, Tuple, Tuple2IntType, EventType
+
+HIT_INDEX_CELL_SIZE = 64  # px
+
+
+# noinspection PyProtectedMember
+class WidgetHitIndex(object):
+    """
+    Grid of the widget rects of a Menu. The rects are stored in the world
+    coordinates of the widget ScrollArea (the Menu, or a scrollable Frame),
+    thus, they don't change if the areas scroll or the Menu moves. The index
+    is rebuilt after each full layout of the Menu, else, each widget updates
+    its rect when its position is set.
+
+    The index returns the widgets which may be below the pointer. The exact
+    collision must be checked against the widget real rect, which is clipped
+    by the visible area of its ScrollArea.
+
+    :param menu: Menu
+    :param cell_size: Size of the grid cells in px
+    """
+    _cell_size: int
+    _cells: Dict['pygame_menu._scrollarea.ScrollArea', Dict[Tuple2IntType, List['pygame_menu.widgets.Widget']]]
+    _hovered: List['pygame_menu.widgets.Widget']  # Widgets returned by the last query
+    _menu: 'pygame_menu.Menu'
+    _order: Dict['pygame_menu.widgets.Widget', int]  # Index of each widget within the Menu
+    _rects: Dict['pygame_menu.widgets.Widget', Tuple['pygame_menu._scrollarea.ScrollArea', 'pygame.Rect']]
+    _unindexed: List['pygame_menu.widgets.Widget']  # Widgets without ScrollArea, always returned
+    _valid: bool
+
+    def __init__(self, menu: 'pygame_menu.Menu', cell_size: int = HIT_INDEX_CELL_SIZE) -> None:
+        assert isinstance(cell_size, int) and cell_size > 0
+        self._cell_size = cell_size
+        self._cells = {}
+        self._hovered = []
+        self._menu = menu
+        self._order = {}
+        self._rects = {}
+        self._unindexed = []
+        self._valid = False
+
+    def invalidate(self) -> None:
+        """
+        Rebuild the whole index on the next query.
+        """
+        self._valid = False
+
+    def update(self, widgets: List['pygame_menu.widgets.Widget']) -> None:
+        """
+        Update the rects of the given widgets, after their position changed.
+        The widgets which are not within the Menu are ignored.
+
+        :param widgets: Widget list
+        """
+        if not self._valid:
+            return
+        for widget in widgets:
+            if widget in self._order:
+                self._remove(widget)
+                self._add(widget)
+
+    def _add(self, widget: 'pygame_menu.widgets.Widget') -> None:
+        """
+        Add a widget to the grid.
+
+        :param widget: Widget
+        """
+        scrollarea = widget.get_scrollarea()
+        if scrollarea is None:
+            self._unindexed.append(widget)
+            return
+        rect = widget.get_rect()
+        if rect.width == 0 or rect.height == 0:  # Cannot collide
+            return
+
+        # The real rect is truncated from the world rect, +-1px covers the rounding
+        rect.inflate_ip(2, 2)
+        self._rects[widget] = (scrollarea, rect)
+        cells = self._cells.setdefault(scrollarea, {})
+        size = self._cell_size
+        for i in range(rect.left // size, (rect.right - 1) // size + 1):
+            for j in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                cells.setdefault((i, j), []).append(widget)
+
+    def _remove(self, widget: 'pygame_menu.widgets.Widget') -> None:
+        """
+        Remove a widget from the grid.
+
+        :param widget: Widget
+        """
+        if widget in self._unindexed:
+            self._unindexed.remove(widget)
+        if widget not in self._rects:
+            return
+        scrollarea, rect = self._rects.pop(widget)
+        cells = self._cells[scrollarea]
+        size = self._cell_size
+        for i in range(rect.left // size, (rect.right - 1) // size + 1):
+            for j in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                cells[i, j].remove(widget)
+                if len(cells[i, j]) == 0:
+                    del cells[i, j]
+
+    def _build(self, widgets: List['pygame_menu.widgets.Widget']) -> None:
+        """
+        Build the index from the Menu widgets.
+
+        :param widgets: Menu widget list
+        """
+        self._cells = {}
+        self._order = {}
+        self._rects = {}
+        self._unindexed = []
+        for index in range(len(widgets)):
+            self._order[widgets[index]] = index
+            self._add(widgets[index])
+        self._valid = True
+
+    def get_indices(
+        self,
+        widgets: List['pygame_menu.widgets.Widget'],
+        event: EventType,
+        changed: Dict['pygame_menu.widgets.Widget', None]
+    ) -> List[int]:
+        """
+        Return the indices of the widgets which may collide the pointer event
+        (mouse or finger), in the Menu order. The widgets which are mouseover
+        are also returned, as they may need to call their mouseleave.
+
+        :param widgets: Menu widget list
+        :param event: Pointer event
+        :param changed: Widgets whose rect may have changed since it was indexed, always returned
+        :return: Widget indices
+        """
+        if not self._valid or len(self._order) != len(widgets):
+            self._build(widgets)
+        x, y = get_finger_pos(self._menu, event)
+        offset = self._menu.get_last_surface_offset()
+        size = self._cell_size
+
+        found: Dict['pygame_menu.widgets.Widget', None] = {}
+        for scrollarea, cells in self._cells.items():
+            wx, wy = scrollarea.to_world_position((x - offset[0], y - offset[1]))
+            for widget in cells.get((wx // size, wy // size), ()):
+                if self._rects[widget][1].collidepoint(wx, wy):
+                    found[widget] = None
+        for widget in self._unindexed:
+            found[widget] = None
+        for widget in changed.keys():
+            found[widget] = None
+        for widget in self._hovered:
+            if widget._mouseover:
+                found[widget] = None
+        prev = WIDGET_MOUSEOVER[1]  # [widget, cursor, [widget, cursor, [...]]]
+        while len(prev) == 3:
+            found[prev[0]] = None
+            prev = prev[2]
+
+        self._hovered = list(found.keys())
+        return sorted(self._order[widget] for widget in self._hovered if widget in self._order)
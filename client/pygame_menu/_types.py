@@ -12,7 +12,7 @@ from pygame.event import Event as EventType
 from typing import Union, List, Tuple, Any, Callable, Sequence, Mapping, Optional
 
 # noinspection PyUnresolvedReferences
-from typing import Dict, Type
+from typing import Dict, Type, Iterator
 
 # noinspection PyUnresolvedReferences
 from typing_extensions import Literal
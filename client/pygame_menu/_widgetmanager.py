@@ -36,6 +36,7 @@ from pygame_menu.widgets.widget.table import TableManager
 from pygame_menu.widgets.widget.textinput import TextInputManager
 from pygame_menu.widgets.widget.toggleswitch import ToggleSwitchManager
 from pygame_menu.widgets.widget.vfill import VFillManager
+from pygame_menu.widgets.widget.virtualtable import VirtualTableManager
 from pygame_menu.widgets.widget.vmargin import VMarginManager
 
 from pygame_menu._types import Any, Dict, PaddingInstance
@@ -62,6 +63,7 @@ class WidgetManager(
     TextInputManager,
     ToggleSwitchManager,
     VFillManager,
+    VirtualTableManager,
     VMarginManager
 ):
     """
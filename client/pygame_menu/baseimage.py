@@ -32,14 +32,22 @@ __all__ = [
 
 ]
 
+from collections import OrderedDict
 from io import BytesIO
 from pathlib import Path
 import base64
+import hashlib
 import math
 import os.path as path
 
 import pygame
 
+try:  # numpy is optional, without it the pixel functions iterate over each pixel
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
 from pygame_menu._base import Base
 from pygame_menu.locals import POSITION_NORTHWEST, POSITION_NORTHEAST, POSITION_CENTER, \
     POSITION_WEST, POSITION_SOUTHWEST, POSITION_EAST, POSITION_SOUTHEAST, \
@@ -49,7 +57,7 @@ from pygame_menu.utils import assert_vector, assert_position, assert_color, \
 
 from pygame_menu._types import Tuple2IntType, Union, Vector2NumberType, Callable, \
     Tuple, List, NumberType, Optional, Dict, Tuple4IntType, Literal, Tuple2NumberType, \
-    ColorInputType, Tuple3IntType, NumberInstance, VectorInstance
+    ColorInputType, Tuple3IntType, NumberInstance, VectorInstance, Any
 
 # Example image paths
 __images_path__ = path.join(path.dirname(path.abspath(__file__)), 'resources', 'images', '{0}')
@@ -82,11 +90,72 @@ _VALID_IMAGE_FORMATS = ['.jpg', '.png', '.gif', '.bmp', '.pcx', '.tga', '.tif',
                         '.lbm', '.pbm', '.pgm', '.ppm', '.xpm', '.svg', 'BytesIO',
                         'base64']
 
+# Transform cache
+_TRANSFORMS_PER_IMAGE = 4  # Scaled/tiled surfaces kept by each image
+_TRANSFORMS_MAX_BYTES = 64 * 1024 * 1024  # Memory of the shared scaled surfaces
+
 # Custom types
 ColorChannelType = Literal['r', 'g', 'b']
 ChannelType = Union[ColorChannelType, Tuple[ColorChannelType, ColorChannelType], Tuple[ColorChannelType, ColorChannelType, ColorChannelType], List[ColorChannelType]]
 
 
+class _SurfaceCache(object):
+    """
+    LRU cache of surfaces, bounded by the number of surfaces and their memory.
+
+    :param max_surfaces: Maximum number of surfaces
+    :param max_bytes: Maximum memory used by the surfaces in bytes
+    """
+    bytes: int
+    max_bytes: int
+    max_surfaces: int
+
+    def __init__(self, max_surfaces: int, max_bytes: int) -> None:
+        self.bytes = 0
+        self.max_bytes = max_bytes
+        self.max_surfaces = max_surfaces
+        self._surfaces: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional['pygame.Surface']:
+        """
+        Return a surface, ``None`` if it is not in the cache.
+
+        :param key: Surface key
+        :return: Surface
+        """
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)  # Most recently used
+        return surface
+
+    def put(self, key: Tuple, surface: 'pygame.Surface') -> 'pygame.Surface':
+        """
+        Store a surface, dropping the least recently used ones if the cache is full.
+
+        :param key: Surface key
+        :param surface: Surface
+        :return: The same surface
+        """
+        self._surfaces[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while len(self._surfaces) > 1 and (
+                len(self._surfaces) > self.max_surfaces or self.bytes > self.max_bytes):
+            _, evicted = self._surfaces.popitem(last=False)  # Least recently used
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+        return surface
+
+    def clear(self) -> None:
+        """
+        Drop every surface.
+        """
+        self._surfaces.clear()
+        self.bytes = 0
+
+
+# Scaled surfaces shared by the images of the same content, see BaseImage.share_transforms
+_shared_transforms = _SurfaceCache(max_surfaces=1024, max_bytes=_TRANSFORMS_MAX_BYTES)
+
+
 class BaseImage(Base):
     """
     Object that loads an image, stores as a surface, transform it and
@@ -101,6 +170,7 @@ class BaseImage(Base):
     :param image_id: str
     """
     _angle: NumberType
+    _content_hash: Optional[bytes]
     _drawing_mode: int
     _drawing_offset: Tuple2IntType
     _drawing_position: str
@@ -108,10 +178,12 @@ class BaseImage(Base):
     _filename: str
     _filepath: Union[str, 'BytesIO']
     _frombase64: bool
-    _last_transform: Tuple[int, int, Optional['pygame.Surface']]
     _original_surface: 'pygame.Surface'
     _rotated: bool
     _surface: 'pygame.Surface'
+    _transforms: '_SurfaceCache'
+    _transforms_source: Optional['pygame.Surface']
+    share_transforms: bool
     smooth_scaling: bool
 
     def __init__(
@@ -180,8 +252,11 @@ class BaseImage(Base):
 
         # Other internals
         self._angle = 0
-        self._last_transform = (0, 0, None)  # Improves drawing
+        self._content_hash = None
         self._rotated = False
+        self._transforms = _SurfaceCache(max_surfaces=_TRANSFORMS_PER_IMAGE, max_bytes=_TRANSFORMS_MAX_BYTES)
+        self._transforms_source = None  # Surface the transforms were made from
+        self.share_transforms = False  # Shares the scaled surfaces with the images of the same content
         self.smooth_scaling = True  # Uses smooth scaling by default in draw() method
 
     def __copy__(self) -> 'BaseImage':
@@ -319,6 +394,10 @@ class BaseImage(Base):
         image._angle = self._angle
         image._surface = self._surface.copy()
         image._original_surface = self._surface.copy()
+        if self.share_transforms:
+            image._content_hash = self._get_content_hash()  # Same pixels, thus same hash
+            image._transforms_source = image._surface
+        image.share_transforms = self.share_transforms
         image.smooth_scaling = self.smooth_scaling
         if self._attributes is not None:
             for k in self._attributes.keys():
@@ -460,6 +539,7 @@ class BaseImage(Base):
         """
         assert_vector(pos, 2)
         self._surface.set_at(pos, assert_color(color))
+        self._clear_transforms()
         return self
 
     def get_bitsize(self) -> int:
@@ -527,6 +607,79 @@ class BaseImage(Base):
         self._original_surface = self._surface.copy()
         return self
 
+    def get_pixels(self) -> Any:
+        """
+        Return a copy of the pixels of the image as a :py:class:`numpy.ndarray`
+        of shape ``(height, width, 4)`` (red, green, blue, alpha). If the image
+        has no per pixel alpha, the alpha value is always ``255``.
+
+        .. note::
+
+            Requires numpy.
+
+        :return: Pixels array
+        """
+        assert numpy is not None, 'numpy is required to get the pixels of the image'
+        w, h = self._surface.get_size()
+        return numpy.frombuffer(pygame.image.tostring(self._surface, 'RGBA'), numpy.uint8).reshape((h, w, 4)).copy()
+
+    def set_pixels(self, pixels: Any) -> 'BaseImage':
+        """
+        Set the pixels of the image from an array of shape ``(height, width, 4)``
+        (red, green, blue, alpha), as returned by
+        :py:meth:`pygame_menu.baseimage.BaseImage.get_pixels`. The values are
+        clamped between ``0`` and ``255``. The alpha is discarded if the image
+        has no per pixel alpha.
+
+        .. note::
+
+            Requires numpy.
+
+        :param pixels: Pixels array
+        :return: Self reference
+        """
+        assert numpy is not None, 'numpy is required to set the pixels of the image'
+        w, h = self._surface.get_size()
+        pixels = numpy.asarray(pixels)
+        assert pixels.shape == (h, w, 4), \
+            f'pixels shape must be {(h, w, 4)} (height, width, channels)'
+        if pixels.dtype != numpy.uint8:
+            pixels = numpy.clip(pixels, 0, 255).astype(numpy.uint8)
+        pixels = pixels.transpose((1, 0, 2))  # surfarray arrays are indexed (x, y)
+        if self._surface.get_bitsize() in (24, 32):
+            rgb = pygame.surfarray.pixels3d(self._surface)
+            rgb[...] = pixels[:, :, :3]
+            del rgb  # Unlock the surface
+            if self._surface.get_flags() & pygame.SRCALPHA:
+                alpha = pygame.surfarray.pixels_alpha(self._surface)
+                alpha[...] = pixels[:, :, 3]
+                del alpha
+        else:  # Maps the colors to the surface format, like set_at
+            pygame.surfarray.blit_array(
+                self._surface, pygame.surfarray.map_array(self._surface, pixels[:, :, :3]))
+        self._clear_transforms()
+        return self
+
+    def apply_pixels_function(self, pixels_function: Callable[[Any], Any]) -> 'BaseImage':
+        """
+        Apply a function to all the pixels of the image at once. The function
+        receives the pixels as an integer :py:class:`numpy.ndarray` of shape
+        ``(height, width, 4)`` (red, green, blue, alpha), and must return an
+        array of the same shape, clamped between ``0`` and ``255``.
+
+        For example, ``apply_pixels_function(lambda p: p * (1, 0.5, 0.5, 1))``
+        tints the image in red.
+
+        .. note::
+
+            Requires numpy. Much faster than
+            :py:meth:`pygame_menu.baseimage.BaseImage.apply_image_function`.
+
+        :param pixels_function: Pixels function, takes the array as ``pixels_function=myfunc(pixels)``. Returns the new array
+        :return: Self reference
+        """
+        return self.set_pixels(pixels_function(self.get_pixels().astype(numpy.int32)))
+
     def apply_image_function(
         self,
         image_function: Callable[[int, int, int, int], Tuple4IntType]
@@ -538,8 +691,9 @@ class BaseImage(Base):
 
         .. note::
 
-            See :py:meth:`pygame_menu.baseimage.BaseImage.to_bw` method as an
-            example.
+            This function is slow for large images, as it calls the function for
+            each pixel. If numpy is available, prefer
+            :py:meth:`pygame_menu.baseimage.BaseImage.apply_pixels_function`.
 
         :param image_function: Color function, takes colors as ``image_function=myfunc(r,g,b,a)``. Returns the same tuple (r, g, b, a)
         :return: Self reference
@@ -554,7 +708,8 @@ class BaseImage(Base):
                 b = int(max(0, min(b, 255)))
                 a = int(max(0, min(a, 255)))
                 # noinspection PyArgumentList
-                self.set_at((x, y), pygame.Color(r, g, b, a))
+                self._surface.set_at((x, y), pygame.Color(r, g, b, a))
+        self._clear_transforms()
         return self
 
     def to_bw(self) -> 'BaseImage':
@@ -563,10 +718,15 @@ class BaseImage(Base):
 
         .. note::
 
-            This function is slow for large images.
+            This function is slow for large images if numpy is not available.
 
         :return: Self reference
         """
+        if numpy is not None:
+            pixels = self.get_pixels()
+            c = (pixels[:, :, 0].astype(numpy.uint16) + pixels[:, :, 1] + pixels[:, :, 2]) // 3
+            pixels[:, :, :3] = c[:, :, numpy.newaxis]
+            return self.set_pixels(pixels)
 
         def bw(r: int, g: int, b: int, a: int) -> Tuple4IntType:
             """
@@ -594,6 +754,13 @@ class BaseImage(Base):
         assert isinstance(channels, VectorInstance)
         assert 1 <= len(channels) <= 3, 'maximum size of channels can be 3'
 
+        if numpy is not None:
+            pixels = self.get_pixels()
+            for i, channel in enumerate(('r', 'g', 'b')):
+                if channel not in channels:
+                    pixels[:, :, i] = 0
+            return self.set_pixels(pixels)
+
         w, h = self._surface.get_size()
         for x in range(w):
             for y in range(h):
@@ -606,6 +773,7 @@ class BaseImage(Base):
                     b = 0
                 # noinspection PyArgumentList
                 self._surface.set_at((x, y), pygame.Color(r, g, b, a))
+        self._clear_transforms()
         return self
 
     def flip(self, x: bool, y: bool) -> 'BaseImage':
@@ -793,6 +961,100 @@ class BaseImage(Base):
         else:
             raise ValueError('unknown drawing position')
 
+    def _clear_transforms(self) -> None:
+        """
+        Drop the scaled and tiled surfaces, after the image surface changed.
+        """
+        self._content_hash = None
+        self._transforms.clear()
+        self._transforms_source = None
+
+    def _check_transforms(self) -> None:
+        """
+        Drop the scaled and tiled surfaces if the image surface has been replaced
+        (by a transformation, crop, restore, etc.).
+        """
+        if self._transforms_source is not self._surface:
+            self._clear_transforms()
+            self._transforms_source = self._surface
+
+    def _get_content_hash(self) -> bytes:
+        """
+        Return the hash of the pixels of the image, computed once per surface.
+
+        :return: Hash
+        """
+        self._check_transforms()
+        if self._content_hash is None:
+            self._content_hash = hashlib.blake2b(
+                pygame.image.tostring(self._surface, 'RGBA'), digest_size=16).digest()
+        return self._content_hash
+
+    def _get_scaled(self, width: int, height: int) -> 'pygame.Surface':
+        """
+        Return the image scaled to the given size, from the cache if possible.
+
+        :param width: Width in px
+        :param height: Height in px
+        :return: Scaled surface. It is shared, do not modify it
+        """
+        self._check_transforms()
+        smooth = self.smooth_scaling and self._surface.get_bitsize() > 8
+        key = (width, height, smooth)
+        surf = self._transforms.get(key)
+        if surf is not None:
+            return surf
+
+        shared_key = None
+        if self.share_transforms:
+            shared_key = (self._get_content_hash(), self._surface.get_size(), self._surface.get_bitsize(),
+                          self._surface.get_flags() & pygame.SRCALPHA, width, height, smooth)
+            surf = _shared_transforms.get(shared_key)
+
+        if surf is None:  # Transform scale
+            if smooth:
+                surf = pygame.transform.smoothscale(self._surface, (width, height))
+            else:
+                surf = pygame.transform.scale(self._surface, (width, height))
+            if shared_key is not None:
+                _shared_transforms.put(shared_key, surf)
+        return self._transforms.put(key, surf)
+
+    def _get_tiled(self, timesx: int, timesy: int, area: 'pygame.Rect') -> 'pygame.Surface':
+        """
+        Return the image repeated on x-axis and y-axis, from the cache if possible.
+
+        :param timesx: Repetitions on x-axis
+        :param timesy: Repetitions on y-axis
+        :param area: Area of the image drawn by each repetition
+        :return: Tiled surface, ``None`` if the image has a surface alpha (it blends otherwise). It is shared, do not modify it
+        """
+        if self._surface.get_alpha() not in (None, 255):
+            return None
+        self._check_transforms()
+        key = ('tiled', area.x, area.y, area.width, area.height)
+        surf = self._transforms.get(key)
+        if surf is not None:
+            return surf
+        w, h = self._surface.get_size()
+        colorkey = self._surface.get_colorkey()
+        flags = 0
+        if self._surface.get_masks()[3]:  # Per pixel alpha
+            surf = pygame.Surface((timesx * w, timesy * h), pygame.SRCALPHA, 32)
+            flags = pygame.BLEND_RGBA_MAX  # Max over the transparent surface copies the pixels without blending
+        elif colorkey is not None:  # The colorkey pixels and the gaps between the tiles stay transparent
+            surf = pygame.Surface((timesx * w, timesy * h))
+            surf.fill(colorkey)
+            surf.set_colorkey(colorkey)
+        elif area.contains(self._surface.get_rect()):  # Opaque, drawn faster
+            surf = pygame.Surface((timesx * w, timesy * h))
+        else:  # The area crops the tiles, the gaps stay transparent
+            surf = pygame.Surface((timesx * w, timesy * h), pygame.SRCALPHA, 32)
+        for x in range(timesx):
+            for y in range(timesy):
+                surf.blit(self._surface, (x * w, y * h), area, special_flags=flags)
+        return self._transforms.put(key, surf)
+
     def draw(
         self,
         surface: 'pygame.Surface',
@@ -824,20 +1086,7 @@ class BaseImage(Base):
         offy = self._drawing_offset[1] - py
 
         if self._drawing_mode == IMAGE_MODE_FILL:
-            # Check if exists the transformed surface
-            if (
-                area.width == self._last_transform[0] and
-                area.height == self._last_transform[1] and
-                self._last_transform[2] is not None
-            ):
-                surf = self._last_transform[2]
-            else:  # Transform scale
-                if self.smooth_scaling and self._surface.get_bitsize() > 8:
-                    surf = pygame.transform.smoothscale(self._surface, (area.width, area.height))
-                else:
-                    surf = pygame.transform.scale(self._surface, (area.width, area.height))
-                self._last_transform = (area.width, area.height, surf)
-
+            surf = self._get_scaled(area.width, area.height)
             surface.blit(
                 surf,
                 (
@@ -881,16 +1130,26 @@ class BaseImage(Base):
             timesy = int(math.ceil(float(area.height) / h))
             assert timesx > 0 and timesy > 0, \
                 'invalid size, width and height must be greater than zero'
-            for x in range(timesx):
-                for y in range(timesy):
-                    surface.blit(
-                        self._surface,
-                        (
-                            x * w + offx + position[0],
-                            y * h + offy + position[1]
-                        ),
-                        area
+            tiled = self._get_tiled(timesx, timesy, area)
+            if tiled is not None:
+                surface.blit(
+                    tiled,
+                    (
+                        offx + position[0],
+                        offy + position[1]
                     )
+                )
+            else:
+                for x in range(timesx):
+                    for y in range(timesy):
+                        surface.blit(
+                            self._surface,
+                            (
+                                x * w + offx + position[0],
+                                y * h + offy + position[1]
+                            ),
+                            area
+                        )
 
         elif self._drawing_mode == IMAGE_MODE_CENTER:
             sw, hw = area.width, area.height  # Window
@@ -42,6 +42,7 @@ __all__ = [
     'MENU_LAST_SELECTED_WIDGET_BUTTON_UP',
     'MENU_LAST_SELECTED_WIDGET_EVENT',
     'MENU_LAST_SELECTED_WIDGET_FINGER_UP',
+    'MENU_LAST_UPDATE_WIDGETS',
     'MENU_LAST_WIDGET_DISABLE_ACTIVE_STATE',
     'MENU_LAST_WIDGET_SELECT',
     'MENU_LAST_WIDGET_SELECT_MOTION',
@@ -120,6 +121,7 @@ MENU_LAST_SCROLL_AREA = 'SCROLL_AREA'
 MENU_LAST_SELECTED_WIDGET_BUTTON_UP = 'SELECTED_WIDGET_BUTTON_UP'
 MENU_LAST_SELECTED_WIDGET_EVENT = 'SELECTED_WIDGET_EVENT'
 MENU_LAST_SELECTED_WIDGET_FINGER_UP = 'SELECTED_WIDGET_FINGER_UP'
+MENU_LAST_UPDATE_WIDGETS = 'UPDATE_WIDGETS'
 MENU_LAST_WIDGET_DISABLE_ACTIVE_STATE = 'WIDGET_DISABLE_ACTIVE_STATE'
 MENU_LAST_WIDGET_SELECT = 'WIDGET_SELECT'
 MENU_LAST_WIDGET_SELECT_MOTION = 'WIDGET_SELECT_MOTION'
@@ -32,16 +32,26 @@ __all__ = [
     'FontType',
     'FontInstance',
 
+    # Text cache
+    'TextCache',
+    'text_cache',
+
     # Utils
     'assert_font',
-    'get_font'
+    'get_font',
+    'preload_fonts'
 
 ]
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union, Optional, Any, Dict, Tuple
+from typing import Union, Optional, Any, Dict, Sequence, Tuple
+import json
+import os
 import os.path as path
+import threading
 
+import pygame
 import pygame.font as __font
 
 # Available fonts path
@@ -74,8 +84,129 @@ FONT_EXAMPLES = (FONT_8BIT, FONT_BEBAS, FONT_COMIC_NEUE, FONT_DIGITAL, FONT_FRAN
 FontType = Union[str, __font.Font, Path]
 FontInstance = (str, __font.Font, Path)
 
-# Stores font cache
-_cache: Dict[Tuple[FontType, int], '__font.Font'] = {}
+# Stores font cache, by name (or path) and size
+_cache: Dict[Tuple[str, int], '__font.Font'] = {}
+
+# Stores the path of the system fonts, by name
+_paths: Dict[str, str] = {}
+_paths_loaded = False
+_paths_lock = threading.Lock()
+
+
+class TextCache(object):
+    """
+    Memory-bounded LRU cache of rendered texts, shared by the widgets. A text
+    is rendered the first time it is requested, then reused while it stays in
+    the cache; the least recently used texts are dropped once the surfaces
+    use more than ``max_bytes``.
+
+    The key is the font object (thus its file and size), the text, the color,
+    the antialias, the background color and the shadow.
+
+    .. note::
+
+        The returned surfaces are shared by every user of the text, thus, these
+        must not be modified (blit them, or copy them first).
+
+    :param max_bytes: Maximum memory used by the rendered texts in bytes
+    """
+    bytes: int
+    evictions: int
+    hits: int
+    max_bytes: int
+    misses: int
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        assert isinstance(max_bytes, int) and max_bytes > 0
+        self.bytes = 0
+        self.evictions = 0
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.misses = 0
+        self._surfaces: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+
+    def render(
+        self,
+        font: '__font.Font',
+        text: str,
+        color: Any,
+        antialias: bool = True,
+        background_color: Any = None,
+        shadow_color: Any = None,
+        shadow_offset: Tuple[int, int] = (0, 0),
+        alpha: bool = False
+    ) -> 'pygame.Surface':
+        """
+        Return the surface of a text, rendering it if it is not in the cache.
+
+        :param font: Font object
+        :param text: Text to render
+        :param color: Text color
+        :param antialias: Render with antialiasing
+        :param background_color: Background color of the text. ``None`` for transparent
+        :param shadow_color: Color of the text shadow, drawn below the text. ``None`` for no shadow
+        :param shadow_offset: Position of the shadow relative to the text in px
+        :param alpha: If ``True`` the text is drawn on a surface with alpha channel (always the case with a shadow)
+        :return: Text surface. It is shared, do not modify it
+        """
+        color = tuple(color)
+        if background_color is not None:
+            background_color = tuple(background_color)
+        if shadow_color is not None:
+            shadow_color = tuple(shadow_color)
+            shadow_offset = tuple(shadow_offset)
+            alpha = True
+        else:
+            shadow_offset = None
+        key = (font, text, color, antialias, background_color, shadow_color, shadow_offset, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)  # Most recently used
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if alpha:
+            from pygame_menu.utils import make_surface
+            text_surface = self.render(font, text, color, antialias, background_color)
+            surface = make_surface(text_surface.get_width(), text_surface.get_height(), alpha=True)
+            if shadow_color is not None:
+                surface.blit(self.render(font, text, shadow_color, antialias, background_color), shadow_offset)
+            surface.blit(text_surface, (0, 0))
+        else:
+            surface = font.render(text, antialias, color, background_color)
+        self._surfaces[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)  # Least recently used
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the usage metrics of the cache.
+
+        :return: Number of texts, memory used in bytes, hits, misses and evictions
+        """
+        return {
+            'texts': len(self._surfaces),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def clear(self) -> None:
+        """
+        Drop every rendered text (for example, after the display mode changes).
+        """
+        self._surfaces.clear()
+        self.bytes = 0
+
+
+# Text cache shared by the widgets
+text_cache = TextCache()
 
 
 def assert_font(font: Any) -> None:
@@ -88,6 +219,135 @@ def assert_font(font: Any) -> None:
         'value must be a font type (str, Path, pygame.Font)'
 
 
+def _unknown_font_message(font_name: str) -> str:
+    """
+    Return the error message of an unknown system font, with the most similar
+    system font and some examples.
+
+    :param font_name: Font name
+    :return: Message
+    """
+    from difflib import get_close_matches
+    from random import sample
+    system_fonts = __font.get_fonts()
+    if len(system_fonts) == 0:
+        return f'system font "{font_name}" unknown, no system font is available on this platform'
+    most_similar = get_close_matches(font_name, system_fonts, n=1, cutoff=0)
+    sys_suggestion = f'system font "{font_name}" unknown, use "{most_similar[0]}" instead'
+    sys_message = 'check system fonts with pygame.font.get_fonts() function'
+    fonts_random = ', '.join(sorted(sample(system_fonts, min(3, len(system_fonts)))))
+    sys_message_2 = f'some examples: {fonts_random}'
+    return f'{sys_suggestion}\n{sys_message}\n{sys_message_2}'
+
+
+def _get_paths_file() -> Optional[str]:
+    """
+    Return the file which stores the path of the system fonts across runs. It
+    can be set with the ``PYGAME_MENU_FONT_CACHE`` environment variable, an
+    empty value disables it.
+
+    :return: File path, ``None`` if disabled
+    """
+    filename = os.environ.get('PYGAME_MENU_FONT_CACHE')
+    if filename is None:
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or path.join(path.expanduser('~'), '.cache')
+        filename = path.join(cache_dir, 'pygame_menu', 'fonts.json')
+    return filename or None
+
+
+def _load_paths() -> None:
+    """
+    Load the path of the system fonts resolved by the previous runs.
+    """
+    global _paths_loaded
+    if _paths_loaded:
+        return
+    _paths_loaded = True
+    filename = _get_paths_file()
+    if filename is None:
+        return
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            paths = json.load(f)
+        for font_name, font_path in paths.items():
+            if isinstance(font_name, str) and isinstance(font_path, str):
+                _paths.setdefault(font_name, font_path)
+    except (OSError, ValueError, AttributeError):
+        pass  # No file yet (or a broken one), the fonts are resolved again
+
+
+def _save_paths() -> None:
+    """
+    Save the path of the system fonts, for the next runs.
+    """
+    filename = _get_paths_file()
+    if filename is None:
+        return
+    try:
+        os.makedirs(path.dirname(filename), exist_ok=True)
+        with open(filename + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(_paths, f)
+        os.replace(filename + '.tmp', filename)  # Other processes never read a partial file
+    except OSError:
+        pass
+
+
+def _get_font_path(name: str) -> str:
+    """
+    Return the path of a font file, or of a system font from its name.
+
+    The path of the system fonts is cached in memory and on disk, thus, the
+    scan of the system fonts (fontconfig on Linux) runs only the first time a
+    name is used, across runs.
+
+    :param name: Font name or path
+    :return: Font path
+    """
+    if path.isfile(name):
+        return name
+    with _paths_lock:
+        _load_paths()
+        font_path = _paths.get(name)
+        if font_path is not None and path.isfile(font_path):
+            return font_path
+        font_path = __font.match_font(name)
+        if font_path is None:
+            raise ValueError(_unknown_font_message(name))
+        _paths[name] = font_path
+        _save_paths()
+    return font_path
+
+
+def preload_fonts(names: Sequence[FontType]) -> 'threading.Thread':
+    """
+    Resolve the path of the given system fonts in a background thread, thus,
+    the menus created later do not wait for the scan of the system fonts.
+    Unknown fonts are ignored (:py:meth:`pygame_menu.font.get_font` raises the
+    error when these are used).
+
+    .. note::
+
+        Only the paths are resolved, the font objects are created by
+        :py:meth:`pygame_menu.font.get_font` on the thread which uses them, as
+        SDL_ttf is not thread-safe.
+
+    :param names: Font names or paths
+    :return: Thread, already started
+    """
+    names = [str(name) for name in names if not isinstance(name, __font.Font)]
+
+    def resolve() -> None:
+        for name in names:
+            try:
+                _get_font_path(name)
+            except ValueError:
+                pass
+
+    thread = threading.Thread(target=resolve, name='pygame_menu.font.preload_fonts', daemon=True)
+    thread.start()
+    return thread
+
+
 def get_font(name: FontType, size: int) -> '__font.Font':
     """
     Return a :py:class:`pygame.font.Font` object from a name or file.
@@ -99,72 +359,28 @@ def get_font(name: FontType, size: int) -> '__font.Font':
     assert_font(name)
     assert isinstance(size, int)
 
-    font: Optional['__font.Font']
     if isinstance(name, __font.Font):
-        font = name
+        return name
+
+    name = str(name)
+    font: Optional['__font.Font'] = _cache.get((name, size))
+    if font is not None:
         return font
 
-    else:
-        name = str(name)
-
-        if name == '':
-            raise ValueError('font name cannot be empty')
-
-        if size <= 0:
-            raise ValueError('font size cannot be lower or equal than zero')
-
-        # Font is not a file, then use a system font
-        if not path.isfile(name):
-            font_name = name
-            name = __font.match_font(font_name)
-
-            if name is None:  # Show system available fonts
-                from difflib import SequenceMatcher
-                from random import randrange
-                system_fonts = __font.get_fonts()
-
-                # Get the most similar example
-                most_similar = 0
-                most_similar_index = 0
-                for i in range(len(system_fonts)):
-                    # noinspection PyArgumentEqualDefault
-                    sim = SequenceMatcher(None, system_fonts[i], font_name).ratio()
-                    if sim > most_similar:
-                        most_similar = sim
-                        most_similar_index = i
-                sys_font_sim = system_fonts[most_similar_index]
-                sys_suggestion = f'system font "{font_name}" unknown, use "{sys_font_sim}" instead'
-                sys_message = 'check system fonts with pygame.font.get_fonts() function'
-
-                # Get examples
-                examples_number = 3
-                examples = []
-                j = 0
-                for i in range(len(system_fonts)):
-                    font_random = system_fonts[randrange(0, len(system_fonts))]
-                    if font_random not in examples:
-                        examples.append(font_random)
-                        j += 1
-                    if j >= examples_number:
-                        break
-                examples.sort()
-                fonts_random = ', '.join(examples)
-                sys_message_2 = f'some examples: {fonts_random}'
-
-                # Raise the exception
-                raise ValueError(f'{sys_suggestion}\n{sys_message}\n{sys_message_2}')
-
-        # Try to load the font
-        font = None
-        if (name, size) in _cache:
-            return _cache[(name, size)]
+    if name == '':
+        raise ValueError('font name cannot be empty')
+
+    if size <= 0:
+        raise ValueError('font size cannot be lower or equal than zero')
+
+    # Try to load the font, system fonts are found from their name
+    font_path = _get_font_path(name)
+    font = _cache.get((font_path, size))
+    if font is None:
         try:
-            font = __font.Font(name, size)
+            font = __font.Font(font_path, size)
         except IOError:
-            pass
-
-        # If font was not loaded throw an exception
-        if font is None:
-            raise IOError(f'font file "{font}" cannot be loaded')
-        _cache[(name, size)] = font
-        return font
+            raise IOError(f'font file "{font_path}" cannot be loaded')
+        _cache[(font_path, size)] = font
+    _cache[(name, size)] = font
+    return font
@@ -14,12 +14,15 @@ import os
 import sys
 import time
 
+from contextlib import contextmanager
+
 import pygame
 import pygame.gfxdraw as gfxdraw
 import pygame_menu.events as _events
 
 from pygame_menu._base import Base
 from pygame_menu._decorator import Decorator
+from pygame_menu._hitindex import WidgetHitIndex
 from pygame_menu._widgetmanager import WidgetManager
 from pygame_menu.controls import Controller
 from pygame_menu.locals import ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT, \
@@ -38,7 +41,7 @@ from pygame_menu._types import Callable, Any, Dict, NumberType, VectorType, \
     Vector2NumberType, Union, Tuple, List, Vector2IntType, Vector2BoolType, \
     Tuple4Tuple2IntType, Tuple2IntType, MenuColumnMaxWidthType, MenuColumnMinWidthType, \
     MenuRowsType, Optional, Tuple2BoolType, NumberInstance, VectorInstance, EventType, \
-    EventVectorType, EventListType, CallableNoArgsType
+    EventVectorType, EventListType, CallableNoArgsType, Iterator
 
 # Joy events
 JOY_EVENT_LEFT = 1
@@ -121,6 +124,7 @@ class Menu(Base):
     _disable_update: bool
     _enabled: bool
     _height: int
+    _hit_index: 'WidgetHitIndex'  # Widget rects, used to test the pointer events
     _index: int
     _joy_event: int
     _joy_event_repeat: int
@@ -130,6 +134,15 @@ class Menu(Base):
     _last_scroll_thickness: List[Union[Tuple2IntType, int]]
     _last_selected_type: str
     _last_update_mode: List[str]
+    _layout_batch: int  # Depth of the batch_update blocks, the layout is delayed until the exit
+    _layout_column_raw_widths: List[NumberType]  # Column widths before scaling
+    _layout_column_width: Dict['Widget', NumberType]  # Width of the widgets which define their column width
+    _layout_dirty: Dict['Widget', None]  # Widgets changed since the last layout
+    _layout_extent: Dict['Widget', Tuple[NumberType, NumberType, NumberType, NumberType]]  # Max x/y, min x/y
+    _layout_frame_position: Dict['Frame', Tuple2IntType]  # Scrollarea position used to place the widgets of each scrollable frame
+    _layout_signature: Optional[Tuple[Any, ...]]  # Menu values of the last layout, None if it must be computed
+    _layout_size: Dict['Widget', Tuple2IntType]  # Size of each widget at the last layout
+    _layout_structure: Dict['Widget', Tuple[Any, ...]]  # Column, row, frame, etc. of each widget
     _mainloop: bool
     _max_row_column_elements: int
     _menubar: 'MenuBar'
@@ -178,6 +191,10 @@ class Menu(Base):
     _widget_surface_cache_enabled: bool
     _widget_surface_cache_need_update: bool
     _widgets: List['Widget']
+    _widgets_damaged: List['pygame.Rect']  # Rects changed by the last draw, in surface coordinates
+    _widgets_damaged_state: Tuple[Any, ...]  # Menu state of the last draw (offsets, position, ...)
+    _widgets_dirty: Dict['Widget', None]  # Widgets to redraw, without updating the whole surface
+    _widgets_extent: Optional[List[Tuple['Widget', Optional['pygame.Rect']]]]  # Drawn area of the non-framed widgets
     _widgets_surface: Optional['pygame.Surface']
     _widgets_surface_last: Tuple[int, int, Optional['pygame.Surface']]
     _widgets_surface_need_update: bool
@@ -432,6 +449,14 @@ class Menu(Base):
         # thus, the state only is used once
         self._widget_surface_cache_need_update = True
 
+        # Widgets which changed without changing the layout. Only their area is
+        # redrawn on the cached surface (instead of all the widgets), and the
+        # changed rects are stored to be used within pygame.display.update(rects)
+        self._widgets_damaged = []
+        self._widgets_damaged_state = ()
+        self._widgets_dirty = {}
+        self._widgets_extent = None
+
         # Columns and rows
         self._column_max_width_zero = []
         for i in range(len(column_max_width)):
@@ -452,6 +477,22 @@ class Menu(Base):
         self._widget_max_position = (0, 0)
         self._widget_min_position = (0, 0)
 
+        # Layout of the last widget position update. If only some widgets change
+        # (and the Menu does not), only their column or frame is updated
+        self._layout_batch = 0
+        self._layout_column_raw_widths = []
+        self._layout_column_width = {}
+        self._layout_dirty = {}
+        self._layout_extent = {}
+        self._layout_frame_position = {}
+        self._layout_signature = None
+        self._layout_size = {}
+        self._layout_structure = {}
+
+        # Grid of the widget rects, updated on each layout. The pointer events
+        # only test the widgets below the pointer
+        self._hit_index = WidgetHitIndex(self)
+
         for r in self._rows:
             self._max_row_column_elements += r
 
@@ -771,6 +812,7 @@ class Menu(Base):
         :return: Self reference
         """
         self._current._widgets_surface_need_update = True
+        self._current._layout_signature = None
         return self
 
     def force_surface_cache_update(self) -> 'Menu':
@@ -1244,10 +1286,94 @@ class Menu(Base):
             else:
                 self._update_after_remove_or_hidden(0, update_surface=False)
 
+    def _get_layout_signature(self) -> Tuple[Any, ...]:
+        """
+        Return the Menu values used by the widget layout (widgets order, columns,
+        size, offsets, menubar, etc.). If these are the same since the last layout,
+        only the changed widgets have to be re-flowed.
+
+        :return: Layout signature
+        """
+        menubar_height = self._menubar.get_height() if self._menubar.fixed else 0
+        return (self._widgets[:], self._columns, tuple(self._rows), tuple(self._column_min_width),
+                tuple(self._column_max_width), self.get_width(inner=True), tuple(self._widget_offset),
+                menubar_height, self.get_position(), self._get_scrollbar_thickness(),
+                self._theme.widget_alignment_ignore_scrollbar_thickness)
+
+    @staticmethod
+    def _get_widget_layout_key(widget: 'Widget') -> Tuple[Any, ...]:
+        """
+        Return the widget values which define its place within the layout (column,
+        row, frame, floating status). If these change, the whole layout is computed.
+
+        :param widget: Widget
+        :return: Layout key
+        """
+        # noinspection PyProtectedMember
+        return (widget.is_visible(), widget.get_frame(), widget.is_floating(), widget._floating_origin_position,
+                widget.is_selectable, widget.get_col_row_index())
+
+    @contextmanager
+    def batch_update(self) -> Iterator['Menu']:
+        """
+        Context manager which lays out the Menu only once, at exit, while adding,
+        removing, packing, hiding or showing many widgets. For example:
+
+        .. code-block:: python
+
+            with menu.batch_update():
+                for item in items:
+                    menu.add.button(item.name, buy, item)
+
+        .. note::
+
+            The sizing errors of the added widgets (:py:class:`pygame_menu.menu._MenuSizingException`,
+            :py:class:`pygame_menu.menu._MenuWidgetOverflow`) are raised at exit,
+            and the widgets are not removed.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply to
+            :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :return: Self reference, within the ``with`` block
+        """
+        render_enabled = self._render_enabled
+        self._render_enabled = False
+        self._layout_batch += 1
+        try:
+            yield self
+        finally:
+            self._layout_batch -= 1
+            self._render_enabled = render_enabled
+            self._layout_signature = None
+            self._widgets_surface = None
+        if self._render_enabled and self._layout_batch == 0:
+            self._render()
+
     def _update_widget_position(self) -> None:
         """
         Update the position of each widget. Also checks widget consistency.
+
+        If the Menu layout values are the same since the last layout, only the
+        widgets changed since then (see :py:meth:`pygame_menu.widgets.core.widget.Widget.force_menu_surface_update`)
+        are re-flowed within their column or frame. Within
+        :py:meth:`pygame_menu.menu.Menu.batch_update` the layout is delayed until
+        the exit.
         """
+        if self._layout_batch > 0:
+            self._layout_signature = None
+            return
+        if self._layout_signature is not None and self._layout_signature == self._get_layout_signature():
+            if self._update_widget_position_incremental():
+                self._layout_dirty.clear()
+                self._stats.position_update_incremental += 1
+                return
+        self._layout_signature = None
+        self._layout_dirty.clear()
+        self._hit_index.invalidate()  # All the widgets move
+
         # Column widgets
         self._widget_columns = {}
         for i in range(self._columns):
@@ -1258,6 +1384,10 @@ class Menu(Base):
         self._column_widths = []
         column_widths = [self._column_min_width[i] for i in range(self._columns)]
 
+        # Width of each widget within its column, stored to check later if a
+        # widget change modifies the column width
+        self._layout_column_width = {}
+
         # Set column/row of each widget and compute maximum width of each column if None
         self._used_columns = 0
         max_elements_msg = \
@@ -1266,6 +1396,7 @@ class Menu(Base):
             f' If using frames, please pack before adding new widgets'
         i_index = 0
         has_frame = False
+        self._layout_frame_position = {}
 
         # Checks for widget selection consistency
         has_selected_widget = False
@@ -1287,6 +1418,8 @@ class Menu(Base):
 
             # If widget is frame
             if isinstance(widget, Frame):
+                if widget.is_scrollable:
+                    self._layout_frame_position[widget] = widget.get_scrollarea(inner=True).get_position()
                 try:
                     widget.update_position()
                 except:
@@ -1336,10 +1469,8 @@ class Menu(Base):
             else:
                 continue
 
-            column_widths[col] = max(
-                column_widths[col],
-                widget.get_width(apply_selection=True)  # This forces rendering
-            )
+            self._layout_column_width[widget] = widget.get_width(apply_selection=True)  # This forces rendering
+            column_widths[col] = max(column_widths[col], self._layout_column_width[widget])
 
         if len(invalid_selection_widgets) > 0:
             self._index = -1
@@ -1349,6 +1480,7 @@ class Menu(Base):
                 f' selected: {", ".join(invalid_selection_widgets)}. If widget is'
                 f' selected outside the menu, use widget.select(update_menu=True)'
             )
+        self._layout_column_raw_widths = column_widths[:]
 
         # Apply max width column limit
         for col in range(self._used_columns):
@@ -1457,55 +1589,148 @@ class Menu(Base):
         # Update title position
         self._menubar.set_position(*self.get_position())
 
-        # Widget max/min position
-        min_max_updated = False
-        max_x, max_y = -1e8, -1e8
-        min_x, min_y = 1e8, 1e8
+        # Size of each widget, the position of a widget depends on the size of
+        # the previous widgets of its column
+        self._layout_size = {}
+        for widget in self._widgets:
+            self._layout_size[widget] = widget.get_rect(render=True).size  # This forces rendering
 
-        # Cache rects
-        rects_cache: Dict[str, 'pygame.Rect'] = {}
+        # Update appended widgets
+        self._layout_extent = {}
+        for col in self._widget_columns.keys():
+            self._update_column_position(col)
+        self._update_frame_widgets_position()
+        self._update_scrollable_frames_position(self._layout_frame_position)
+        self._update_widget_min_max_position()
+
+        # Store the layout, for the next incremental updates
+        self._layout_structure = {}
+        for widget in self._widgets:
+            self._layout_structure[widget] = self._get_widget_layout_key(widget)
+        self._layout_signature = self._get_layout_signature()
+        self._stats.position_update += 1
 
-        def get_rect(wid: 'Widget') -> 'pygame.Rect':
-            """
-            Get rect cache from widget.
+    def _update_widget_position_incremental(self) -> bool:
+        """
+        Re-flow only the columns and frames of the widgets changed since the last
+        layout, if they keep their column, row and frame, and the column widths
+        don't change. Else, the whole layout must be computed.
 
-            :param wid: Widget
-            :return: Rect cache
-            """
-            try:
-                return rects_cache[wid.get_id()]
-            except KeyError:
-                rects_cache[wid.get_id()] = wid.get_rect(render=True)
-            return rects_cache[wid.get_id()]
+        :return: ``True`` if the layout was updated
+        """
+        # The whole layout updates each frame first, which renders the Menu again
+        # if the first widget of the frame moved since the last frame update
+        for widget in self._widgets:
+            # noinspection PyProtectedMember
+            if isinstance(widget, Frame) and widget._control_widget is not None and \
+                    widget._control_widget_last_pos != widget._control_widget.get_position():
+                if widget in self._layout_frame_position:
+                    self._layout_frame_position[widget] = widget.get_scrollarea(inner=True).get_position()
+                widget.update_position()
+
+        columns: Dict[int, None] = {}
+        frames: Dict['Frame', None] = {}
+        for widget in list(self._layout_dirty):  # Widgets may be added while rendering
+            if widget.get_menu() is not self or self._layout_structure.get(widget) != self._get_widget_layout_key(widget):
+                return False
+            if self._has_scrollable_frame(widget):
+                return False
+            if isinstance(widget, Frame):
+                frames[widget] = None
+            if widget.get_frame() is not None:  # Hidden widgets also move the next ones within the frame
+                frames[widget.get_frame()] = None
+                continue
+            if not widget.is_visible():
+                continue
+            self._layout_size[widget] = widget.get_rect(render=True).size
+            if widget in self._layout_column_width:
+                self._layout_column_width[widget] = widget.get_width(apply_selection=True)
+            columns[widget.get_col_row_index()[0]] = None
+
+        # If a column width changes, all the columns move
+        for col in columns.keys():
+            width = self._column_min_width[col]
+            for widget in self._widget_columns[col]:
+                width = max(width, self._layout_column_width.get(widget, width))
+            if width != self._layout_column_raw_widths[col]:
+                return False
 
-        # Get menubar height, if fixed then move all widgets within area
+        for frame in frames.keys():
+            frame.update_position()
+        moved_frames: Dict['Frame', None] = {}
+        for col in columns.keys():
+            self._update_column_position(col)
+            for widget in self._widget_columns[col]:
+                if isinstance(widget, Frame):
+                    frames[widget] = None  # Its widgets may have moved
+                    for w in (widget,) + widget.get_widgets(unpack_subframes_include_frame=True):
+                        if w in self._layout_frame_position:
+                            moved_frames[w] = None
+        self._update_frame_widgets_position(frames)
+        self._update_scrollable_frames_position(moved_frames)
+        self._update_widget_min_max_position()
+        return True
+
+    @staticmethod
+    def _has_scrollable_frame(widget: 'Widget') -> bool:
+        """
+        Check if the widget is a scrollable frame, or is within a scrollable frame,
+        or contains one.
+
+        :param widget: Widget
+        :return: ``True`` if a scrollable frame is involved
+        """
+        frame = widget.get_frame()
+        while frame is not None:
+            if frame.is_scrollable:
+                return True
+            frame = frame.get_frame()
+        if not isinstance(widget, Frame):
+            return False
+        if widget.is_scrollable:
+            return True
+        for w in widget.get_widgets(unpack_subframes_include_frame=True):
+            if isinstance(w, Frame) and w.is_scrollable:
+                return True
+        return False
+
+    def _update_column_position(self, col: int) -> None:
+        """
+        Update the position of the widgets of a column, using the widget sizes of
+        the layout.
+
+        :param col: Column
+        """
         menubar_height = self._menubar.get_height() if self._menubar.fixed else 0
+        column_width = self._column_widths[col]
 
-        # Update appended widgets
-        for index in range(len(self._widgets)):
-            widget = self._widgets[index]
+        # Total height from each row position to the top of the column. Widgets
+        # of the same row are not counted. If the Menu is rendered while its
+        # columns are filled, the widgets can be listed twice; these keep the
+        # height of their first row
+        y_column = 0
+        y_rows: Dict[int, NumberType] = {}
+
+        for widget in self._widget_columns[col]:
+            _, row, _ = widget.get_col_row_index()
+            if row not in y_rows:
+                y_rows[row] = y_column
 
             align = widget.get_alignment()
             margin = widget.get_margin()
             padding = widget.get_padding()
             selection_effect_margin = widget.get_selection_effect().get_margin()
-            width = get_rect(widget).width
+            width, height = self._layout_size[widget]
 
-            if not widget.is_visible():
-                widget.set_position(0, 0)
-                continue
-
-            # If widget within frame update col/row position
-            if widget.get_frame() is not None:
-                # noinspection PyProtectedMember
-                widget._set_position_relative_to_frame(index)
-                continue
+            # Add the widget to the height of the next rows
+            if not widget.is_floating():
+                y_column += height + margin[1]  # Height, and vertical margin (bottom)
 
-            # Get column and row position
-            col, row, _ = widget.get_col_row_index()
+                # If no widget is before add the selection effect
+                if row == 0 and self._widget_offset[1] <= selection_effect_margin[0] and widget.is_selectable:
+                    y_column += selection_effect_margin[0] - self._widget_offset[1]
 
             # Calculate X position
-            column_width = self._column_widths[col]
             selection_margin = 0
             dx = 0
             sm_left, sm_right = selection_effect_margin[1], selection_effect_margin[3]
@@ -1532,28 +1757,11 @@ class Menu(Base):
                 )
 
             # Calculate Y position
-            y_sum = 1  # Compute the total height from the current row position to the top of the column
-            for r_widget in self._widget_columns[col]:
-                _, r, _ = r_widget.get_col_row_index()
-                if r >= row:
-                    break
-                if (
-                    r_widget.is_visible() and
-                    not r_widget.is_floating() and
-                    not r_widget.get_frame() is not None
-                ):
-                    y_sum += get_rect(r_widget).height  # Height
-                    y_sum += r_widget.get_margin()[1]  # Vertical margin (bottom)
-
-                    # If no widget is before add the selection effect
-                    y_sel_h = r_widget.get_selection_effect().get_margin()[0]
-                    if r == 0 and self._widget_offset[1] <= y_sel_h:
-                        if r_widget.is_selectable:
-                            y_sum += y_sel_h - self._widget_offset[1]
+            y_sum = 1 + y_rows[row]
 
             # If the widget offset is zero, then add the selection effect to the height
             # of the widget to avoid visual glitches
-            y_sel_h = widget.get_selection_effect().get_margin()[0]
+            y_sel_h = selection_effect_margin[0]
             if y_sum == 1 and self._widget_offset[1] <= y_sel_h:  # No widget is before
                 if widget.is_selectable:  # Add top margin
                     y_sum += y_sel_h - self._widget_offset[1]
@@ -1566,6 +1774,7 @@ class Menu(Base):
                 widget.set_position(
                     x=max(0, self._widget_offset[0]) + padding[3],
                     y=menubar_height + padding[0] + d_border)
+                self._layout_extent.pop(widget, None)
                 continue
 
             # Add the widget translation to the widget for computing the min/max position. This
@@ -1574,12 +1783,13 @@ class Menu(Base):
             # tx, ty = widget.get_translate()
             tx, ty = 0, 0
 
-            # Update max/min position, minus padding
-            min_max_updated = True
-            max_x = max(max_x, x_coord + width - padding[1] + tx + sm_right)  # minus right padding
-            max_y = max(max_y, y_coord + get_rect(widget).height - padding[2] + ty)  # minus bottom padding
-            min_x = min(min_x, x_coord - padding[3] - sm_left)
-            min_y = min(min_y, y_coord - padding[0])
+            # Store max/min position, minus padding
+            self._layout_extent[widget] = (
+                x_coord + width - padding[1] + tx + sm_right,  # minus right padding
+                y_coord + height - padding[2] + ty,  # minus bottom padding
+                x_coord - padding[3] - sm_left,
+                y_coord - padding[0]
+            )
 
             # Restore the discounted scrollbar thickness
             if self._theme.widget_alignment_ignore_scrollbar_thickness:
@@ -1588,16 +1798,79 @@ class Menu(Base):
             # Update the position of the widget
             widget.set_position(x_coord, y_coord)
 
-        # Update position
-        if min_max_updated:
-            self._widget_max_position = (max_x, max_y)
-            self._widget_min_position = (min_x, min_y)
+    def _update_frame_widgets_position(self, frames: Optional[Dict['Frame', None]] = None) -> None:
+        """
+        Update the position of the hidden widgets and the widgets within frames.
+
+        :param frames: If given, only update the widgets within these frames (or their subframes)
+        """
+        if frames is not None and len(frames) == 0:
+            return
+        updated_frames: Dict['Frame', None] = {}
+        for index in range(len(self._widgets)):
+            widget = self._widgets[index]
+            frame = widget.get_frame()
+            if frames is not None:
+                parent = frame
+                while parent is not None and parent not in frames:
+                    parent = parent.get_frame()
+                if parent is None:
+                    continue
+            if not widget.is_visible():
+                widget.set_position(0, 0)
+                continue
+
+            # If widget within frame update col/row position
+            if frame is not None:
+                # noinspection PyProtectedMember
+                widget._set_position_relative_to_frame(index, update_frame_indices=False)
+                updated_frames[frame] = None
+
+        # Frame indices are updated once all their widgets are placed
+        for frame in updated_frames.keys():
+            frame.update_indices()
+
+    def _update_scrollable_frames_position(self, frames: Dict['Frame', None]) -> None:
+        """
+        Update the widgets of the scrollable frames which were moved by the layout.
+        These widgets are translated by the position of the frame scrollarea, only
+        known once the frame is placed. Subframes are placed after their frame,
+        thus, this is repeated until no frame moves.
+
+        :param frames: Scrollable frames which may have moved
+        """
+        for _ in range(len(frames)):
+            moved: Dict['Frame', None] = {}
+            for frame in frames.keys():
+                x, y = frame.get_scrollarea(inner=True).get_position()
+                prev_x, prev_y = self._layout_frame_position[frame]
+                if (x, y) == (prev_x, prev_y):
+                    continue
+                self._layout_frame_position[frame] = (x, y)
+                moved[frame] = None
+
+                # Same translation as Frame.update_position, without its re-rendering
+                for widget in frame.get_widgets(unpack_subframes=False):
+                    if widget.is_visible(check_frame=False):
+                        # noinspection PyProtectedMember
+                        tx, ty = widget._translate_virtual
+                        widget._translate_virtual = (tx - x + prev_x, ty - y + prev_y)
+            if len(moved) == 0:
+                break
+            self._update_frame_widgets_position(moved)
+
+    def _update_widget_min_max_position(self) -> None:
+        """
+        Update the widget max/min position from the layout.
+        """
+        if len(self._layout_extent) > 0:
+            extents = self._layout_extent.values()
+            self._widget_max_position = (max(e[0] for e in extents), max(e[1] for e in extents))
+            self._widget_min_position = (min(e[2] for e in extents), min(e[3] for e in extents))
         else:
             self._widget_max_position = (0, 0)
             self._widget_min_position = (0, 0)
 
-        self._stats.position_update += 1
-
     def _build_widget_surface(self) -> None:
         """
         Create the surface used to draw widgets according the required width and
@@ -1966,6 +2239,7 @@ class Menu(Base):
         :return: Self reference **(current)**
         """
         self._current._widgets_surface = None
+        self._current._layout_signature = None
         self._current._render()
         self._current._stats.render_public += 1
         return self
@@ -2077,12 +2351,19 @@ class Menu(Base):
         # Draw the prev decorator
         self._current._decorator.draw_prev(surface)
 
-        # Draw widgets, update cache if enabled
-        if (
+        # Draw only the changed widgets, if the layout is the same
+        full_update = (
             not self._current._widget_surface_cache_enabled or
             render or
             self._current._widget_surface_cache_need_update
-        ):
+        )
+        damaged: Optional[List['pygame.Rect']] = []
+        if not full_update and self._current._widgets_dirty:
+            damaged = self._current._draw_dirty_widgets()
+            full_update = damaged is None
+
+        # Draw widgets, update cache if enabled
+        if full_update:
             # This should be updated before drawing widgets. As widget
             # draw may trigger surface cache updating. Don't move this
             # line or unexpected errors may occur
@@ -2094,7 +2375,6 @@ class Menu(Base):
             # Call scrollarea draw decorator. This must be done before filling the
             # surface. ScrollArea post decorator is drawn on _scroll.draw(surface) call
             scrollarea_decorator = self._current._scrollarea.get_decorator()
-            scrollarea_decorator.force_cache_update()
             scrollarea_decorator.draw_prev(self._current._widgets_surface)
 
             # Iterate through widgets and draw them
@@ -2111,22 +2391,153 @@ class Menu(Base):
             if selected_widget_draw[0] is not None:
                 selected_widget_draw[0].draw_after_if_selected(selected_widget_draw[1])
 
+            # All the widgets have been drawn in their last state
+            self._current._widgets_dirty.clear()
+            self._current._widgets_extent = None
             self._current._stats.draw_update_cached += 1
 
         self._current._scrollarea.draw(surface)
         self._current._menubar.draw(surface)
 
         # Draw focus on selected if the widget is active
-        self._current._draw_focus_widget(surface, self._current.get_selected_widget())
+        focus = self._current._draw_focus_widget(surface, self._current.get_selected_widget())
         self._current._decorator.draw_post(surface)
         self._current._stats.draw += 1
 
+        # Store the changed rects. The whole Menu changes if the widgets surface
+        # was redrawn, or if the Menu, its scroll or its menubar changed
+        current = self._current
+        state = (surface, surface.get_abs_offset(), current.get_position(), current._scrollarea.get_offsets(),
+                 current._menubar._last_render_hash,
+                 tuple(sbar._last_render_hash for sbar in current._scrollarea._scrollbars))
+        offset = surface.get_abs_offset()
+        if (
+            clear_surface or self._top._background_function[1] is not None or
+            (current._decorator._total_decor() > 0 and not current._decorator.cache)
+        ):
+            current._widgets_damaged = [surface.get_rect(topleft=offset)]
+        elif full_update or focus is not None or state != current._widgets_damaged_state:
+            current._widgets_damaged = [current.get_rect().move(offset)]
+        else:
+            current._widgets_damaged = [rect.move(offset) for rect in damaged]
+        current._widgets_damaged_state = state
+
         # Update cursor if not mainloop
         if self._current._mainloop:
             check_widget_mouseleave()
 
         return self._current
 
+    def _add_dirty_widget(self, widget: 'Widget') -> bool:
+        """
+        Add a widget to be redrawn on next drawing call, without updating the
+        whole widgets surface. This is only possible if the widget keeps the rect
+        of the last layout.
+
+        :param widget: Widget
+        :return: ``True`` if the widget was added, ``False`` if the widgets surface must be updated
+        """
+        if (
+            not self._widget_surface_cache_enabled or
+            self._widgets_surface is None or
+            self._widgets_surface_need_update or
+            widget._layout_rect is None or
+            widget.get_col_row_index()[2] == -1 or
+            not widget.is_visible() or
+            widget._layout_rect != widget.get_rect()
+        ):
+            return False
+        self._widgets_dirty[widget] = None
+        return True
+
+    def _draw_dirty_widgets(self) -> Optional[List['pygame.Rect']]:
+        """
+        Redraw the area of the dirty widgets on the widgets surface. Each area is
+        cleared, then the widgets overlapping it are drawn again, clipped.
+
+        :return: Changed rects in surface coordinates, or ``None`` if the whole widgets surface must be drawn
+        """
+        surface = self._widgets_surface
+        if surface is None:
+            return None
+        batch = list(self._widgets_dirty)
+        world = surface.get_rect()
+
+        # Area of each widget, merged if they overlap
+        areas: List['pygame.Rect'] = []
+        for widget in batch:
+            if (
+                widget._menu is not self or
+                not widget.is_visible() or
+                widget._layout_rect != widget.get_rect()
+            ):
+                return None
+            rect = widget._get_damage_rect()
+            if rect is None:
+                return None
+            rect = rect.clip(world)
+            for area in areas[:]:
+                if area.colliderect(rect):
+                    rect.union_ip(area)
+                    areas.remove(area)
+            if rect.width > 0 and rect.height > 0:
+                areas.append(rect)
+
+        # The area of the non-framed widgets does not change until the next layout
+        if self._widgets_extent is None:
+            self._widgets_extent = [(w, w._get_damage_rect()) for w in self._widgets
+                                    if w.get_frame() is None and w.is_visible()]
+
+        # The selected widget may draw outside its area (DropSelect)
+        selected = self.get_selected_widget()
+        selected_top = None
+        if selected is not None and selected._get_damage_rect() is None:
+            selected_top = selected
+            while selected_top.get_frame() is not None:
+                selected_top = selected_top.get_frame()
+
+        scrollarea_decorator = self._scrollarea.get_decorator()
+        for area in areas:
+            surface.set_clip(area)
+            surface.fill((255, 255, 255, 0), area)
+            scrollarea_decorator.draw_prev(surface)
+            selected_widget: Optional['Widget'] = None
+            for widget, rect in self._widgets_extent:
+                if rect is None or widget is selected_top or rect.colliderect(area):
+                    if widget.is_selected():
+                        selected_widget = widget
+                    widget.draw(surface)
+            if selected_widget is not None:
+                selected_widget.draw_after_if_selected(surface)
+            surface.set_clip(None)
+
+        # Widgets changed while drawing stay dirty
+        for widget in batch:
+            self._widgets_dirty.pop(widget, None)
+        self._stats.draw_update_dirty += 1
+        return [self._scrollarea.to_real_position(area, visible=True) for area in areas]
+
+    def get_damaged_rects(self) -> List['pygame.Rect']:
+        """
+        Return the rects of the surface changed by the last drawing call, to be
+        used with ``pygame.display.update(rects)``. If only a few widgets changed
+        (for example, a text input cursor), only their areas are returned; else,
+        the whole Menu rect.
+
+        .. note::
+
+            The rects are in the coordinates of the display (the offset of the
+            surface is applied if it is a subsurface).
+
+        .. warning::
+
+            This method should not be used along :py:meth:`pygame_menu.menu.Menu.get_current`,
+            for example, ``menu.get_current().get_damaged_rects()``
+
+        :return: Rect list, empty if nothing changed
+        """
+        return list(self._current._widgets_damaged)
+
     def _draw_focus_widget(
         self,
         surface: 'pygame.Surface',
@@ -2540,14 +2951,21 @@ class Menu(Base):
                 frames_updated = frames_updated or frame.update_menu(events)
 
         # Update widgets on update list
+        widgets_updated = False
         for widget in self._current._update_widgets:
-            widget.update_menu(events)
+            widgets_updated = widget.update_menu(events) or widgets_updated
 
         # Frames have updated
         if frames_updated:
             self._current._last_update_mode.append(_events.MENU_LAST_FRAMES)
             updated = True
 
+        # Widgets on update list have used the events (for example, a virtual
+        # table scrolled by the mouse wheel)
+        elif widgets_updated:
+            self._current._last_update_mode.append(_events.MENU_LAST_UPDATE_WIDGETS)
+            updated = True
+
         # Update scroll bars
         elif not selected_widget_disable_frame_update and self._current._scrollarea.update(events):
             self._current._last_update_mode.append(_events.MENU_LAST_SCROLL_AREA)
@@ -2705,7 +3123,7 @@ class Menu(Base):
                     # If the mouse motion selection is disabled then select a widget by clicking
                     if not self._current._mouse_motion_selection:
                         sel = False
-                        for index in range(len(self._current._widgets)):
+                        for index in self._current._get_pointer_widgets(event):
                             widget = self._current._widgets[index]
                             if isinstance(widget, Frame):  # Frame does not accept click
                                 continue
@@ -2798,7 +3216,7 @@ class Menu(Base):
 
                     # Select if mouse motion
                     sel = False  # Widget has been selected
-                    for index in range(len(self._current._widgets)):
+                    for index in self._current._get_pointer_widgets(event):
                         widget = self._current._widgets[index]
                         if widget.is_visible() and widget.get_scrollarea().collide(widget, event):
                             if self._current._mouse_motion_selection and widget.is_selectable and not isinstance(widget, Frame):
@@ -2831,7 +3249,7 @@ class Menu(Base):
                     # a widget by clicking
                     if not self._current._touchscreen_motion_selection:
                         sel = False
-                        for index in range(len(self._current._widgets)):
+                        for index in self._current._get_pointer_widgets(event):
                             widget = self._current._widgets[index]
                             if isinstance(widget, Frame):  # Frame does not accept touch
                                 continue
@@ -2880,7 +3298,7 @@ class Menu(Base):
                         continue
 
                     sel = False
-                    for index in range(len(self._current._widgets)):
+                    for index in self._current._get_pointer_widgets(event):
                         widget = self._current._widgets[index]
                         if isinstance(widget, Frame):  # Frame does not accept touch
                             continue
@@ -2908,6 +3326,21 @@ class Menu(Base):
 
         return updated
 
+    def _get_pointer_widgets(self, event: EventType) -> Union[range, List[int]]:
+        """
+        Return the indices of the widgets which may collide the pointer event
+        (mouse or finger), in order. The widgets changed since the last layout
+        are also returned, as their size may have changed. If the widgets
+        surface must be built again (widgets added, removed, packed, etc.) all
+        indices are returned.
+
+        :param event: Pointer event
+        :return: Widget indices
+        """
+        if self._widgets_surface is None:
+            return range(len(self._widgets))
+        return self._hit_index.get_indices(self._widgets, event, self._layout_dirty)
+
     def collide(self, event: EventType) -> bool:
         """
         Check if user event collides the Menu.
@@ -4040,6 +4473,7 @@ class _MenuStats(object):
         # Widget position
         self.build_surface = 0
         self.position_update = 0
+        self.position_update_incremental = 0
         self.center_content = 0
 
         # Render
@@ -4053,6 +4487,7 @@ class _MenuStats(object):
         self.clear = 0
         self.draw = 0
         self.draw_update_cached = 0
+        self.draw_update_dirty = 0
         self.loop = 0
         self.reset = 0
         self.select = 0
@@ -46,6 +46,8 @@ import traceback
 import uuid
 import warnings
 
+from collections import OrderedDict
+
 import pygame
 import pygame_menu
 
@@ -738,29 +740,87 @@ class ShadowGenerator(object):
     elements you are having trouble with.
 
     Source: https://github.com/MyreMylar/pygame_gui with many edits.
-    """
 
-    _created_ellipse_shadows: Dict[str, 'pygame.Surface']
-    _preloaded_shadow_corners: Dict[str, Dict[str, 'pygame.Surface']]
-    _short_term_rect_cache: Dict[str, 'pygame.Surface']
+    The shadows are kept in an LRU cache bounded in memory, keyed by the type,
+    size, width, corner radius, antialiasing and color; the corners and edges
+    of the rectangular shadows are shared by all the sizes.
 
-    def __init__(self) -> None:
-        self._created_ellipse_shadows = {}
-        self._preloaded_shadow_corners = {}
-        self._short_term_rect_cache = {}
+    :param max_bytes: Maximum memory used by the shadows in bytes
+    """
+    _corners: 'OrderedDict[Tuple[int, int, int, Tuple3IntType], Dict[str, pygame.Surface]]'
+    _shadows: 'OrderedDict[Tuple, pygame.Surface]'
+    bytes: int
+    corners_created: int
+    hits: int
+    max_bytes: int
+    misses: int
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self._corners = OrderedDict()
+        self._shadows = OrderedDict()
+        self.bytes = 0
+        self.corners_created = 0  # Number of times the corner algorithm ran
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.misses = 0
 
     def clear_short_term_caches(self, force: bool = False) -> None:
         """
-        Empties short term caches, so we aren't hanging on to so many surfaces.
+        Empties the caches if forced. Otherwise, does nothing, the shadows cache
+        is already bounded in memory.
 
         :param force: Force clear
         """
-        t = len(self._created_ellipse_shadows) + len(self._preloaded_shadow_corners) + \
-            len(self._short_term_rect_cache)
-        if t >= 100 or force:
-            self._created_ellipse_shadows.clear()
-            self._preloaded_shadow_corners.clear()
-            self._short_term_rect_cache.clear()
+        if force:
+            self._corners.clear()
+            self._shadows.clear()
+            self.bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the usage metrics of the cache.
+
+        :return: Number of shadows and corner sets, memory used in bytes, hits, misses and corner creations
+        """
+        return {
+            'shadows': len(self._shadows),
+            'corners': len(self._corners),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'corners_created': self.corners_created
+        }
+
+    def _get_shadow(self, key: Tuple) -> Optional['pygame.Surface']:
+        """
+        Return a shadow from the cache.
+
+        :param key: Shadow key
+        :return: Shadow, ``None`` if not in the cache
+        """
+        surface = self._shadows.get(key)
+        if surface is not None:
+            self._shadows.move_to_end(key)  # Most recently used
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def _store_shadow(self, key: Tuple, surface: 'pygame.Surface') -> 'pygame.Surface':
+        """
+        Store a shadow in the cache, dropping the least recently used ones if the
+        cache uses more than ``max_bytes``.
+
+        :param key: Shadow key
+        :param surface: Shadow
+        :return: The same shadow
+        """
+        self._shadows[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.bytes > self.max_bytes and len(self._shadows) > 1:
+            _, evicted = self._shadows.popitem(last=False)  # Least recently used
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+        return surface
 
     def _create_shadow_corners(
         self,
@@ -833,10 +893,7 @@ class ShadowGenerator(object):
             'top_left': tl_corner,
             'top_right': pygame.transform.flip(tl_corner, True, False)
         }
-        self._preloaded_shadow_corners[(str(shadow_width_param) +
-                                        'x' +
-                                        str(corner_radius_param))] = corners_and_edges
-
+        self.corners_created += 1
         return corners_and_edges
 
     @staticmethod
@@ -941,17 +998,19 @@ class ShadowGenerator(object):
             int(corner_radius_param), int(aa_amount)
         if width < corner_radius_param or height < corner_radius_param or shadow_width_param == 0:
             return None
-        r, g, b = color
-        params = [width, height, shadow_width_param, corner_radius_param, aa_amount, r, g, b]
-        shadow_id = '_'.join(str(param) for param in params)
-        if shadow_id in self._short_term_rect_cache:
-            return self._short_term_rect_cache[shadow_id]
+        color = tuple(color)
+        shadow_id = ('rectangle', width, height, shadow_width_param, corner_radius_param, aa_amount, color)
+        final_surface = self._get_shadow(shadow_id)
+        if final_surface is not None:
+            return final_surface
         final_surface = pygame.surface.Surface((width, height), flags=pygame.SRCALPHA, depth=32)
         final_surface.fill(pygame.Color('#00000000'))
 
-        corner_index_id = str(shadow_width_param) + 'x' + str(corner_radius_param)
-        if corner_index_id in self._preloaded_shadow_corners:
-            edges_and_corners = self._preloaded_shadow_corners[corner_index_id]
+        # The corners and edges are shared by all the sizes
+        corner_index_id = (shadow_width_param, corner_radius_param, aa_amount, color)
+        edges_and_corners = self._corners.get(corner_index_id)
+        if edges_and_corners is not None:
+            self._corners.move_to_end(corner_index_id)
         else:
             edges_and_corners = self._create_shadow_corners(
                 shadow_width_param=shadow_width_param,
@@ -959,6 +1018,9 @@ class ShadowGenerator(object):
                 color=color,
                 aa_amount=aa_amount
             )
+            self._corners[corner_index_id] = edges_and_corners
+            if len(self._corners) > 64:
+                self._corners.popitem(last=False)  # Least recently used
 
         final_surface.blit(edges_and_corners['top_left'], (0, 0))
         final_surface.blit(edges_and_corners['top_right'], (width - corner_radius_param, 0))
@@ -990,8 +1052,7 @@ class ShadowGenerator(object):
             final_surface.blit(right_edge, (width - shadow_width_param,
                                             corner_radius_param))
 
-        self._short_term_rect_cache[shadow_id] = final_surface
-        return final_surface
+        return self._store_shadow(shadow_id, final_surface)
 
     def create_new_ellipse_shadow(
         self,
@@ -1017,13 +1078,15 @@ class ShadowGenerator(object):
         shadow_width_param, aa_amount = int(shadow_width_param), int(aa_amount)
         if shadow_width_param == 0:
             return None
+        color = tuple(color)
+        ellipse_id = ('ellipse', width, height, shadow_width_param, 0, aa_amount, color)
+        final_surface = self._get_shadow(ellipse_id)
+        if final_surface is not None:
+            return final_surface
         shadow_surface = pygame.surface.Surface((width * aa_amount, height * aa_amount),
                                                 flags=pygame.SRCALPHA, depth=32)
         shadow_surface.fill(pygame.Color('#00000000'))
         r, g, b = color
-        ellipse_id = str(width) + 'x' + str(height) + 'x' + str(shadow_width_param)
-        if ellipse_id in self._created_ellipse_shadows:
-            return self._created_ellipse_shadows[ellipse_id]
 
         alpha_increment = max(1, int(20 / shadow_width_param))
         shadow_alpha = alpha_increment
@@ -1042,5 +1105,4 @@ class ShadowGenerator(object):
                 shadow_alpha += alpha_increment
 
         final_surface = pygame.transform.smoothscale(shadow_surface, (width, height))
-        self._created_ellipse_shadows[ellipse_id] = final_surface
-        return final_surface
+        return self._store_shadow(ellipse_id, final_surface)
@@ -40,7 +40,7 @@ import pygame_menu
 from pygame_menu._base import Base
 from pygame_menu._decorator import Decorator
 from pygame_menu.controls import Controller
-from pygame_menu.font import FontType
+from pygame_menu.font import FontType, text_cache
 from pygame_menu.locals import POSITION_NORTHWEST, POSITION_SOUTHWEST, POSITION_WEST, \
     POSITION_EAST, POSITION_NORTHEAST, POSITION_CENTER, POSITION_NORTH, POSITION_SOUTH, \
     POSITION_SOUTHEAST, ALIGN_CENTER
@@ -259,6 +259,7 @@ class Widget(Base):
     _keyboard_ignore_nonphysical: bool
     _kwargs: Dict[str, Any]
     _last_render_hash: int
+    _layout_rect: Optional['pygame.Rect']  # Rect of the widget at the last Menu layout
     _margin: Tuple2IntType
     _max_height: List[Optional[bool]]
     _max_width: List[Optional[bool]]
@@ -278,6 +279,7 @@ class Widget(Base):
     _padding_transform: Tuple4IntType
     _position: Tuple2IntType
     _rect: 'pygame.Rect'
+    _render_dirty: bool  # The last render changed the widget, but may keep its size
     _rect_size_delta: Tuple2IntType
     _scale: List[Union[bool, NumberType]]
     _scrollarea: Optional['pygame_menu._scrollarea.ScrollArea']  # Parent scrollarea
@@ -434,6 +436,12 @@ class Widget(Base):
         # update the hash
         self._last_render_hash = 0
 
+        # If True, the last render changed an already rendered widget. Then, if the
+        # widget keeps the rect of the last Menu layout, the Menu only redraws the
+        # widget area instead of the whole widgets surface
+        self._layout_rect = None
+        self._render_dirty = False
+
         # Selection effect, for avoiding exception while getting object rect,
         # NullSelection was created. Initially it was None
         self._selection_effect = pygame_menu.widgets.NoneSelection()
@@ -819,6 +827,7 @@ class Widget(Base):
         :return: Render return value
         """
         self._last_render_hash = 0
+        self._render_dirty = False
         return self._render()
 
     def force_menu_surface_update(self) -> 'Widget':
@@ -833,6 +842,9 @@ class Widget(Base):
 
             This method is expensive, as menu surface update forces re-rendering
             of all widgets (because them can change in size, position, etc...).
+            If the update comes from a render which kept the widget rect of the
+            last Menu layout, only the widget area is redrawn; else, only the
+            column or frame of the widget is laid out again.
 
         :return: Self reference
         """
@@ -841,7 +853,10 @@ class Widget(Base):
             # in the drawing process it may destroy the surface and raising
             # an Error. The usage of _widgets_surface_need_update is only on
             # Menu _render()
-            self._menu._widgets_surface_need_update = True
+            if not (self._render_dirty and self._menu._add_dirty_widget(self)):
+                self._menu._widgets_surface_need_update = True
+                self._menu._layout_dirty[self] = None  # Only its column or frame is updated
+        self._render_dirty = False
         self._shadow['surface'] = None
         return self
 
@@ -861,11 +876,45 @@ class Widget(Base):
         """
         if self._menu is not None:
             # Menu _widget_surface_cache_need_update property is only accessed on
-            # draw method. This does not set _menu._widgets_surface to None
-            self._menu._widget_surface_cache_need_update = True
+            # draw method. This does not set _menu._widgets_surface to None. If
+            # the widget keeps its layout only its area is redrawn
+            if not self._menu._add_dirty_widget(self):
+                self._menu._widget_surface_cache_need_update = True
             self._decorator.force_cache_update()
         return self
 
+    def _get_damage_rect(self) -> Optional['pygame.Rect']:
+        """
+        Return the area of the Menu widgets surface painted by the widget (background,
+        border, shadow and selection effect, selected or not). The Menu uses it to
+        redraw only the changed widgets. If the widget is within a scrollable Frame,
+        the area of the outermost scrollable Frame is returned, as the widget is
+        drawn through its surface.
+
+        :return: Rect, or ``None`` if the painted area is unknown (widget with decorations, or drawn outside its rect when selected)
+        """
+        if (
+            self._decorator._total_decor() > 0 or
+            type(self).draw_after_if_selected is not Widget.draw_after_if_selected
+        ):
+            return None
+        owner = self
+        frame = self._frame
+        while frame is not None:
+            if frame.is_scrollable:
+                owner = frame
+            frame = frame._frame
+        if owner is not self:
+            return owner._get_damage_rect()
+
+        bg = self._background_inflate
+        rect = self.get_rect(inflate=(bg[0] + self._border_inflate[0], bg[1] + self._border_inflate[1]))
+        rect.union_ip(self.get_rect(inflate=self._selection_effect.get_xy_margin()))
+        rect.union_ip(self._selection_effect.inflate(self.get_rect()))
+        if self._shadow['enabled']:
+            rect.inflate_ip(2 * self._shadow['properties'][1], 2 * self._shadow['properties'][1])
+        return rect.inflate(2, 2)  # Rounding of the inflated rects
+
     def render(self) -> Optional[bool]:
         """
         Public rendering method.
@@ -932,6 +981,7 @@ class Widget(Base):
         """
         _hash = self._hash_variables(*args)
         if _hash != self._last_render_hash or self._last_render_hash == 0:
+            self._render_dirty = self._last_render_hash != 0
             self._last_render_hash = _hash
             return True
         return False
@@ -1323,7 +1373,7 @@ class Widget(Base):
         if self._shadow['enabled']:
             if not rect:
                 rect = self.get_rect(inflate=self._get_background_inflate())
-            if not self._shadow['surface'] or self._shadow['rect'] != rect:
+            if not self._shadow['surface'] or self._shadow['rect'] != rect.size:
                 shadow_type, shadow_width, corner_radius, aa_amount, color = self._shadow['properties']
                 s: 'pygame.Surface'
                 w, h = rect.width + 2 * shadow_width, rect.height + 2 * shadow_width
@@ -1344,7 +1394,7 @@ class Widget(Base):
                         aa_amount=aa_amount,
                         color=color
                     )
-                WIDGET_SHADOW_GENERATOR.clear_short_term_caches()
+                self._shadow['rect'] = rect.size  # The shadow only depends on the size
                 self._shadow['surface'] = s
             if not self._shadow['surface']:
                 if self._verbose:
@@ -1701,34 +1751,32 @@ class Widget(Base):
         # Replace tabs
         text = text.replace('\t', ' ' * self._tab_size)
 
-        surface = self._font.render(text, self._font_antialias, color, bgcolor)
-        return surface
+        return text_cache.render(self._font, text, color, self._font_antialias, bgcolor)
 
     def _render_string(self, string: str, color: ColorInputType) -> 'pygame.Surface':
         """
-        Render text and turn it into a surface.
+        Render text and turn it into a surface, with the font shadow if enabled.
+        The surface is shared through the text cache, thus, it must not be
+        modified.
 
         :param string: Text to render
         :param color: Text color
         :return: Text surface
         """
-        text = self._font_render_string(string, color)
-
-        # Create surface
-        surface = make_surface(
-            width=text.get_width(),
-            height=text.get_height(),
+        assert isinstance(string, str)
+        if self._font is None:
+            return make_surface(0, 0, alpha=True)
+        return text_cache.render(
+            self._font,
+            string.replace('\t', ' ' * self._tab_size),
+            assert_color(color),
+            self._font_antialias,
+            self._font_background_color,
+            self._font_shadow_color if self._font_shadow else None,
+            self._font_shadow_tuple,
             alpha=True
         )
 
-        # Draw shadow first
-        if self._font_shadow:
-            text_bg = self._font_render_string(string, self._font_shadow_color)
-            surface.blit(text_bg, self._font_shadow_tuple)
-
-        surface.blit(text, (0, 0))
-        return surface
-
     def shadow(
         self,
         shadow_type: str = WIDGET_SHADOW_TYPE_RECTANGULAR,
@@ -1956,6 +2004,7 @@ class Widget(Base):
         :return: Self reference
         """
         self._menu = menu
+        self._layout_rect = None
         if menu is None:
             self._col_row_index = (-1, -1, -1)
             self._selected = False
@@ -2012,11 +2061,12 @@ class Widget(Base):
         """
         raise NotImplementedError('override is mandatory')
 
-    def _set_position_relative_to_frame(self, index: int = -1) -> 'Widget':
+    def _set_position_relative_to_frame(self, index: int = -1, update_frame_indices: bool = True) -> 'Widget':
         """
         Set the Widget position relative to its frame.
 
         :param index: Widget index
+        :param update_frame_indices: Update the frame indices. The Menu updates them once all the frame widgets are placed
         :return: Self reference
         """
         if self._frame is not None:
@@ -2024,7 +2074,8 @@ class Widget(Base):
             self.set_position(fx + self._padding[3], fy + self._padding[0])
             c, r, _ = self._frame.get_col_row_index()
             self.set_col_row_index(c, r, index)
-            self._frame.update_indices()
+            if update_frame_indices:
+                self._frame.update_indices()
         else:
             # raise ValueError(f'{self.get_class_id()} is not within a frame')
             pass
@@ -2054,6 +2105,9 @@ class Widget(Base):
         self._position = (int(x), int(y))
         self._rect.x = self._position[0] + self._translate[0] + self._translate_virtual[0]
         self._rect.y = self._position[1] + self._translate[1] + self._translate_virtual[1]
+        self._layout_rect = self.get_rect()
+        if self._menu is not None:
+            self._menu._hit_index.update((self,))
         return self
 
     def get_position(
@@ -2971,10 +3025,13 @@ class Widget(Base):
         :param prev_visible: Previous visible status
         :return: Self reference
         """
+        if prev_visible != self._visible:
+            self._layout_rect = None  # The Menu layout changes
         self._render()
         if self._menu is not None:
             self._menu._update_selection_if_hidden()
             if prev_visible != self._visible:
+                self._menu._layout_dirty[self] = None
                 try:
                     self._menu._update_widget_position()
                 except AttributeError:
@@ -26,4 +26,5 @@ from pygame_menu.widgets.widget.table import Table
 from pygame_menu.widgets.widget.textinput import TextInput
 from pygame_menu.widgets.widget.toggleswitch import ToggleSwitch
 from pygame_menu.widgets.widget.vfill import VFill
+from pygame_menu.widgets.widget.virtualtable import VirtualTable
 from pygame_menu.widgets.widget.vmargin import VMargin
@@ -875,7 +875,6 @@ class Frame(Widget):
             self._draw_shadow(self._surface, rect=self._real_rect)
             self._draw_background_color(self._surface, rect=self._real_rect)
             scrollarea_decorator = self.get_decorator()
-            scrollarea_decorator.force_cache_update()
             scrollarea_decorator.draw_prev(self._surface)
             for widget in self._widgets.values():
                 if widget.is_selected():
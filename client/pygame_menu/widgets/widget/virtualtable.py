@@ -0,0 +1,736 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+VIRTUAL TABLE
+Table which renders only the rows within its view.
+"""
+
+__all__ = [
+
+    # Class
+    'VirtualTable',
+    'VirtualTableManager',
+
+    # Types
+    'VirtualTableRowsType'
+
+]
+
+import pygame
+import pygame_menu
+
+from abc import ABC
+from pygame_menu.locals import ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT, ORIENTATION_VERTICAL
+from pygame_menu.utils import assert_alignment, assert_color, parse_padding, uuid4
+from pygame_menu.widgets.core.widget import Widget, WidgetTransformationNotImplemented, \
+    AbstractWidgetManager
+from pygame_menu.widgets.widget.label import Label
+from pygame_menu.widgets.widget.scrollbar import ScrollBar
+
+from pygame_menu._types import Any, Callable, List, Optional, Sequence, Tuple, Union, \
+    ColorType, ColorInputType, EventVectorType, NumberType, PaddingType, \
+    Tuple2IntType, Tuple4IntType, VectorInstance
+
+VirtualTableRowsType = Union[Sequence[Sequence[Any]], Callable[[int], Sequence[Any]]]
+VIRTUAL_TABLE_WHEEL_ROWS = 3  # Rows scrolled by each mouse wheel step
+
+
+# noinspection PyMissingOrEmptyDocstring
+class VirtualTable(Widget):
+    """
+    Virtual table, shows the rows of a data source within a view of fixed height
+    with a vertical scrollbar. The data source is a sequence of rows, or a
+    function which returns the row of an index (``rows(index)``); each row is a
+    sequence of cell values, rendered as text.
+
+    Only the rows within the view are rendered: the cell widgets of a few rows
+    are recycled while scrolling, and the column widths are declared or computed
+    from a sample of the rows. Thus, the build and scroll time does not depend
+    on the number of rows.
+
+    .. note::
+
+        All rows have the same height. Unlike :py:class:`pygame_menu.widgets.Table`,
+        the cells cannot be widgets or images.
+
+    .. note::
+
+        VirtualTable cannot be selected. The rows are scrolled with the mouse
+        wheel (if the mouse is over the table) or the scrollbar.
+
+    .. note::
+
+        VirtualTable only accepts translation transformation.
+
+    :param rows: Sequence of rows, or function which returns the row of an index
+    :param height: Height of the rows view in px (without the header)
+    :param row_count: Number of rows. Required if ``rows`` is a function
+    :param header: Title of each column, drawn above the rows. If ``None`` the table has no header
+    :param column_widths: Width of each column in px. The ``None`` columns (or all, if ``None``) are computed from a sample of the rows
+    :param sample_size: Number of rows (evenly spaced over the data source) used to compute the column widths
+    :param table_id: ID of the table
+    :param cell_align: Horizontal align of each cell. See :py:mod:`pygame_menu.locals`
+    :param cell_border_color: Color of the lines between the cells
+    :param cell_border_width: Width of the lines between the cells in px. If ``0`` the lines are not drawn
+    :param cell_padding: Padding of each cell according to CSS rules. General shape: (top, right, bottom, left)
+    :param header_background_color: Background color of the header. ``None`` for no-color
+    :param header_font_color: Font color of the header. If ``None`` uses the widget font color
+    :param row_background_color: Background color of the rows. ``None`` for no-color
+    :param row_alternate_background_color: Background color of the odd rows. If ``None`` uses ``row_background_color``
+    :param scrollbar_color: Scrollbar color
+    :param scrollbar_slider_color: Color of the slider
+    :param scrollbar_slider_hover_color: Color of the slider if hovered or clicked
+    :param scrollbar_slider_pad: Space between slider and scrollbar borders in px
+    :param scrollbar_thick: Scrollbar thickness in px
+    """
+    _cell_align: str
+    _cell_border_color: ColorType
+    _cell_border_width: int
+    _cell_padding: Tuple4IntType
+    _cells: List[Optional[List['Label']]]
+    _column_widths: List[int]
+    _columns_width: int
+    _declared_column_widths: Optional[List[Optional[int]]]
+    _declared_row_count: Optional[int]
+    _header: Optional[List[str]]
+    _header_background_color: Optional[ColorType]
+    _header_cells: List['Label']
+    _header_font_color: Optional[ColorType]
+    _height: int
+    _max_scroll: int
+    _row_alternate_background_color: Optional[ColorType]
+    _row_background_color: Optional[ColorType]
+    _row_count: int
+    _row_height: int
+    _rows: VirtualTableRowsType
+    _rows_revision: int  # Increased each time the rows change, the table is rendered again
+    _sample_size: int
+    _scroll: int
+    _scrollbar: 'ScrollBar'
+    _slot_rows: List[int]
+
+    def __init__(
+        self,
+        rows: VirtualTableRowsType,
+        height: int = 200,
+        row_count: Optional[int] = None,
+        header: Optional[Sequence[Any]] = None,
+        column_widths: Optional[Sequence[Optional[int]]] = None,
+        sample_size: int = 100,
+        table_id: str = '',
+        cell_align: str = ALIGN_LEFT,
+        cell_border_color: ColorInputType = (0, 0, 0),
+        cell_border_width: int = 1,
+        cell_padding: PaddingType = (2, 6),
+        header_background_color: Optional[ColorInputType] = None,
+        header_font_color: Optional[ColorInputType] = None,
+        row_background_color: Optional[ColorInputType] = None,
+        row_alternate_background_color: Optional[ColorInputType] = None,
+        scrollbar_color: ColorInputType = (235, 235, 235),
+        scrollbar_slider_color: ColorInputType = (200, 200, 200),
+        scrollbar_slider_hover_color: ColorInputType = (170, 170, 170),
+        scrollbar_slider_pad: NumberType = 0,
+        scrollbar_thick: int = 20
+    ) -> None:
+        super(VirtualTable, self).__init__(
+            widget_id=table_id
+        )
+
+        # Check the sizes
+        assert isinstance(height, int) and height > 0, \
+            'height must be an integer greater than zero'
+        assert isinstance(sample_size, int) and sample_size > 0, \
+            'sample size must be an integer greater than zero'
+        if header is not None:
+            assert isinstance(header, VectorInstance)
+        if column_widths is not None:
+            assert isinstance(column_widths, VectorInstance)
+            for w in column_widths:
+                assert w is None or isinstance(w, int) and w >= 0, \
+                    'each column width must be None or an integer equal or greater than zero'
+        assert isinstance(scrollbar_thick, int) and scrollbar_thick > 0
+
+        # Check the cell style
+        assert_alignment(cell_align)
+        assert isinstance(cell_border_width, int) and cell_border_width >= 0
+        cell_border_color = assert_color(cell_border_color)
+        if header_background_color is not None:
+            header_background_color = assert_color(header_background_color)
+        if header_font_color is not None:
+            header_font_color = assert_color(header_font_color)
+        if row_background_color is not None:
+            row_background_color = assert_color(row_background_color)
+        if row_alternate_background_color is not None:
+            row_alternate_background_color = assert_color(row_alternate_background_color)
+
+        self._cell_align = cell_align
+        self._cell_border_color = cell_border_color
+        self._cell_border_width = cell_border_width
+        self._cell_padding = parse_padding(cell_padding)
+        self._declared_column_widths = None if column_widths is None else list(column_widths)
+        self._header = None if header is None else [str(h) for h in header]
+        self._header_background_color = header_background_color
+        self._header_font_color = header_font_color
+        self._height = height
+        self._row_alternate_background_color = row_alternate_background_color
+        self._row_background_color = row_background_color
+        self._sample_size = sample_size
+
+        # Layout, computed once the font is set
+        self._cells = []
+        self._column_widths = []
+        self._columns_width = 0
+        self._header_cells = []
+        self._max_scroll = 0
+        self._row_count = 0
+        self._row_height = 0
+        self._scroll = 0
+        self._slot_rows = []
+
+        # Scrollbar of the rows view
+        self._scrollbar = ScrollBar(
+            length=height,
+            orientation=ORIENTATION_VERTICAL,
+            page_ctrl_color=scrollbar_color,
+            page_ctrl_thick=scrollbar_thick,
+            slider_color=scrollbar_slider_color,
+            slider_hover_color=scrollbar_slider_hover_color,
+            slider_pad=scrollbar_slider_pad,
+            values_range=(0, 1)
+        )
+        self._scrollbar.configured = True
+
+        # Data source
+        self._rows = None
+        self._rows_revision = 0
+        self._declared_row_count = None
+        self.set_rows(rows, row_count)
+
+        # Configure public's
+        self.is_selectable = False
+
+    def set_rows(self, rows: VirtualTableRowsType, row_count: Optional[int] = None) -> 'VirtualTable':
+        """
+        Set the data source of the table, and compute the width of the columns
+        which are not declared.
+
+        :param rows: Sequence of rows, or function which returns the row of an index
+        :param row_count: Number of rows. Required if ``rows`` is a function
+        :return: Self reference
+        """
+        if callable(rows):
+            assert isinstance(row_count, int) and row_count >= 0, \
+                'row count must be an integer equal or greater than zero if rows is a function'
+        else:
+            assert hasattr(rows, '__getitem__') and hasattr(rows, '__len__'), \
+                'rows must be a sequence, or a function which returns the row of an index'
+            assert row_count is None, 'row count is only used if rows is a function'
+        self._rows = rows
+        self._declared_row_count = row_count
+        self._scroll = 0
+        self._update_layout()
+        return self
+
+    def update_rows(self, row_count: Optional[int] = None, resample: bool = False) -> 'VirtualTable':
+        """
+        Update the table after its rows change (the rows of the view are rendered
+        again).
+
+        :param row_count: New number of rows, if the rows are a function
+        :param resample: Compute again the width of the columns which are not declared
+        :return: Self reference
+        """
+        if row_count is not None:
+            assert callable(self._rows), 'row count is only used if rows is a function'
+            assert isinstance(row_count, int) and row_count >= 0
+            self._declared_row_count = row_count
+        if resample:
+            self._update_layout()
+        else:
+            self._update_scroll_range()
+            self._slot_rows = [-1] * len(self._slot_rows)
+            self._rows_revision += 1
+            self._render()
+        return self
+
+    def get_row_count(self) -> int:
+        """
+        Return the number of rows.
+
+        :return: Number of rows
+        """
+        if self._declared_row_count is not None:
+            return self._declared_row_count
+        return len(self._rows)
+
+    def get_row(self, index: int) -> Sequence[Any]:
+        """
+        Return the row of an index from the data source.
+
+        :param index: Row index (counting from 0)
+        :return: Row cell values
+        """
+        if self._declared_row_count is not None:
+            return self._rows(index)
+        return self._rows[index]
+
+    def get_column_widths(self) -> Tuple[int, ...]:
+        """
+        Return the width of each column in px.
+
+        :return: Column widths
+        """
+        return tuple(self._column_widths)
+
+    def get_row_height(self) -> int:
+        """
+        Return the height of each row in px.
+
+        :return: Row height
+        """
+        return self._row_height
+
+    def get_visible_rows(self) -> Tuple2IntType:
+        """
+        Return the index of the first row within the view, and the index after
+        the last one.
+
+        :return: First row index, last row index (excluded)
+        """
+        if self._row_height == 0:
+            return 0, 0
+        first = self._scroll // self._row_height
+        last = (self._scroll + self._height + self._row_height - 1) // self._row_height
+        return first, min(last, self._row_count)
+
+    def get_scroll_value(self) -> int:
+        """
+        Return the scroll of the rows view in px.
+
+        :return: Scroll value
+        """
+        return self._scroll
+
+    def scroll_to_row(self, index: int) -> 'VirtualTable':
+        """
+        Scroll the view so that the given row is the first visible row (or the
+        last rows are visible).
+
+        :param index: Row index (counting from 0)
+        :return: Self reference
+        """
+        assert isinstance(index, int)
+        self._set_scroll(index * self._row_height)
+        return self
+
+    def _set_scroll(self, value: NumberType) -> bool:
+        """
+        Set the scroll of the rows view, and update the scrollbar.
+
+        :param value: Scroll value in px
+        :return: ``True`` if the scroll changed
+        """
+        value = int(max(0, min(value, self._max_scroll)))
+        if value == self._scroll:
+            return False
+        self._scroll = value
+        if self._max_scroll > 0 and self._scrollbar.get_value() != value:
+            self._scrollbar.set_value(value)
+        self._render()
+        return True
+
+    def _update_scroll_range(self) -> None:
+        """
+        Update the number of rows, the maximum scroll and the scrollbar range.
+        """
+        self._row_count = self.get_row_count()
+        self._max_scroll = max(0, self._row_count * self._row_height - self._height)
+        self._scroll = min(self._scroll, self._max_scroll)
+        if self._max_scroll > 0:
+            self._scrollbar.set_maximum(self._max_scroll)
+            self._scrollbar.set_page_step(self._height * self._max_scroll / (self._height + self._max_scroll))
+            self._scrollbar.set_value(self._scroll)
+
+    def _update_layout(self) -> None:
+        """
+        Compute the row height, the column widths and the cell pool. Requires the
+        font.
+        """
+        if self._font is None or self._rows is None:
+            return
+        self._rows_revision += 1
+        pad = self._cell_padding  # top, right, bottom, left
+        self._row_height = self._font.get_height() + pad[0] + pad[2]
+        self._update_scroll_range()
+
+        # Number of columns
+        if self._header is not None:
+            columns = len(self._header)
+        elif self._declared_column_widths is not None:
+            columns = len(self._declared_column_widths)
+        elif self._row_count > 0:
+            columns = len(self.get_row(0))
+        else:
+            columns = 0
+
+        # Compute the widths from the text of the header and a sample of rows,
+        # evenly spaced over the data source
+        widths = [0] * columns
+        if self._header is not None:
+            for j in range(columns):
+                widths[j] = self._font.size(self._header[j])[0]
+        sample = min(self._sample_size, self._row_count)
+        for i in range(sample):
+            index = i * (self._row_count - 1) // (sample - 1) if sample > 1 else 0
+            row = self.get_row(index)
+            for j in range(min(columns, len(row))):
+                widths[j] = max(widths[j], self._font.size(str(row[j]))[0])
+        for j in range(columns):
+            widths[j] += pad[1] + pad[3]
+            if self._declared_column_widths is not None and j < len(self._declared_column_widths) and \
+                    self._declared_column_widths[j] is not None:
+                widths[j] = self._declared_column_widths[j]
+        self._column_widths = widths
+        self._columns_width = sum(widths)
+
+        # Cell pool, one list of cells for each row which can be visible at
+        # the same time. The cells are created when a row is shown first
+        pool_size = self._height // max(1, self._row_height) + 2
+        self._cells = [None] * pool_size
+        self._slot_rows = [-1] * pool_size
+        self._header_cells = []
+        if self._header is not None:
+            font_color = self._font_color if self._header_font_color is None else self._header_font_color
+            for title in self._header:
+                self._header_cells.append(self._make_cell(font_color))
+                self._header_cells[-1].set_title(title)
+        self._render()
+
+    def _make_cell(self, font_color: ColorInputType) -> 'Label':
+        """
+        Create a cell label with the table font.
+
+        :param font_color: Font color
+        :return: Cell
+        """
+        cell = Label('', label_id=self._id + '+cell-label-' + uuid4(short=True))
+        cell.set_font(
+            antialias=self._font_antialias,
+            background_color=None,
+            color=font_color,
+            font=self._font_name,
+            font_size=self._font_size,
+            readonly_color=self._font_readonly_color,
+            readonly_selected_color=self._font_readonly_selected_color,
+            selected_color=self._font_selected_color
+        )
+        cell.set_padding(0)
+        cell.set_tab_size(self._tab_size)
+        cell.configured = True
+        return cell
+
+    def _get_row_cells(self, index: int) -> List['Label']:
+        """
+        Return the cells of a visible row. Each row uses the pool slot of its index,
+        thus the cells are only updated when a row enters the view.
+
+        :param index: Row index
+        :return: Cells
+        """
+        slot = index % len(self._cells)
+        if self._slot_rows[slot] != index:
+            if self._cells[slot] is None:
+                self._cells[slot] = [self._make_cell(self._font_color) for _ in self._column_widths]
+            row = self.get_row(index)
+            for j, cell in enumerate(self._cells[slot]):
+                cell.set_title(str(row[j]) if j < len(row) else '')
+            self._slot_rows[slot] = index
+        return self._cells[slot]
+
+    def _apply_font(self) -> None:
+        self._update_layout()
+
+    def scale(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def resize(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def set_max_width(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def set_max_height(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def rotate(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def flip(self, *args, **kwargs) -> 'VirtualTable':
+        raise WidgetTransformationNotImplemented()
+
+    def set_menu(self, menu: Optional['pygame_menu.Menu']) -> 'VirtualTable':
+        # The table receives the events even if not selected (mouse wheel)
+        menu_update_widgets = self._get_menu_update_widgets()
+        if self in menu_update_widgets:
+            menu_update_widgets.remove(self)
+        super(VirtualTable, self).set_menu(menu)
+        self._scrollbar.set_menu(menu)
+        menu_update_widgets = self._get_menu_update_widgets()
+        if menu is not None and self not in menu_update_widgets:
+            menu_update_widgets.append(self)
+        return self
+
+    def set_scrollarea(self, scrollarea: Optional['pygame_menu._scrollarea.ScrollArea']) -> None:
+        super(VirtualTable, self).set_scrollarea(scrollarea)
+        self._scrollbar.set_scrollarea(scrollarea)
+
+    def set_controls(self, *args, **kwargs) -> 'VirtualTable':
+        super(VirtualTable, self).set_controls(*args, **kwargs)
+        self._scrollbar.set_controls(*args, **kwargs)
+        return self
+
+    def set_position(self, x: NumberType, y: NumberType) -> 'VirtualTable':
+        super(VirtualTable, self).set_position(x, y)
+        self._scrollbar.set_position(self._rect.x + self._columns_width, self._rect.y + self._get_header_height())
+        return self
+
+    def _get_header_height(self) -> int:
+        """
+        Return the header height.
+
+        :return: Header height in px
+        """
+        return self._row_height if self._header is not None else 0
+
+    def _draw_cells(self, surface: 'pygame.Surface', cells: List['Label'], y: int, clip: 'pygame.Rect') -> None:
+        """
+        Draw the cells of a row.
+
+        :param surface: Surface to draw
+        :param cells: Cells of the row
+        :param y: Row y position
+        :param clip: Visible area of the row
+        """
+        pad = self._cell_padding  # top, right, bottom, left
+        surface_clip = surface.get_clip()
+        x = self._rect.x
+        for j, cell in enumerate(cells):
+            width = self._column_widths[j]
+            cell_clip = pygame.Rect(x, y, width, self._row_height).clip(clip)
+            if cell_clip.width > 0 and cell_clip.height > 0:
+                dx = pad[3]
+                if self._cell_align == ALIGN_CENTER:
+                    dx += int((width - pad[1] - pad[3] - cell.get_width()) / 2)
+                elif self._cell_align == ALIGN_RIGHT:
+                    dx += width - pad[1] - pad[3] - cell.get_width()
+                cell.set_position(x + dx, y + pad[0])
+                surface.set_clip(cell_clip)
+                cell.draw(surface)
+            x += width
+        surface.set_clip(surface_clip)
+
+    def _draw(self, surface: 'pygame.Surface') -> None:
+        if self._row_height == 0:
+            return
+        clip = surface.get_clip()
+        x, y = self._rect.x, self._rect.y
+
+        # Draw the header
+        header_height = self._get_header_height()
+        if header_height > 0:
+            header_rect = pygame.Rect(x, y, self._columns_width, header_height).clip(clip)
+            if self._header_background_color is not None:
+                surface.fill(self._header_background_color, header_rect)
+            self._draw_cells(surface, self._header_cells, y, header_rect)
+
+        # Draw the rows within the view
+        view = pygame.Rect(x, y + header_height, self._columns_width, self._height).clip(clip)
+        first, last = self.get_visible_rows()
+        row_y = y + header_height + first * self._row_height - self._scroll
+        for index in range(first, last):
+            row_rect = pygame.Rect(x, row_y, self._columns_width, self._row_height).clip(view)
+            background_color = self._row_background_color
+            if index % 2 == 1 and self._row_alternate_background_color is not None:
+                background_color = self._row_alternate_background_color
+            if background_color is not None:
+                surface.fill(background_color, row_rect)
+            self._draw_cells(surface, self._get_row_cells(index), row_y, row_rect)
+            row_y += self._row_height
+        surface.set_clip(clip)
+
+        # Draw the lines between the cells
+        if self._cell_border_width > 0:
+            surface.set_clip(pygame.Rect(x, y, self._columns_width, header_height + self._height).clip(clip))
+            line_x = x
+            for width in self._column_widths[:-1]:  # Vertical lines, until the last row
+                line_x += width
+                pygame.draw.line(surface, self._cell_border_color, (line_x, y), (line_x, row_y),
+                                 self._cell_border_width)
+            line_y = y + header_height + first * self._row_height - self._scroll
+            if header_height > 0:
+                pygame.draw.line(surface, self._cell_border_color, (x, y + header_height),
+                                 (x + self._columns_width, y + header_height), self._cell_border_width)
+            for _ in range(first, last):  # Horizontal lines, below each row
+                line_y += self._row_height
+                pygame.draw.line(surface, self._cell_border_color, (x, line_y),
+                                 (x + self._columns_width, line_y), self._cell_border_width)
+            surface.set_clip(clip)
+
+        # Draw the scrollbar
+        if self._max_scroll > 0:
+            self._scrollbar.draw(surface)
+
+    # noinspection PyProtectedMember
+    def _render(self) -> Optional[bool]:
+        if self._row_height == 0:
+            return False
+
+        if not self._render_hash_changed(self._scroll, self._row_count, self._columns_width, self._row_height,
+                                         self._rows_revision, self._visible, self._scrollbar.scrolling,
+                                         self._scrollbar._mouseover):
+            return True
+
+        self._rect.width = self._columns_width + self._scrollbar.get_thickness()
+        self._rect.height = self._get_header_height() + self._height
+
+        # Finals
+        self.force_menu_surface_update()
+
+    def update(self, events: EventVectorType) -> bool:
+        self.apply_update_callbacks(events)
+
+        if self.readonly or not self.is_visible() or self._max_scroll == 0:
+            return False
+
+        updated = False
+        scrollbar_events = []
+        for event in events:
+
+            # Mouse wheel over the table
+            if (
+                event.type == pygame.MOUSEBUTTONDOWN and
+                self._mouse_enabled and
+                event.button in (4, 5)
+            ):
+                if self.get_rect(to_real_position=True).collidepoint(*event.pos):
+                    direction = -1 if event.button == 4 else 1
+                    if self._set_scroll(self._scroll + direction * VIRTUAL_TABLE_WHEEL_ROWS * self._row_height):
+                        updated = True
+                continue
+
+            scrollbar_events.append(event)
+
+        # Drag or click the scrollbar
+        if self._scrollbar.update(scrollbar_events):
+            self._set_scroll(self._scrollbar.get_value())
+            updated = True
+        self._render()  # The scrollbar may change its hover status
+
+        return updated
+
+
+class VirtualTableManager(AbstractWidgetManager, ABC):
+    """
+    VirtualTable manager.
+    """
+
+    def virtual_table(
+        self,
+        rows: VirtualTableRowsType,
+        height: int = 200,
+        row_count: Optional[int] = None,
+        header: Optional[Sequence[Any]] = None,
+        column_widths: Optional[Sequence[Optional[int]]] = None,
+        sample_size: int = 100,
+        table_id: str = '',
+        **kwargs
+    ) -> 'pygame_menu.widgets.VirtualTable':
+        """
+        Adds a VirtualTable to the Menu, which shows the rows of a data source
+        (a sequence of rows, or a function which returns the row of an index)
+        within a view with a vertical scrollbar. Only the rows within the view
+        are rendered, thus, it can show thousands of rows (leaderboards,
+        histories, etc.).
+
+        .. code-block:: python
+
+            table = menu.add.virtual_table(scores, height=300, header=('Player', 'Kills', 'Deaths'))
+
+        kwargs (Optional)
+            - ``align``                           (str) – Widget `alignment <https://pygame-menu.readthedocs.io/en/latest/_source/themes.html#alignment>`_
+            - ``background_color``                (tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`) – Color of the background. ``None`` for no-color
+            - ``border_color``                    (tuple, list, str, int, :py:class:`pygame.Color`) – Widget border color. ``None`` for no-color
+            - ``border_width``                    (int) – Border width in px. If ``0`` disables the border
+            - ``cell_align``                      (str) – Horizontal align of each cell. See :py:mod:`pygame_menu.locals`
+            - ``cell_border_color``               (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the lines between the cells
+            - ``cell_border_width``               (int) – Width of the lines between the cells in px. If ``0`` the lines are not drawn
+            - ``cell_padding``                    (int, float, tuple, list) – Padding of each cell according to CSS rules. General shape: (top, right, bottom, left)
+            - ``font_color``                      (tuple, list, str, int, :py:class:`pygame.Color`) – Widget font color
+            - ``font_name``                       (str, :py:class:`pathlib.Path`, :py:class:`pygame.font.Font`) – Widget font path
+            - ``font_size``                       (int) – Font size of the widget
+            - ``header_background_color``         (tuple, list, str, int, :py:class:`pygame.Color`) – Background color of the header. ``None`` for no-color
+            - ``header_font_color``               (tuple, list, str, int, :py:class:`pygame.Color`) – Font color of the header
+            - ``margin``                          (tuple, list) – Widget (left, bottom) margin in px
+            - ``padding``                         (int, float, tuple, list) – Widget padding according to CSS rules. General shape: (top, right, bottom, left)
+            - ``row_alternate_background_color``  (tuple, list, str, int, :py:class:`pygame.Color`) – Background color of the odd rows
+            - ``row_background_color``            (tuple, list, str, int, :py:class:`pygame.Color`) – Background color of the rows. ``None`` for no-color
+            - ``scrollbar_color``                 (tuple, list, str, int, :py:class:`pygame.Color`) – Scrollbar color
+            - ``scrollbar_slider_color``          (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the slider
+            - ``scrollbar_slider_hover_color``    (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the slider if hovered or clicked
+            - ``scrollbar_slider_pad``            (int, float) – Space between slider and scrollbar borders in px
+            - ``scrollbar_thick``                 (int) – Scrollbar thickness in px
+
+        .. note::
+
+            All theme-related optional kwargs use the default Menu theme if not
+            defined.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply to
+            :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param rows: Sequence of rows, or function which returns the row of an index
+        :param height: Height of the rows view in px (without the header)
+        :param row_count: Number of rows. Required if ``rows`` is a function
+        :param header: Title of each column, drawn above the rows. If ``None`` the table has no header
+        :param column_widths: Width of each column in px. The ``None`` columns (or all, if ``None``) are computed from a sample of the rows
+        :param sample_size: Number of rows (evenly spaced over the data source) used to compute the column widths
+        :param table_id: ID of the table
+        :param kwargs: Optional keyword arguments
+        :return: Widget object
+        :rtype: :py:class:`pygame_menu.widgets.VirtualTable`
+        """
+        attributes = self._filter_widget_attributes(kwargs)
+
+        widget = VirtualTable(
+            rows=rows,
+            height=height,
+            row_count=row_count,
+            header=header,
+            column_widths=column_widths,
+            sample_size=sample_size,
+            table_id=table_id,
+            cell_align=kwargs.pop('cell_align', ALIGN_LEFT),
+            cell_border_color=kwargs.pop('cell_border_color', self._theme.widget_font_color),
+            cell_border_width=kwargs.pop('cell_border_width', 1),
+            cell_padding=kwargs.pop('cell_padding', (2, 6)),
+            header_background_color=kwargs.pop('header_background_color', None),
+            header_font_color=kwargs.pop('header_font_color', None),
+            row_background_color=kwargs.pop('row_background_color', None),
+            row_alternate_background_color=kwargs.pop('row_alternate_background_color', None),
+            scrollbar_color=kwargs.pop('scrollbar_color', self._theme.scrollbar_color),
+            scrollbar_slider_color=kwargs.pop('scrollbar_slider_color', self._theme.scrollbar_slider_color),
+            scrollbar_slider_hover_color=kwargs.pop('scrollbar_slider_hover_color',
+                                                    self._theme.scrollbar_slider_hover_color),
+            scrollbar_slider_pad=kwargs.pop('scrollbar_slider_pad', self._theme.scrollbar_slider_pad),
+            scrollbar_thick=kwargs.pop('scrollbar_thick', self._theme.scrollbar_thick)
+        )
+
+        self._configure_widget(widget=widget, **attributes)
+        self._append_widget(widget)
+        self._check_kwargs(kwargs)
+
+        return widget
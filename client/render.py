@@ -0,0 +1,100 @@
+# Description: This file contains the dirty rectangle renderer of the client screens.
+# Instead of redrawing and flipping the whole screen every frame, the screens mark the regions they changed,
+# and only these regions are sent to the display. When nothing changes, the frame loop sleeps until an event arrives.
+
+from __future__ import annotations
+
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Track the regions of the screen changed since the last frame, and update only them.
+
+    Attributes:
+    - surface: pygame.Surface - The display surface.
+    - fps: int - The maximum number of frames per second.
+    - idle_timeout: int - The maximum time (in ms) to sleep waiting for an event when nothing changes.
+    - clock: pygame.time.Clock - The clock capping the frame rate.
+    - profiler: FrameProfiler | None - The frame profiler, its 'flip' and 'idle' phases are measured here.
+
+    Methods:
+    - invalidate(rect: pygame.Rect | None) - Mark a region (or the whole screen) as changed.
+    - is_dirty() -> bool - Check if a region changed since the last frame.
+    - get_events() -> list - Get the events, sleeping until one arrives if nothing changed.
+    - flush() - Update the changed regions of the display and cap the frame rate.
+    """
+
+    def __init__(self, surface: pygame.Surface, fps: int = 60, idle_timeout: int = 250, profiler=None) -> None:
+        """
+        Initialize the renderer.
+
+        Parameters:
+        - surface: pygame.Surface - The display surface.
+        - fps: int - The maximum number of frames per second.
+        - idle_timeout: int - The maximum time (in ms) to sleep waiting for an event when nothing changes.
+        - profiler: FrameProfiler | None - The frame profiler (see profiler.py).
+        """
+        self.surface = surface
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.profiler = profiler
+        self._rects: list[pygame.Rect] = list() # The changed regions of the current frame
+        self._full = True # The whole screen must be updated (first frame)
+
+    def invalidate(self, rect: pygame.Rect | None = None) -> None:
+        """
+        Mark a region as changed.
+
+        Parameters:
+        - rect: pygame.Rect | None - The changed region, or None for the whole screen.
+        """
+        if rect is None:
+            self._full = True
+        else:
+            self._rects.append(pygame.Rect(rect))
+
+    def is_dirty(self) -> bool:
+        """
+        Check if a region changed since the last frame.
+        """
+        return self._full or bool(self._rects)
+
+    def get_events(self) -> list[pygame.event.Event]:
+        """
+        Get the events of the frame.
+
+        If nothing changed since the last frame and no event is pending, sleep until an event arrives
+        (or the idle timeout expires), so a static screen does not use the CPU.
+
+        Returns:
+        - list[pygame.event.Event] - The events.
+        """
+        events = pygame.event.get()
+        if events or self.is_dirty():
+            return events
+        if self.profiler is not None:
+            self.profiler.mark('events')
+        event = pygame.event.wait(self.idle_timeout)
+        if self.profiler is not None: # The sleep is not counted in the event pump
+            self.profiler.mark('idle')
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def flush(self) -> None:
+        """
+        Update the changed regions of the display, then cap the frame rate.
+        """
+        if self._full:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+        self._full = False
+        self._rects.clear()
+        if self.profiler is not None:
+            self.profiler.mark('flip')
+        self.clock.tick(self.fps)
+        if self.profiler is not None:
+            self.profiler.mark('idle')
@@ -0,0 +1,160 @@
+# Description: This file contains the cache of the rotated sprites (weapons and soldiers aiming at the mouse).
+# The aim angle is rounded to ANGLE_STEP degrees, and each rotated sprite is rendered the first time it is used, then
+# reused while it stays in the cache. The cache is bounded in memory: the least recently used sprites are dropped.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+from animation import quantize_angle, slice_sheet
+from assets import AssetManager, assets as default_assets
+
+ANGLE_STEP = 2 # The precision of the rotations, in degrees
+
+
+class RotationCache:
+    """
+    LRU cache of rotated sprites.
+
+    Attributes:
+    - manager: AssetManager - The asset manager loading and scaling the sprites.
+    - step: int - The precision of the rotations, in degrees.
+    - max_bytes: int - The maximum memory used by the rotated sprites, in bytes.
+    - bytes: int - The memory used by the rotated sprites, in bytes.
+    - hits: int - The number of sprites found in the cache.
+    - misses: int - The number of sprites rotated.
+    - evictions: int - The number of sprites dropped to stay under max_bytes.
+
+    Methods:
+    - quantize(angle: float) -> int - Round an angle to the precision of the cache.
+    - get(path: str, angle: float, size: tuple, flip: bool, frame: int) -> pygame.Surface - Get a rotated sprite.
+    - draw(surface: pygame.Surface, path: str, center: tuple, angle: float, size: tuple, flip: bool, frame: int) ->
+    pygame.Rect - Draw a rotated sprite around its center.
+    - stats() -> dict - Get the usage metrics of the cache.
+    - clear() - Forget every rotated sprite.
+    """
+
+    def __init__(
+        self, manager: AssetManager = default_assets, step: int = ANGLE_STEP, max_bytes: int = 32 * 1024 * 1024
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Parameters:
+        - manager: AssetManager - The asset manager loading and scaling the sprites.
+        - step: int - The precision of the rotations, in degrees.
+        - max_bytes: int - The maximum memory used by the rotated sprites, in bytes.
+        """
+        self.manager = manager
+        self.step = step
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sprites: OrderedDict[tuple, pygame.Surface] = OrderedDict() # (path, size, angle, flip, frame) -> sprite
+
+    def quantize(self, angle: float) -> int:
+        """
+        Round an angle to the precision of the cache.
+
+        Parameters:
+        - angle: float - The angle, in degrees (counterclockwise, like pygame.transform.rotate).
+
+        Returns:
+        - int - The rounded angle, between 0 and 360 (excluded).
+        """
+        return quantize_angle(angle, self.step)
+
+    def get(
+        self, path: str, angle: float, size: tuple[int, int] | None = None, flip: bool = False,
+        frame: int | None = None
+    ) -> pygame.Surface:
+        """
+        Get a rotated sprite, rotating it the first time.
+
+        Parameters:
+        - path: str - The path of the sprite.
+        - angle: float - The angle, in degrees (rounded to the precision of the cache).
+        - size: tuple[int, int] | None - The size of the sprite before the rotation, or None to keep its size.
+        - flip: bool - Flip the sprite vertically before the rotation (a weapon aiming to the left stays upright).
+        - frame: int | None - The index of the frame to rotate if the sprite is a strip of square frames, or None to
+        rotate the whole sprite.
+
+        Returns:
+        - pygame.Surface - The rotated sprite. It is shared, do not draw on it.
+        """
+        angle = self.quantize(angle)
+        key = (path, size, angle, flip, frame)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key) # Most recently used
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self.manager.load(path) if size is None else self.manager.scaled(path, size)
+        if frame is not None:
+            sprite = slice_sheet(sprite)[frame]
+        if flip:
+            sprite = pygame.transform.flip(sprite, False, True)
+        if angle:
+            sprite = pygame.transform.rotate(sprite, angle)
+        elif not flip:
+            sprite = sprite.copy() # The cached sprite is owned by the cache, so evicting it frees its memory
+        self._sprites[key] = sprite
+        self.bytes += sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+        while self.bytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False) # Least recently used
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return sprite
+
+    def draw(
+        self, surface: pygame.Surface, path: str, center: tuple[float, float], angle: float,
+        size: tuple[int, int] | None = None, flip: bool = False, frame: int | None = None
+    ) -> pygame.Rect:
+        """
+        Draw a rotated sprite around its center.
+
+        Parameters:
+        - surface: pygame.Surface - The surface to draw on.
+        - path: str - The path of the sprite.
+        - center: tuple - The position of the center of the sprite on the surface.
+        - angle: float - The angle, in degrees.
+        - size: tuple[int, int] | None - The size of the sprite before the rotation.
+        - flip: bool - Flip the sprite vertically before the rotation.
+        - frame: int | None - The index of the frame to rotate if the sprite is a strip of square frames.
+
+        Returns:
+        - pygame.Rect - The rectangle drawn.
+        """
+        sprite = self.get(path, angle, size, flip, frame)
+        return surface.blit(sprite, sprite.get_rect(center=(round(center[0]), round(center[1]))))
+
+    def stats(self) -> dict:
+        """
+        Get the usage metrics of the cache.
+
+        Returns:
+        - dict - The number of sprites, the memory used, the hits, misses and evictions.
+        """
+        return {
+            'sprites': len(self._sprites),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def clear(self) -> None:
+        """
+        Forget every rotated sprite (for example when the display mode changes).
+        """
+        self._sprites.clear()
+        self.bytes = 0
+
+
+rotations = RotationCache() # The rotation cache shared by the client
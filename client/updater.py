@@ -0,0 +1,293 @@
+# Description: This file contains the updater of the game files.
+# The server publishes a manifest of the game files, with the BLAKE2 hash of each chunk of each file.
+# The client keeps a local index of the hashes of its own files, keyed by their modification time and size, so an
+# unchanged file is never hashed again: checking for updates costs one stat call per file. Only the chunks which differ
+# from the manifest are downloaded, over the socket of the client.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+ASSETS_DIR = '../assets' # The game files, relative to the client folder
+INDEX_PATH = 'asset_index.json' # The local hash index
+DIGEST_SIZE = 16
+
+
+def hash_chunks(path: str, chunk_size: int) -> list[str]:
+    """
+    Hash the chunks of a file (same hashes as the manifest of the server).
+
+    Parameters:
+    - path: str - The path of the file.
+    - chunk_size: int - The size of the chunks.
+
+    Returns:
+    - list[str] - The hexadecimal BLAKE2 digest of each chunk.
+    """
+    hashes = list()
+    with open(path, 'rb') as file:
+        while chunk := file.read(chunk_size):
+            hashes.append(hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).hexdigest())
+    return hashes
+
+
+def manifest_digest(files: list[dict]) -> str:
+    """
+    Hash a whole list of files, sorted by path (same digest as the manifest of the server).
+
+    Parameters:
+    - files: list[dict] - The files, with their path, size and chunks.
+
+    Returns:
+    - str - The hexadecimal BLAKE2 digest.
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for file in files:
+        digest.update(file['path'].encode('utf-8'))
+        digest.update(str(file['size']).encode('utf-8'))
+        for chunk in file['chunks']:
+            digest.update(chunk.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class HashIndex:
+    """
+    Local index of the hashes of the game files.
+
+    Attributes:
+    - path: str - The path of the index file.
+    - chunk_size: int - The size of the chunks of the hashes.
+    - hashed: int - The number of files hashed since the index was loaded.
+    - listed: list | None - The paths listed by the last manifest of the server, None before the first manifest.
+
+    Methods:
+    - chunks(root: str, relative: str) -> dict - Get the size and chunks of a file, hashing it only if it changed.
+    - files(root: str) -> list - Get the size and chunks of every game file of a folder.
+    - set_listed(paths: list[str]) - Set the paths listed by the manifest of the server.
+    - save() - Save the index, if it changed.
+    """
+
+    def __init__(self, path: str = INDEX_PATH, chunk_size: int = 64 * 1024) -> None:
+        """
+        Load the index. The index is reset if it was built with another chunk size.
+
+        Parameters:
+        - path: str - The path of the index file.
+        - chunk_size: int - The size of the chunks of the hashes.
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.hashed = 0
+        self.listed: list[str] | None = None
+        self._entries: dict[str, dict] = dict() # relative path -> {mtime, size, chunks}
+        self._changed = False
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            self.listed = data.get('listed')
+            if data.get('chunk_size') == chunk_size:
+                self._entries = data['files']
+        except (OSError, ValueError, KeyError):
+            pass # No index yet (or a broken one), every file will be hashed
+
+    def chunks(self, root: str, relative: str) -> dict:
+        """
+        Get the size and the chunk hashes of a file, hashing it only if its modification time or size changed.
+
+        Parameters:
+        - root: str - The folder of the game files.
+        - relative: str - The path of the file, relative to the root, with '/' separators.
+
+        Returns:
+        - dict - The path, size and chunks of the file.
+        """
+        path = os.path.join(root, *relative.split('/'))
+        stat = os.stat(path)
+        entry = self._entries.get(relative)
+        if entry is None or entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'chunks': hash_chunks(path, self.chunk_size)}
+            self._entries[relative] = entry
+            self._changed = True
+            self.hashed += 1
+        return {'path': relative, 'size': entry['size'], 'chunks': entry['chunks']}
+
+    def files(self, root: str) -> list[dict]:
+        """
+        Get the size and the chunk hashes of every game file of a folder, sorted by path.
+
+        The files the server does not list (once a manifest was received) are not game files, they would change the
+        digest of the folder and force a download of the manifest. The '.part' files left by an interrupted update are
+        deleted.
+
+        Parameters:
+        - root: str - The folder of the game files.
+
+        Returns:
+        - list[dict] - The files.
+        """
+        listed = set(self.listed) if self.listed is not None else None
+        files = list()
+        for directory, _, names in os.walk(root):
+            for name in names:
+                if name.endswith('.part'):
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass
+                    continue
+                relative = os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/')
+                if listed is not None and relative not in listed:
+                    continue
+                files.append(self.chunks(root, relative))
+        files.sort(key=lambda file: file['path'])
+        present = {file['path'] for file in files}
+        for relative in [relative for relative in self._entries if relative not in present]:
+            del self._entries[relative] # Removed files
+            self._changed = True
+        return files
+
+    def set_listed(self, paths: list[str]) -> None:
+        """
+        Set the paths listed by the manifest of the server, the other files are not game files.
+
+        Parameters:
+        - paths: list[str] - The paths of the files, relative to the root, with '/' separators.
+        """
+        if paths != self.listed:
+            self.listed = list(paths)
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Save the index, if it changed.
+        """
+        if not self._changed:
+            return
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({'chunk_size': self.chunk_size, 'files': self._entries, 'listed': self.listed}, file)
+        self._changed = False
+
+
+class Updater:
+    """
+    Download the game files which differ from the manifest of the server.
+
+    The exchange with the server is:
+    - UPDATE MANIFEST <local digest> -> MANIFEST OK, or MANIFEST <size> followed by the JSON manifest.
+    - UPDATE CHUNK <file index> <chunk index> -> CHUNK <size> followed by the content of the chunk.
+
+    Attributes:
+    - client: Client - The client, connected to the server.
+    - root: str - The folder of the game files.
+    - downloaded: int - The number of bytes downloaded.
+    - updated: list - The paths of the files replaced.
+
+    Methods:
+    - run() -> bool - Check the game files and download the changed chunks.
+    """
+
+    def __init__(self, client, root: str = ASSETS_DIR, index_path: str = INDEX_PATH) -> None:
+        """
+        Initialize the updater.
+
+        Parameters:
+        - client: Client - The client, connected to the server.
+        - root: str - The folder of the game files.
+        - index_path: str - The path of the local hash index.
+        """
+        self.client = client
+        self.root = root
+        self.index_path = index_path
+        self.downloaded = 0
+        self.updated: list[str] = list()
+
+    def run(self) -> bool:
+        """
+        Check the game files and download the changed chunks.
+
+        Returns:
+        - bool - True if the game files are up to date.
+        """
+        index = HashIndex(self.index_path)
+        local = index.files(self.root)
+        index.save()
+
+        try:
+            self.client.send(f'UPDATE MANIFEST {manifest_digest(local)}')
+            payload = self.client.receive_payload('MANIFEST')
+            if payload is None: # Nothing changed
+                return True
+            return self._update(index, local, json.loads(payload.decode('utf-8')))
+        except (ConnectionError, ValueError) as e:
+            print(f'[DBG] from updater.py.Updater.run : update failed ({e!r})')
+            return False
+
+    def _update(self, index: HashIndex, local: list[dict], manifest: dict) -> bool:
+        """
+        Download the files which differ from the manifest.
+
+        Parameters:
+        - index: HashIndex - The local hash index.
+        - local: list[dict] - The local files.
+        - manifest: dict - The manifest of the server.
+
+        Returns:
+        - bool - True if the game files are up to date.
+        """
+        if manifest['chunk_size'] != index.chunk_size:
+            index = HashIndex(self.index_path, manifest['chunk_size'])
+            local = index.files(self.root)
+        index.set_listed([remote['path'] for remote in manifest['files']])
+        local_files = {file['path']: file for file in local}
+
+        for file_index, remote in enumerate(manifest['files']):
+            current = local_files.get(remote['path'])
+            if current is not None and current['size'] == remote['size'] and current['chunks'] == remote['chunks']:
+                continue
+            if not self._update_file(file_index, remote, current, manifest['chunk_size']):
+                return False
+            index.chunks(self.root, remote['path']) # Index the new version
+        index.save()
+        return True
+
+    def _update_file(self, file_index: int, remote: dict, current: dict | None, chunk_size: int) -> bool:
+        """
+        Download the changed chunks of a file, and replace it.
+
+        Parameters:
+        - file_index: int - The index of the file in the manifest.
+        - remote: dict - The file in the manifest.
+        - current: dict | None - The local file, or None if it is missing.
+        - chunk_size: int - The size of the chunks.
+
+        Returns:
+        - bool - False if a chunk could not be downloaded.
+        """
+        path = os.path.join(self.root, *remote['path'].split('/'))
+        local_chunks = current['chunks'] if current is not None else []
+        print(f"[DBG] from updater.py.Updater._update_file : updating {remote['path']}")
+
+        chunks = list()
+        with open(path, 'rb') if current is not None else open(os.devnull, 'rb') as file:
+            for chunk_index, digest in enumerate(remote['chunks']):
+                if chunk_index < len(local_chunks) and local_chunks[chunk_index] == digest: # Unchanged chunk
+                    file.seek(chunk_index * chunk_size)
+                    chunks.append(file.read(chunk_size))
+                    continue
+                self.client.send(f'UPDATE CHUNK {file_index} {chunk_index}')
+                data = self.client.receive_payload('CHUNK')
+                if data is None or hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest() != digest:
+                    print(f"[DBG] from updater.py.Updater._update_file : broken chunk {chunk_index} of {remote['path']}")
+                    return False
+                self.downloaded += len(data)
+                chunks.append(data)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = path + '.part'
+        with open(temporary, 'wb') as file:
+            file.write(b''.join(chunks))
+        os.replace(temporary, path)
+        self.updated.append(path)
+        return True
@@ -0,0 +1,99 @@
+"""
+Benchmark of the animations.
+
+Plays 300 simultaneous explosions (rotated and flipped like the shells of
+the soldiers aiming in every direction), restarted when they end, and prints
+the time spent per frame:
+- naive: each effect slices its frame from the sprite sheet, then flips and
+  rotates it, and blits it alone.
+- cached: the frames come from the frame cache, blitted one by one.
+- pool: the EffectPool (cached frames, fixed clock, one Surface.blits call).
+
+Run it from the root of the repository:
+    python dev_tools/bench_animation.py
+"""
+import sys
+import os
+import time
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+os.chdir('client') # The assets are loaded relatively to the client folder
+
+import pygame
+
+FRAMES = 300
+EXPLOSIONS = 300
+DT = 1 / 60
+
+
+def naive(surface, sheet, explosions, frame):
+    size = sheet.get_width()
+    count = sheet.get_height() // size
+    for x, y, angle, flip, start in explosions:
+        index = (frame + start) % count
+        image = sheet.subsurface((0, index * size, size, size))
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        image = pygame.transform.rotate(image, angle)
+        surface.blit(image, (x - image.get_width() / 2, y - image.get_height() / 2))
+
+
+def cached(surface, cache, path, explosions, frame):
+    for x, y, angle, flip, start in explosions:
+        frames = cache.frames(path, angle, flip)
+        image = frames[(frame + start) % len(frames)]
+        surface.blit(image, (x - image.get_width() / 2, y - image.get_height() / 2))
+
+
+def measure(surface, draw):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        surface.fill((40, 40, 60))
+        draw(frame)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((1280, 720))
+    from animation import FrameCache, ANGLE_STEP
+    from assets import assets
+    from effects import EffectPool, EFFECT_SHEETS
+
+    random.seed(0)
+    path = EFFECT_SHEETS['explosion'][0]
+    explosions = [
+        (random.uniform(0, 1280), random.uniform(0, 720), random.uniform(0, 360), random.random() < 0.5,
+         random.randrange(4))
+        for _ in range(EXPLOSIONS)
+    ]
+    sheet = assets.load(path)
+
+    print(f'{EXPLOSIONS} explosions, {FRAMES} frames')
+    print(f'naive  : {measure(surface, lambda frame: naive(surface, sheet, explosions, frame)):.3f} ms/frame')
+
+    cache = FrameCache()
+    start = time.perf_counter()
+    for angle in range(0, 360, ANGLE_STEP):
+        cache.frames(path, angle, False)
+        cache.frames(path, angle, True)
+    print(f'cache warm-up ({360 // ANGLE_STEP * 2} variants): {(time.perf_counter() - start) * 1000:.1f} ms')
+    print(f'cached : {measure(surface, lambda frame: cached(surface, cache, path, explosions, frame)):.3f} ms/frame')
+
+    pool = EffectPool(cache=cache)
+    length = len(cache.frames(path)) * pool.ticks_per_frame['explosion']
+
+    def play(frame):
+        if frame % length == 0: # The explosions of the previous wave are over
+            for x, y, angle, flip, _ in explosions:
+                pool.spawn('explosion', x, y, angle=angle, flip=flip)
+        pool.update(DT)
+        pool.draw(surface)
+
+    print(f'pool   : {measure(surface, play):.3f} ms/frame ({pool.stats()["high_water"]} effects at most)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark of the asset manager.
+
+Compares the lobby scene (background, shop button, hotbar and 200 small
+sprites) drawn with images loaded like before (background never converted,
+one surface per sprite) and with the images of the AssetManager.
+
+Run it from the root of the repository:
+    python dev_tools/bench_assets.py
+"""
+import sys
+import os
+import time
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+os.chdir('client') # The assets are loaded relatively to the client folder
+
+import pygame
+
+FRAMES = 200
+SPRITES = 200
+
+
+def draw(surface, background, buttons, sprites, positions):
+    surface.blit(background, (0, 0))
+    for image, position in buttons:
+        surface.blit(image, position)
+    for sprite, position in zip(sprites, positions):
+        surface.blit(sprite, position)
+
+
+def measure(surface, *scene):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(surface, *scene)
+    return FRAMES / (time.perf_counter() - start)
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((1920, 1080))
+    from assets import AssetManager, ASSETS_DIR
+
+    small = [os.path.join(ASSETS_DIR, name) for name in ('crossair.png', 'bazooka.png', 'grenade.png',
+                                                         'mine.png', 'shell.png', 'build.png', 'ping.png')]
+    random.seed(0)
+    paths = [random.choice(small) for _ in range(SPRITES)]
+    positions = [(random.randrange(1900), random.randrange(1060)) for _ in range(SPRITES)]
+
+    # Before: loaded on each lobby entry, background not converted
+    start = time.perf_counter()
+    background = pygame.transform.scale(pygame.image.load('../assets/lobby.png'), (1920, 1080))
+    buttons = [(pygame.image.load('../assets/shop_button.png').convert_alpha(), (0, 0)),
+               (pygame.image.load('../assets/hotbar.png').convert_alpha(), (710, 830))]
+    sprites = [pygame.image.load(path) for path in paths]
+    load_before = time.perf_counter() - start
+    before = measure(surface, background, buttons, sprites, positions)
+
+    # After: converted, cached, atlas packed
+    manager = AssetManager()
+    start = time.perf_counter()
+    background = manager.scaled('../assets/lobby.png', (1920, 1080), alpha=False)
+    buttons = [(manager.load('../assets/shop_button.png'), (0, 0)), (manager.load('../assets/hotbar.png'), (710, 830))]
+    manager.pack(small)
+    sprites = [manager.sprite(path) for path in paths]
+    load_after = time.perf_counter() - start
+    start = time.perf_counter()
+    manager.scaled('../assets/lobby.png', (1920, 1080), alpha=False) # Second lobby entry
+    reload_after = time.perf_counter() - start
+    after = measure(surface, background, buttons, sprites, positions)
+
+    print(f'before: load {load_before * 1000:.1f} ms, {before:.0f} frames/s')
+    print(f'after:  load {load_after * 1000:.1f} ms (next entry {reload_after * 1000:.3f} ms), {after:.0f} frames/s')
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark of the cache of the decorators.
+
+Adds 300 static decorations and a callable to a button, with the decorator
+cache enabled, then moves the button every frame and prints the time spent
+to draw its decorations. Also adds them to the scroll area of a menu, and
+redraws its widgets every frame. Prints the number of calls of the callable.
+
+Run it from the root of the repository:
+    python dev_tools/bench_decorator.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 100
+DECORATIONS = 300
+
+
+def decorate(decorator, calls):
+    decorator.cache = True
+    for index in range(DECORATIONS):
+        x, y = index % 30 * 4 - 60, index // 30 * 4 - 20
+        decorator.add_circle(x, y, 3, (255, 10 * (index % 25), 0), True)
+    decorator.add_callable(lambda surface, obj: calls.append(obj))
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    import pygame_menu
+
+    menu = pygame_menu.Menu('Decorations', *surface.get_size(), theme=pygame_menu.themes.THEME_DARK)
+    button = menu.add.button('Decorated')
+    calls = []
+    decorate(button.get_decorator(), calls)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        button.set_position(300 + frame % 10, 200 + frame % 7)
+        button.get_decorator().draw_prev(surface)
+    print(f'moving button         : {(time.perf_counter() - start) / FRAMES * 1000:8.3f} ms/frame, '
+          f'callable called {len(calls)} times')
+
+    menu = pygame_menu.Menu('Decorations', *surface.get_size(), theme=pygame_menu.themes.THEME_DARK)
+    for index in range(10):
+        menu.add.button(f'Button {index}')
+    calls = []
+    decorate(menu.get_scrollarea().get_decorator(), calls)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        menu.force_surface_cache_update()
+        menu.draw(surface)
+    print(f'menu widgets redrawn  : {(time.perf_counter() - start) / FRAMES * 1000:8.3f} ms/frame, '
+          f'callable called {len(calls)} times')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of the font loading of the menus at startup.
+
+Each measure runs in a new process (cold start): imports pygame_menu, then
+builds a menu of 90 widgets using the fonts of the themes, and a system font
+(the first one listed by pygame, if the platform has any). The system font is
+loaded once without the font paths file (first run) and once with it (next
+runs). Also prints the time of a get_font call once the font is loaded.
+
+Run it from the root of the repository:
+    python dev_tools/bench_font_startup.py
+"""
+import sys
+import os
+import subprocess
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+CHILD = """
+import time
+start = time.perf_counter()
+import pygame
+import pygame_menu
+pygame.init()
+surface = pygame.display.set_mode((800, 600))
+imported = time.perf_counter()
+system_fonts = pygame.font.get_fonts()
+if system_fonts:
+    pygame_menu.font.get_font(system_fonts[0], 20)
+system = time.perf_counter()
+menu = pygame_menu.Menu('Login', 800, 600, theme=pygame_menu.themes.THEME_DARK)
+for index in range(30):
+    menu.add.button(f'Button {index}')
+    menu.add.text_input('Name: ', font_name=pygame_menu.font.FONT_OPEN_SANS)
+    menu.add.label('Label', font_name=pygame_menu.font.FONT_BEBAS)
+menu.draw(surface)
+built = time.perf_counter()
+print(len(system_fonts), imported - start, system - imported, built - system)
+"""
+
+
+def run(paths_file):
+    env = dict(os.environ, PYGAME_MENU_FONT_CACHE=paths_file, PYGAME_HIDE_SUPPORT_PROMPT='1',
+               PYGAME_MENU_HIDE_VERSION='1', PYTHONPATH=os.path.join(os.getcwd(), 'client'))
+    output = subprocess.run([sys.executable, '-W', 'ignore', '-c', CHILD], env=env, check=True,
+                            capture_output=True, text=True).stdout.split()
+    return int(output[0]), [float(value) * 1000 for value in output[1:]]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        paths_file = os.path.join(directory, 'fonts.json')
+        for title in ('first run (no font paths file)', 'next run (font paths file)  '):
+            system_fonts, (imported, system, built) = run(paths_file)
+            system = f'{system:8.1f} ms' if system_fonts else '     n/a (no system font on this platform)'
+            print(f'{title}: import {imported:7.1f} ms, system font {system}, menu {built:7.1f} ms')
+
+    import pygame
+    import pygame_menu
+    pygame.font.init()
+    pygame_menu.font.get_font(pygame_menu.font.FONT_OPEN_SANS, 20)
+    calls = 100000
+    start = time.perf_counter()
+    for _ in range(calls):
+        pygame_menu.font.get_font(pygame_menu.font.FONT_OPEN_SANS, 20)
+    print(f'get_font of a loaded font: {(time.perf_counter() - start) / calls * 1e6:.3f} us/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of the drawing of the images of the menus.
+
+Draws the wallpaper example as a 1280x720 background and as a 320x180
+thumbnail every frame (IMAGE_MODE_FILL at two sizes), then a small tile
+repeated over 1280x720 (IMAGE_MODE_REPEAT_XY), and prints the time spent
+per frame. Also draws the background of 20 copies of the same image, with
+and without sharing their scaled surfaces.
+
+Run it from the root of the repository:
+    python dev_tools/bench_image_draw.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 100
+COPIES = 20
+
+
+def measure(draw):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((1280, 720))
+    import pygame_menu
+    from pygame_menu.baseimage import IMAGE_EXAMPLE_WALLPAPER, IMAGE_EXAMPLE_METAL, IMAGE_MODE_REPEAT_XY
+    thumbnail = pygame.Rect(0, 0, 320, 180)
+
+    image = pygame_menu.BaseImage(IMAGE_EXAMPLE_WALLPAPER)
+    print(f'fill, background + thumbnail: {measure(lambda: (image.draw(surface), image.draw(surface, thumbnail))):8.3f} ms/frame')
+
+    tile = pygame_menu.BaseImage(IMAGE_EXAMPLE_METAL, drawing_mode=IMAGE_MODE_REPEAT_XY).resize(32, 32)
+    print(f'repeat xy, 32x32 tile       : {measure(lambda: tile.draw(surface)):8.3f} ms/frame')
+
+    for share in (False, True):
+        image.share_transforms = share
+        copies = [image.copy() for _ in range(COPIES)]
+        start = time.perf_counter()
+        for copy in copies:
+            copy.draw(surface)
+        print(f'first draw of {COPIES} copies{" (shared)" if share else "         "}: '
+              f'{(time.perf_counter() - start) * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of the pixel functions of the images of the menus.
+
+Scales the wallpaper example to 1920x1080, then converts it to black and
+white, picks its red channel, and tints it with an array function, and
+prints the time of each conversion. The per pixel function (any Python
+callable) is timed on a 192x108 crop, as it takes seconds on the full image.
+
+Run it from the root of the repository:
+    python dev_tools/bench_image_pixels.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+REPEAT = 5
+
+
+def measure(image, convert):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        convert(image.copy())
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    import pygame_menu
+    image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_WALLPAPER)
+    image.resize(1920, 1080)
+    small = image.copy().resize(192, 108)
+
+    print(f'to_bw                        : {measure(image, lambda im: im.to_bw()):9.3f} ms')
+    print(f'pick_channels("r")           : {measure(image, lambda im: im.pick_channels("r")):9.3f} ms')
+    print(f'apply_pixels_function (tint) : {measure(image, lambda im: im.apply_pixels_function(lambda p: p * (1, 0.5, 0.5, 1))):9.3f} ms')
+    per_pixel = measure(small, lambda im: im.apply_image_function(lambda r, g, b, a: (r, g // 2, b // 2, a)))
+    print(f'apply_image_function (tint)  : {per_pixel:9.3f} ms on 192x108, '
+          f'about {per_pixel * 100 / 1000:.1f} s on 1920x1080')
+
+
+if __name__ == '__main__':
+    main()
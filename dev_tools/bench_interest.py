@@ -0,0 +1,56 @@
+"""
+Benchmark of the area of interest filtering of the snapshots.
+
+Fills matches on maps of growing size with 6 players and projectiles at a
+constant density, and prints the bytes sent per client per second with and
+without the filtering.
+
+Run it from the root of the repository:
+    python dev_tools/bench_interest.py
+"""
+import sys
+import os
+import random
+
+sys.path.append(os.path.join(os.getcwd(), 'server'))
+
+from match import Match
+
+TICK_RATE = 60
+TICKS = 120
+PROJECTILE_DENSITY = 1 / 150_000 # Projectiles per square pixel
+
+
+def measure(width, height):
+    random.seed(0)
+    match = Match(TICK_RATE)
+    for _ in range(Match.MAX_PLAYERS):
+        match.add_player(random.uniform(0, width), random.uniform(0, height))
+    count = min(int(width * height * PROJECTILE_DENSITY), Match.MAX_PROJECTILES)
+
+    totals = {True: 0, False: 0}
+    for _ in range(TICKS):
+        while len(match.projectiles) < count:
+            projectile = match.projectiles.acquire()
+            projectile.reset(-1, 0, random.uniform(0, width), random.uniform(0, height),
+                             random.uniform(-300, 300), random.uniform(-300, 300), random.uniform(0.5, 2))
+        for slot in range(Match.MAX_PLAYERS):
+            match.hitboxes[slot, 0] += random.uniform(-5, 5)
+        match.tick()
+        for slot in range(Match.MAX_PLAYERS):
+            for filtered in (True, False):
+                totals[filtered] += len(match.build_snapshot(slot, filtered).encode('utf-8'))
+
+    per_client = {filtered: total / TICKS / Match.MAX_PLAYERS * TICK_RATE for filtered, total in totals.items()}
+    return count, per_client[False], per_client[True]
+
+
+def main():
+    print(f'{"map":>12} {"projectiles":>11} {"all B/s":>10} {"filtered B/s":>12}')
+    for width, height in ((2048, 1024), (4096, 2048), (8192, 2048), (16384, 4096)):
+        count, everything, filtered = measure(width, height)
+        print(f'{f"{width}x{height}":>12} {count:>11} {everything:>10.0f} {filtered:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
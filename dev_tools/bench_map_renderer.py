@@ -0,0 +1,84 @@
+"""
+Benchmark of the tile chunked map renderer.
+
+Draws a large map (assets/map3.png scaled 4 times) on a 1920x1080 screen,
+with the camera moving across it, an explosion every 10 frames and a zoom
+change every 120 frames. Compares the frame rate with a naive renderer which
+blits the whole (zoomed) map every frame.
+
+Run it from the root of the repository:
+    python dev_tools/bench_map_renderer.py
+"""
+import sys
+import os
+import math
+import time
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 600
+
+
+def scenario(frame, width, height):
+    """Camera center, explosion and zoom level of a frame."""
+    center = (width / 2 + math.cos(frame / 100) * width * 0.4, height / 2 + math.sin(frame / 70) * height * 0.3)
+    explosion = (random.uniform(0, width), random.uniform(0, height), random.uniform(20, 80)) if frame % 10 == 0 else None
+    zoom_index = 2 + (frame // 120) % 2 # 1.0, then 1.5
+    return center, explosion, zoom_index
+
+
+def naive(screen, map_surface):
+    from map_renderer import ZOOM_LEVELS
+    width, height = map_surface.get_size()
+    zoom_index = None
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        center, explosion, frame_zoom = scenario(frame, width, height)
+        if explosion or frame_zoom != zoom_index:
+            if explosion:
+                pygame.draw.circle(map_surface, (0, 0, 0, 0), explosion[:2], explosion[2])
+            zoom_index = frame_zoom
+            scale = ZOOM_LEVELS[zoom_index]
+            zoomed = map_surface if scale == 1 else pygame.transform.scale(map_surface, (int(width * scale), int(height * scale)))
+        scale = ZOOM_LEVELS[zoom_index]
+        screen.fill((0, 0, 0))
+        screen.blit(zoomed, (screen.get_width() / 2 - center[0] * scale, screen.get_height() / 2 - center[1] * scale))
+    return FRAMES / (time.perf_counter() - start)
+
+
+def tiled(screen, map_surface):
+    from map_renderer import MapRenderer
+    width, height = map_surface.get_size()
+    renderer = MapRenderer(map_surface)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        center, explosion, renderer.zoom_index = scenario(frame, width, height)
+        if explosion:
+            renderer.carve(*explosion)
+        screen.fill((0, 0, 0))
+        renderer.draw(screen, center)
+    return FRAMES / (time.perf_counter() - start), renderer.rendered
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1920, 1080))
+    image = pygame.image.load('assets/map3.png').convert_alpha()
+    size = (image.get_width() * 4, image.get_height() * 4)
+
+    random.seed(0)
+    before = naive(screen, pygame.transform.scale(image, size))
+    random.seed(0)
+    after, rendered = tiled(screen, pygame.transform.scale(image, size))
+    print(f'map {size[0]}x{size[1]}, screen 1920x1080, {FRAMES} frames')
+    print(f'whole map blit: {before:.0f} fps')
+    print(f'tiled renderer: {after:.0f} fps ({rendered} tiles rendered)')
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
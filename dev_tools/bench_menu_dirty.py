@@ -0,0 +1,89 @@
+"""
+Benchmark of the partial redraw of the menus.
+
+Builds a menu of 500 widgets (a text input and a grid of shop items: rows of
+buttons packed in horizontal frames), then blinks the cursor of the text input
+every frame, and prints the time spent per frame when the whole widgets
+surface is redrawn, and when only the changed widgets are redrawn. Also checks that both give the same image, and
+prints the rects to give to pygame.display.update.
+
+Run it from the root of the repository:
+    python dev_tools/bench_menu_dirty.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 300
+WIDGETS = 500
+ITEMS_PER_ROW = 5
+
+
+def build(surface):
+    import pygame_menu
+    theme = pygame_menu.themes.THEME_DARK.copy()
+    theme.widget_font_size = 14
+    menu = pygame_menu.Menu('Shop', *surface.get_size(), theme=theme)
+    menu.disable_render()
+    search = menu.add.text_input('Search: ', default='rifle')
+    item = 0
+    while len(menu.get_widgets()) + ITEMS_PER_ROW + 1 <= WIDGETS:
+        row = menu.add.frame_h(760, 30, padding=0)
+        for _ in range(ITEMS_PER_ROW):
+            row.pack(menu.add.button(f'Item {item}: {item * 10} $', padding=(4, 8)))
+            item += 1
+    while len(menu.get_widgets()) < WIDGETS:
+        menu.add.button(f'Item {item}: {item * 10} $')
+        item += 1
+    menu.enable_render()
+    menu.select_widget(search)
+    menu.draw(surface)
+    return menu, search
+
+
+def blink(menu, search, surface, full):
+    search._cursor_visible = not search._cursor_visible
+    search.force_menu_surface_cache_update()
+    if full:
+        menu.force_surface_cache_update()
+    menu.draw(surface)
+
+
+def measure(menu, search, surface, full):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        blink(menu, search, surface, full)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    menu, search = build(surface)
+
+    full = measure(menu, search, surface, True)
+    dirty = measure(menu, search, surface, False)
+    stats = menu._stats
+    print(f'{len(menu.get_widgets())} widgets, {FRAMES} frames blinking the cursor of the text input')
+    print(f'full redraw   : {full:.3f} ms/frame')
+    print(f'partial redraw: {dirty:.3f} ms/frame ({stats.draw_update_dirty} partial draws)')
+    blink(menu, search, surface, False)
+    rects = menu.get_damaged_rects()
+    print(f'damaged rects : {rects} ({sum(r.width * r.height for r in rects)} px of {800 * 600})')
+
+    # Both ways must give the same image
+    blink(menu, search, surface, False)
+    partial = surface.copy()
+    menu.force_surface_cache_update()
+    menu.draw(surface)
+    same = pygame.image.tostring(partial, 'RGB') == pygame.image.tostring(surface, 'RGB')
+    print(f'same image as a full redraw: {same}')
+
+
+if __name__ == '__main__':
+    main()
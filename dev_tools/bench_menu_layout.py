@@ -0,0 +1,74 @@
+"""
+Benchmark of the widget layout of the menus.
+
+Builds an inventory grid of 1000 items (10 columns of buttons), once adding the
+widgets one by one and once within menu.batch_update(), then changes the label
+of one item (same width, then a wider one) and hides/shows an item, and prints
+the time spent per change, with the number of full and incremental layouts.
+
+Run it from the root of the repository:
+    python dev_tools/bench_menu_layout.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+ITEMS = 1000
+COLUMNS = 10
+CHANGES = 20
+
+
+def build(surface, batch):
+    import pygame_menu
+    theme = pygame_menu.themes.THEME_DARK.copy()
+    theme.widget_font_size = 12
+    menu = pygame_menu.Menu('Inventory', *surface.get_size(), theme=theme, columns=COLUMNS, rows=ITEMS // COLUMNS)
+    start = time.perf_counter()
+    if batch:
+        with menu.batch_update():
+            for item in range(ITEMS):
+                menu.add.button(f'Item {item:03} x1')
+    else:
+        for item in range(ITEMS):
+            menu.add.button(f'Item {item:03} x1')
+    menu.draw(surface)
+    return menu, time.perf_counter() - start
+
+
+def measure(menu, surface, change):
+    stats = menu._stats
+    full, incremental = stats.position_update, stats.position_update_incremental
+    start = time.perf_counter()
+    for k in range(CHANGES):
+        change(k)
+        menu.draw(surface)
+    elapsed = (time.perf_counter() - start) / CHANGES * 1000
+    return (f'{elapsed:.3f} ms/change ({stats.position_update - full} full, '
+            f'{stats.position_update_incremental - incremental} incremental layouts)')
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+
+    _, elapsed = build(surface, False)
+    print(f'build {ITEMS} items one by one       : {elapsed:.3f} s')
+    menu, elapsed = build(surface, True)
+    print(f'build {ITEMS} items in batch_update(): {elapsed:.3f} s')
+
+    item = menu.get_widgets()[ITEMS // 2]
+    print('change the count of an item    :',
+          measure(menu, surface, lambda k: item.set_title(f'Item {ITEMS // 2:03} x{k % 9 + 1}')))
+    print('change the width of an item    :',
+          measure(menu, surface, lambda k: item.set_title(f'Item {ITEMS // 2:03} x1' + ' (new)' * (k % 2))))
+    print('hide/show an item              :',
+          measure(menu, surface, lambda k: item.hide() if k % 2 == 0 else item.show()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of the pointer events of the menus.
+
+Builds a menu of 1000 widgets (buttons in two columns, and a scrollable frame
+of buttons), then sends mouse motion events at random positions, with and
+without the selection by mouse motion, and mouse clicks. The menu is drawn
+every 10 events (as a game loop does), and only the time spent within
+Menu.update is measured. Prints the events handled per second.
+
+Run it from the root of the repository:
+    python dev_tools/bench_menu_pointer.py
+"""
+import sys
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+EVENTS = 5000
+WIDGETS = 1000
+FRAMED = 20
+
+
+def build(surface, motion_selection):
+    import pygame_menu
+    theme = pygame_menu.themes.THEME_DARK.copy()
+    theme.widget_font_size = 14
+    theme.widget_margin = (0, 0)
+    menu = pygame_menu.Menu('Inventory', *surface.get_size(), theme=theme, columns=2,
+                            rows=(WIDGETS - FRAMED) // 2, mouse_motion_selection=motion_selection)
+    menu.disable_render()
+    for index in range(WIDGETS - FRAMED - 1):
+        menu.add.button(f'Item {index}')
+    frame = menu.add.frame_v(300, 30 * FRAMED, max_height=200)
+    for index in range(FRAMED):
+        frame.pack(menu.add.button(f'Framed item {index}'))
+    menu.enable_render()
+    menu.draw(surface)
+    return menu
+
+
+def measure(menu, surface, events):
+    elapsed = 0
+    for index, event in enumerate(events):
+        start = time.perf_counter()
+        menu.update([event])
+        elapsed += time.perf_counter() - start
+        if index % 10 == 9:
+            menu.draw(surface)
+    return len(events) / elapsed
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    rng = random.Random(0)
+    positions = [(rng.randrange(800), rng.randrange(600)) for _ in range(EVENTS)]
+    motion = [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(1, 1), buttons=(0, 0, 0)) for pos in positions]
+    clicks = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1) for pos in positions]
+
+    for title, motion_selection, events in (('mouse motion            ', False, motion),
+                                            ('mouse motion, selection ', True, motion),
+                                            ('mouse clicks            ', False, clicks)):
+        menu = build(surface, motion_selection)
+        print(f'{title}: {measure(menu, surface, events):10.0f} events/s')
+
+
+if __name__ == '__main__':
+    main()
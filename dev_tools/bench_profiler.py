@@ -0,0 +1,65 @@
+"""
+Benchmark of the frame profiler.
+
+Measures the cost of the profiler calls of one frame (a mark per phase and
+end_frame), and the cost of refreshing the overlay, and compares them with
+the budget of a 60 fps frame. Then exports a few frames to CSV and JSON.
+
+Run it from the root of the repository:
+    python dev_tools/bench_profiler.py
+"""
+import sys
+import os
+import time
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 200000
+BUDGET = 1 / 60
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    from profiler import FrameProfiler, PHASES
+
+    profiler = FrameProfiler()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for phase in PHASES:
+            profiler.mark(phase)
+        profiler.end_frame()
+    frame_cost = (time.perf_counter() - start) / FRAMES
+
+    profiler.visible = True
+    start = time.perf_counter()
+    for _ in range(100):
+        profiler._overlay = None # Force the refresh
+        profiler.draw(surface)
+    overlay_cost = (time.perf_counter() - start) / 100
+
+    print(f'{len(PHASES)} marks + end_frame: {frame_cost * 1e6:.2f} us/frame '
+          f'({frame_cost / BUDGET * 100:.3f} % of a 60 fps frame)')
+    print(f'overlay refresh: {overlay_cost * 1000:.2f} ms, twice per second '
+          f'({overlay_cost * 2 * 100:.3f} % of the time, only while it is shown)')
+    profiler.close()
+
+    recording = FrameProfiler(record=True)
+    for _ in range(120):
+        for phase in PHASES:
+            recording.mark(phase)
+        recording.end_frame()
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ('frames.csv', 'frames.json'):
+            path = os.path.join(directory, name)
+            recording.export(path)
+            print(f'{name}: {os.path.getsize(path)} bytes')
+    recording.close()
+
+
+if __name__ == '__main__':
+    main()
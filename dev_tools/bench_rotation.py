@@ -0,0 +1,101 @@
+"""
+Benchmark of the rotation cache.
+
+Draws 6 players aiming at moving targets (each player has a soldier, a
+single frame of the soldier strip, and a weapon rotated to its aim angle)
+and prints the time spent per frame, with pygame.transform.rotate called
+every frame, and with the RotationCache.
+
+Run it from the root of the repository:
+    python dev_tools/bench_rotation.py
+"""
+import sys
+import os
+import math
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+os.chdir('client') # The assets are loaded relatively to the client folder
+
+import pygame
+
+from animation import slice_sheet
+
+FRAMES = 2000
+PLAYERS = 6
+SOLDIER = ('../assets/soldier.png', (32, 128)) # A strip of 4 square frames
+SOLDIER_FRAME = 0
+WEAPONS = [
+    ('../assets/weapons/rifle.png', (96, 41)),
+    ('../assets/weapons/bazooka.png', (96, 52)),
+    ('../assets/weapons/pumpgun.png', (96, 36)),
+    ('../assets/weapons/revolver.png', (48, 35)),
+]
+
+
+def aims(frame):
+    """The aim angle of each player: the mice move at different speeds."""
+    return [(frame * (0.7 + player * 0.45) + player * 60) % 360 for player in range(PLAYERS)]
+
+
+def positions():
+    return [(150 + player * 180, 360) for player in range(PLAYERS)]
+
+
+def draw_rotate(surface, assets, frame):
+    for player, ((x, y), angle) in enumerate(zip(positions(), aims(frame))):
+        flip = 90 < angle < 270
+        soldier = slice_sheet(assets.scaled(*SOLDIER))[SOLDIER_FRAME]
+        soldier = pygame.transform.rotate(soldier, math.copysign(10, math.cos(math.radians(angle))))
+        surface.blit(soldier, soldier.get_rect(center=(x, y)))
+        path, size = WEAPONS[player % len(WEAPONS)]
+        weapon = assets.scaled(path, size)
+        if flip:
+            weapon = pygame.transform.flip(weapon, False, True)
+        weapon = pygame.transform.rotate(weapon, angle)
+        surface.blit(weapon, weapon.get_rect(center=(x, y)))
+
+
+def draw_cached(surface, cache, frame):
+    for player, ((x, y), angle) in enumerate(zip(positions(), aims(frame))):
+        cache.draw(surface, SOLDIER[0], (x, y), math.copysign(10, math.cos(math.radians(angle))), SOLDIER[1],
+                   frame=SOLDIER_FRAME)
+        path, size = WEAPONS[player % len(WEAPONS)]
+        cache.draw(surface, path, (x, y), angle, size, 90 < angle < 270)
+
+
+def measure(surface, draw):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        surface.fill((40, 40, 60))
+        draw(frame)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((1280, 720))
+    from assets import assets
+    from rotation_cache import RotationCache
+
+    fill = measure(surface, lambda frame: None)
+    rotate = measure(surface, lambda frame: draw_rotate(surface, assets, frame)) - fill
+    cache = RotationCache()
+    cached = measure(surface, lambda frame: draw_cached(surface, cache, frame)) - fill
+    print(f'{PLAYERS} players, {FRAMES} frames (the screen fill, {fill:.3f} ms, is subtracted)')
+    print(f'rotate every frame: {rotate:.3f} ms/frame')
+    print(f'rotation cache    : {cached:.3f} ms/frame')
+    stats = cache.stats()
+    print(f"cache: {stats['sprites']} sprites, {stats['bytes'] / 1024:.0f} KiB, "
+          f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+    small = RotationCache(max_bytes=256 * 1024)
+    bounded = measure(surface, lambda frame: draw_cached(surface, small, frame)) - fill
+    stats = small.stats()
+    print(f"bounded to 256 KiB: {bounded:.3f} ms/frame, {stats['bytes'] / 1024:.0f} KiB, "
+          f"{stats['misses']} misses, {stats['evictions']} evictions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark of the terrain collapse after explosions.
+
+Generates a full-size map (hills and caves), then fires explosions on its
+surface and measures the time of carve() + collapse() against the tick budget.
+
+Run it from the root of the repository:
+    python dev_tools/bench_terrain.py
+"""
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), 'server'))
+
+from terrain import Terrain
+
+WIDTH, HEIGHT = 4096, 2048
+TICK_BUDGET = 1 / 60
+EXPLOSIONS = 300
+
+
+def generate(rng):
+    xs = np.arange(WIDTH)
+    ground = HEIGHT * 0.55 + 120 * np.sin(xs / 300) + 60 * np.sin(xs / 77 + 1) + 25 * np.sin(xs / 19)
+    mask = np.arange(HEIGHT)[:, None] > ground[None, :]
+    terrain = Terrain(mask)
+    for _ in range(150): # Caves
+        terrain.carve(rng.uniform(0, WIDTH), rng.uniform(HEIGHT * 0.6, HEIGHT), rng.uniform(20, 90))
+    terrain.debris.clear()
+    return terrain, ground
+
+
+def main():
+    rng = np.random.default_rng(0)
+    terrain, ground = generate(rng)
+    durations = []
+    debris = 0
+    for _ in range(EXPLOSIONS):
+        x = rng.uniform(0, WIDTH)
+        y = ground[int(x)] + rng.uniform(-20, 200)
+        start = time.perf_counter()
+        rect = terrain.carve(x, y, rng.uniform(30, 80))
+        debris += len(terrain.collapse(rect))
+        durations.append(time.perf_counter() - start)
+        terrain.step(TICK_BUDGET)
+    durations = np.array(durations) * 1000
+    print(f'map {WIDTH}x{HEIGHT}, {EXPLOSIONS} explosions, {debris} debris')
+    print(f'carve + collapse: mean {durations.mean():.2f} ms, p99 {np.percentile(durations, 99):.2f} ms, '
+          f'max {durations.max():.2f} ms (tick budget {TICK_BUDGET * 1000:.2f} ms)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark of the text cache of the menus.
+
+Builds a menu of 300 widgets (buttons, labels, selectors and toggle switches,
+with a font shadow), then moves the selection over the widgets every frame
+(which renders them again with the selected color), and prints the number of
+calls to Font.render and the time spent per frame, with the text cache
+cleared before every frame (as without cache) and with the cache warm.
+
+Run it from the root of the repository:
+    python dev_tools/bench_text_cache.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 300
+WIDGETS = 300
+
+
+class CountingFont(pygame.font.Font):
+    renders = 0
+
+    def render(self, *args, **kwargs):
+        CountingFont.renders += 1
+        return super().render(*args, **kwargs)
+
+
+def build(surface):
+    import pygame_menu
+    theme = pygame_menu.themes.THEME_DARK.copy()
+    theme.widget_font_size = 14
+    theme.widget_font_shadow = True
+    menu = pygame_menu.Menu('Options', *surface.get_size(), theme=theme)
+    menu.disable_render()
+    for index in range(WIDGETS // 4):
+        menu.add.button(f'Button {index}')
+        menu.add.label(f'Label {index}')
+        menu.add.selector(f'Selector {index} ', [('Low', 0), ('High', 1)])
+        menu.add.toggle_switch(f'Switch {index}')
+    menu.enable_render()
+    menu.draw(surface)
+    return menu
+
+
+def measure(menu, surface, clear):
+    from pygame_menu.font import text_cache
+    renders = CountingFont.renders
+    widgets = [widget for widget in menu.get_widgets() if widget.is_selectable]
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        if clear:
+            text_cache.clear()
+        menu.select_widget(widgets[frame % len(widgets)])
+        menu.draw(surface)
+    elapsed = (time.perf_counter() - start) / FRAMES * 1000
+    return f'{elapsed:.3f} ms/frame, {(CountingFont.renders - renders) / FRAMES:.2f} Font.render calls/frame'
+
+
+def main():
+    pygame.init()
+    pygame.font.Font = CountingFont  # Fonts loaded by pygame_menu.font.get_font count their renders
+    surface = pygame.display.set_mode((800, 600))
+    menu = build(surface)
+
+    from pygame_menu.font import text_cache
+    print(f'{len(menu.get_widgets())} widgets, {FRAMES} frames moving the selection')
+    print('cache cleared every frame:', measure(menu, surface, True))
+    measure(menu, surface, False)  # Warm-up: every widget selected once
+    print('cache warm               :', measure(menu, surface, False))
+    print('cache stats              :', text_cache.get_stats())
+
+
+if __name__ == '__main__':
+    main()
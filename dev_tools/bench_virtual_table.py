@@ -0,0 +1,101 @@
+"""
+Benchmark of the virtual table of the menus.
+
+Builds a leaderboard of 100, 10 000 and 1 000 000 rows (a list of rows, and a
+callable for the biggest one) in a menu, then scrolls it with the mouse wheel,
+and prints the time spent to build the menu and per scrolled frame. Then
+renames the visible players (the row count does not change), updates the
+table and checks that the menu draws the new names. The same
+leaderboard built with a Table (a row of widgets per player) is timed up to
+200 rows, as it gets too slow after that (1000 rows take minutes).
+
+Run it from the root of the repository:
+    python dev_tools/bench_virtual_table.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 200
+HEADER = ('Name', 'Kills', 'Deaths', 'Ratio')
+
+
+def player(index):
+    return f'player{index}', index * 7 % 101, index % 13, f'{index / 3:.2f}'
+
+
+def build_virtual(surface, count):
+    import pygame_menu
+    menu = pygame_menu.Menu('Scores', *surface.get_size(), theme=pygame_menu.themes.THEME_DARK)
+    menu.add.label('Leaderboard')
+    start = time.perf_counter()
+    if count > 10000:
+        table = menu.add.virtual_table(player, row_count=count, height=300, header=HEADER)
+    else:
+        table = menu.add.virtual_table([player(index) for index in range(count)], height=300, header=HEADER)
+    menu.add.button('Back')
+    menu.draw(surface)
+    return menu, table, time.perf_counter() - start
+
+
+def build_table(surface, count):
+    import pygame_menu
+    menu = pygame_menu.Menu('Scores', *surface.get_size(), theme=pygame_menu.themes.THEME_DARK)
+    menu.add.label('Leaderboard')
+    start = time.perf_counter()
+    table = menu.add.table()
+    table.add_row(HEADER)
+    for index in range(count):
+        table.add_row(player(index))
+    menu.add.button('Back')
+    menu.draw(surface)
+    return time.perf_counter() - start
+
+
+def scroll(menu, table, surface):
+    events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=5, pos=table.get_rect(to_real_position=True).center)]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        menu.update(events)
+        menu.draw(surface)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def update(surface, count):
+    import pygame_menu
+    menu = pygame_menu.Menu('Scores', *surface.get_size(), theme=pygame_menu.themes.THEME_DARK)
+    rows = [player(index) for index in range(count)]
+    table = menu.add.virtual_table(rows, height=300, header=HEADER)
+    menu.draw(surface)
+    before = pygame.image.tostring(surface, 'RGB')
+    start = time.perf_counter()
+    first, last = table.get_visible_rows()
+    for index in range(first, last):
+        rows[index] = (f'renamed{index}',) + rows[index][1:]
+    table.update_rows()
+    menu.draw(surface)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert pygame.image.tostring(surface, 'RGB') != before, 'the updated rows are not drawn'
+    return elapsed
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+
+    for count in (100, 200):
+        print(f'Table,         {count:>7} rows: build {build_table(surface, count) * 1000:9.1f} ms')
+    for count in (100, 10000, 1000000):
+        menu, table, elapsed = build_virtual(surface, count)
+        print(f'VirtualTable,  {count:>7} rows: build {elapsed * 1000:9.1f} ms, '
+              f'scroll {scroll(menu, table, surface):.3f} ms/frame (visible rows {table.get_visible_rows()})')
+    print(f'VirtualTable,  {10000:>7} rows: update of the visible rows {update(surface, 10000):.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
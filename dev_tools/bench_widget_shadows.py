@@ -0,0 +1,54 @@
+"""
+Benchmark of the shadows of the widgets.
+
+Builds a menu of 200 buttons of different widths with a rectangular shadow,
+then resizes the menu and changes the titles of the buttons (new widths)
+every frame, and prints the time spent to build and per frame, with the
+number of times the corners of the shadows were generated.
+
+Run it from the root of the repository:
+    python dev_tools/bench_widget_shadows.py
+"""
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+FRAMES = 20
+WIDGETS = 200
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    import pygame_menu
+    from pygame_menu.widgets.core.widget import WIDGET_SHADOW_GENERATOR
+
+    theme = pygame_menu.themes.THEME_DARK.copy()
+    theme.widget_font_size = 14
+    theme.widget_shadow_width = 6
+    theme.widget_shadow_radius = 4
+    start = time.perf_counter()
+    menu = pygame_menu.Menu('Shop', *surface.get_size(), theme=theme)
+    with menu.batch_update():
+        buttons = [menu.add.button('Item ' + 'i' * index) for index in range(WIDGETS)]
+    menu.draw(surface)
+    print(f'build {WIDGETS} shadowed buttons: {(time.perf_counter() - start) * 1000:8.1f} ms, '
+          f'{WIDGET_SHADOW_GENERATOR.get_stats()}')
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        menu.resize(800 - 10 * (frame % 2), 600)
+        for index, button in enumerate(buttons):
+            button.set_title('Item ' + 'i' * ((index + frame) % WIDGETS))
+        menu.draw(surface)
+    print(f'resize and retitle          : {(time.perf_counter() - start) / FRAMES * 1000:8.1f} ms/frame, '
+          f'{WIDGET_SHADOW_GENERATOR.get_stats()}')
+
+
+if __name__ == '__main__':
+    main()
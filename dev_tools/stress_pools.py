@@ -0,0 +1,100 @@
+"""
+Stress test of the projectile and effect pools.
+
+Simulates 500 shots per second on a match (server side) and the matching
+explosions, smoke and shells on the client renderer, then prints the resident
+memory and the garbage collector pauses every simulated second.
+
+Run it from the root of the repository:
+    python dev_tools/stress_pools.py [seconds]
+"""
+import sys
+import os
+import gc
+import math
+import time
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.append(os.path.join(os.getcwd(), 'server'))
+sys.path.append(os.path.join(os.getcwd(), 'client'))
+
+import pygame
+
+SHOTS_PER_SECOND = 500
+TICK_RATE = 60
+
+
+def rss_kib():
+    """Resident memory of the process, in KiB (Linux), or the peak on other systems."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+gc_pauses = []
+_gc_start = [0.0]
+
+
+def gc_callback(phase, info):
+    if phase == 'start':
+        _gc_start[0] = time.perf_counter()
+    else:
+        gc_pauses.append(time.perf_counter() - _gc_start[0])
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    from match import Match
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    os.chdir('client') # The effects load the assets relatively to the client folder
+    from effects import EffectPool
+    effects = EffectPool()
+
+    match = Match(TICK_RATE)
+    for slot in range(Match.MAX_PLAYERS):
+        match.add_player(random.uniform(0, 1200), random.uniform(0, 600))
+
+    gc.callbacks.append(gc_callback)
+    shots_per_tick = SHOTS_PER_SECOND / TICK_RATE
+    budget = 0.0
+    dt = 1 / TICK_RATE
+    print(f'{"second":>6} {"rss KiB":>9} {"gc pauses":>9} {"max pause ms":>12} {"projectiles":>11} {"effects":>7} {"dropped":>7}')
+    for second in range(seconds):
+        gc_pauses.clear()
+        for _ in range(TICK_RATE):
+            budget += shots_per_tick
+            while budget >= 1:
+                budget -= 1
+                slot = random.randrange(Match.MAX_PLAYERS)
+                angle = random.uniform(0, 2 * math.pi)
+                projectile = match.fire(slot, 0, angle, 900, random.uniform(0.2, 1.0), True, 30)
+                if projectile is not None:
+                    effects.spawn('shell', projectile.x, projectile.y, -projectile.vx / 20, -200)
+            match.time -= dt # Fast forward: the tick uses the real clock for its duration
+            match.tick()
+            for explosion in match.explosions.active:
+                effects.spawn('explosion', explosion.x, explosion.y)
+                effects.spawn('smoke', explosion.x, explosion.y, 0, -40)
+            effects.update(dt)
+            screen.fill((0, 0, 0))
+            effects.draw(screen)
+            pygame.display.flip()
+        dropped = match.projectiles.exhausted + effects.exhausted
+        print(f'{second:>6} {rss_kib():>9} {len(gc_pauses):>9} {max(gc_pauses, default=0) * 1000:>12.3f} '
+              f'{len(match.projectiles):>11} {len(effects.active):>7} {dropped:>7}')
+
+    print('projectiles', match.projectiles.stats())
+    print('explosions', match.explosions.stats())
+    print('effects', effects.stats())
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
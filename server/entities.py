@@ -0,0 +1,111 @@
+"""
+Entities module
+
+This module contains the short lived entities of a match. They are reused
+through pools (see pool.py), so they are reset with reset() instead of being
+created for every shot.
+
+Classes:
+    Projectile: A bullet, rocket or grenade in flight.
+    Explosion: An explosion event, sent to the clients on the next snapshot.
+"""
+
+from __future__ import annotations
+
+GRAVITY = 600.0 # Gravity applied to ballistic projectiles, in pixels/s²
+
+
+class Projectile:
+    """
+    Projectile class
+
+    A bullet, rocket or grenade in flight.
+
+    ## Attributes:
+    - id:int - The unique id of the shot, given by the match.
+    - owner:int - The slot of the shooter.
+    - weapon:int - The id of the weapon.
+    - x:float, y:float - The position of the projectile.
+    - vx:float, vy:float - The velocity of the projectile, in pixels/s.
+    - ballistic:bool - Whether the projectile is affected by the gravity.
+    - ttl:float - The remaining lifetime of the projectile, in seconds.
+    - radius:float - The explosion radius, 0 if it does not explode.
+
+    ## Methods:
+    - reset(self, ...) -> Projectile: Initialize the projectile for a new shot.
+    - step(self, dt:float) -> bool: Move the projectile, return False when it
+    expires.
+    """
+    __slots__ = ('id', 'owner', 'weapon', 'x', 'y', 'vx', 'vy', 'ballistic', 'ttl', 'radius')
+
+    def __init__(self) -> None:
+        self.id = -1
+        self.reset(-1, -1, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def reset(
+            self, owner:int, weapon:int, x:float, y:float, vx:float, vy:float,
+            ttl:float, ballistic:bool=False, radius:float=0.0
+        ) -> Projectile:
+        """
+        Initialize the projectile for a new shot.
+
+        ## Returns:
+        - Projectile - The projectile itself.
+        """
+        self.owner = owner
+        self.weapon = weapon
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.ttl = ttl
+        self.ballistic = ballistic
+        self.radius = radius
+        return self
+
+    def step(self, dt:float) -> bool:
+        """
+        Move the projectile.
+
+        ## Parameters:
+        - dt:float - The duration of the tick, in seconds.
+
+        ## Returns:
+        - bool - False if the projectile expired.
+        """
+        if self.ballistic:
+            self.vy += GRAVITY * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.ttl -= dt
+        return self.ttl > 0
+
+
+class Explosion:
+    """
+    Explosion class
+
+    An explosion event, sent to the clients on the next snapshot.
+
+    ## Attributes:
+    - x:float, y:float - The center of the explosion.
+    - radius:float - The radius of the explosion.
+    - owner:int - The slot of the player who caused it.
+    """
+    __slots__ = ('x', 'y', 'radius', 'owner')
+
+    def __init__(self) -> None:
+        self.reset(0.0, 0.0, 0.0, -1)
+
+    def reset(self, x:float, y:float, radius:float, owner:int) -> Explosion:
+        """
+        Initialize the explosion.
+
+        ## Returns:
+        - Explosion - The explosion itself.
+        """
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.owner = owner
+        return self
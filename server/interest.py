@@ -0,0 +1,84 @@
+"""
+Interest module
+
+This module contains the area of interest of a client: the player is always
+at the center of his screen, so a client only needs the entities around him.
+
+Classes:
+    InterestArea: The entities visible by one client, with hysteresis.
+"""
+
+from __future__ import annotations
+
+# Local imports
+from spatial_grid import SpatialGrid
+
+
+class InterestArea:
+    """
+    InterestArea class
+
+    The entities visible by one client. An entity enters the area when it is
+    inside the view of the client plus a margin, and leaves it only when it
+    goes further than the margin plus the hysteresis, so an entity moving
+    along the border of the area does not pop in and out on every snapshot.
+
+    ## Attributes:
+    - half_width:float - Half the width of the view of the client.
+    - half_height:float - Half the height of the view of the client.
+    - margin:float - The distance beyond the view where entities are sent.
+    - hysteresis:float - The extra distance before an entity is forgotten.
+    - visible:set - The keys of the entities in the area.
+
+    ## Methods:
+    - update(self, grid:SpatialGrid, x:float, y:float) -> list: Update the
+    area around the given center and get its entries.
+    """
+    def __init__(
+            self, half_width:float=960, half_height:float=540,
+            margin:float=200, hysteresis:float=150
+        ) -> None:
+        """
+        Constructor of the InterestArea class.
+
+        ## Parameters:
+        - half_width:float - Half the width of the view of the client.
+        - half_height:float - Half the height of the view of the client.
+        - margin:float - The distance beyond the view where entities are sent.
+        - hysteresis:float - The extra distance before an entity is forgotten.
+        """
+        self.half_width = half_width
+        self.half_height = half_height
+        self.margin = margin
+        self.hysteresis = hysteresis
+        self.visible:set = set()
+
+    def update(self, grid:SpatialGrid, x:float, y:float) -> list[tuple]:
+        """
+        Update the area around the given center and get its entries.
+
+        ## Parameters:
+        - grid:SpatialGrid - The grid of the entities of the match.
+        - x:float, y:float - The center of the view (the player).
+
+        ## Returns:
+        - list[tuple] - The (key, x, y, entity) entries in the area.
+        """
+        enter_x = self.half_width + self.margin
+        enter_y = self.half_height + self.margin
+        leave_x = enter_x + self.hysteresis
+        leave_y = enter_y + self.hysteresis
+
+        previous = self.visible
+        visible = set()
+        entries = list()
+        for entry in grid.query(x - leave_x, y - leave_y, x + leave_x, y + leave_y):
+            key, ex, ey, _ = entry
+            dx, dy = abs(ex - x), abs(ey - y)
+            if dx > leave_x or dy > leave_y:
+                continue
+            if (dx <= enter_x and dy <= enter_y) or key in previous:
+                visible.add(key)
+                entries.append(entry)
+        self.visible = visible
+        return entries
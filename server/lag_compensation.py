@@ -0,0 +1,241 @@
+"""
+Lag compensation module
+
+This module contains the hitbox history used by a match to validate hit-scan
+shots (gun, sniper) against the positions the shooter actually saw on his
+screen, and not against the current positions on the server.
+
+The history is a ring buffer of the hitboxes of every player slot, a few
+hundred milliseconds deep. All the arrays are allocated once, when the match
+is created, so recording a tick and rewinding for a shot never allocates a new
+array.
+
+Classes:
+    HitboxHistory: Ring buffer of the past hitboxes of the players of a match.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import math
+
+# Third party imports
+import numpy as np
+
+
+class HitboxHistory:
+    """
+    HitboxHistory class
+
+    Ring buffer of the past hitboxes of the players of a match.
+
+    Each record holds the server time of the tick, the hitbox (x, y, width,
+    height) of each player slot and whether the slot was alive at that time.
+    The records are written in place, and the times are always increasing, so
+    a rewind is a binary search over the ring (O(log n)), followed by a linear
+    interpolation between the two records around the requested time.
+
+    ## Attributes:
+    - capacity:int - The number of records kept in the buffer.
+    - max_players:int - The number of player slots of the match.
+    - max_rewind:float - The maximum time (in seconds) a shot can be rewound.
+
+    ## Methods:
+    - record(self, time:float, boxes:np.ndarray, alive:np.ndarray) -> None:
+    Record the hitboxes of a tick.
+    - rewind(self, time:float) -> tuple[np.ndarray, np.ndarray]: Get the
+    hitboxes of the players at the given time.
+    - hitscan(self, time:float, origin:tuple, direction:tuple, reach:float,
+    shooter:int) -> tuple[int, float]: Find the first player hit by a ray at
+    the given time.
+    - clear(self) -> None: Forget every record.
+    """
+    def __init__(
+            self, max_players:int=6, tick_rate:int=60, depth:float=0.4
+        ) -> None:
+        """
+        Constructor of the HitboxHistory class.
+
+        ## Parameters:
+        - max_players:int - The number of player slots of the match.
+        - tick_rate:int - The number of ticks per second of the match.
+        - depth:float - How far in the past (in seconds) the history goes.
+        """
+        self.capacity = math.ceil(depth * tick_rate) + 1
+        self.max_players = max_players
+        self.max_rewind = depth
+
+        # Preallocated storage, never resized
+        self._times = np.zeros(self.capacity, dtype=np.float64)
+        self._boxes = np.zeros((self.capacity, max_players, 4), dtype=np.float32)
+        self._alive = np.zeros((self.capacity, max_players), dtype=np.bool_)
+
+        # Output buffers of the rewind, reused for every shot
+        self._out_boxes = np.zeros((max_players, 4), dtype=np.float32)
+        self._out_alive = np.zeros(max_players, dtype=np.bool_)
+        self._scratch = np.zeros((max_players, 4), dtype=np.float32)
+
+        self._head = 0 # Physical index of the next record to write
+        self._count = 0 # Number of valid records
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """
+        Forget every record.
+        """
+        self._head = 0
+        self._count = 0
+
+    def record(self, time:float, boxes:np.ndarray, alive:np.ndarray) -> None:
+        """
+        Record the hitboxes of a tick, overwriting the oldest record if the
+        buffer is full.
+
+        ## Parameters:
+        - time:float - The server time of the tick, in seconds.
+        - boxes:np.ndarray - The (max_players, 4) hitboxes of the players.
+        - alive:np.ndarray - The (max_players,) alive flags of the players.
+
+        ## Returns:
+        - None
+        """
+        if self._count and time <= self._times[self._head - 1]:
+            raise ValueError('Records must be added in chronological order')
+        head = self._head
+        self._times[head] = time
+        np.copyto(self._boxes[head], boxes)
+        np.copyto(self._alive[head], alive)
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _physical(self, logical:int) -> int:
+        """
+        Convert a logical index (0 is the oldest record) to an index of the
+        storage arrays.
+        """
+        return (self._head - self._count + logical) % self.capacity
+
+    def _search(self, time:float) -> int:
+        """
+        Binary search of the last record whose time is lower or equal to the
+        given time.
+
+        ## Parameters:
+        - time:float - The time to look for, inside the recorded range.
+
+        ## Returns:
+        - int - The logical index of the record.
+        """
+        low, high = 0, self._count - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._times[self._physical(middle)] <= time:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def rewind(self, time:float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the hitboxes of the players at the given time.
+
+        The time is clamped to the recorded range and to max_rewind, so a
+        client cannot ask for a state older than the history. The result is
+        interpolated between the two closest records.
+
+        WARNING: The returned arrays are reused by the next call, copy them if
+        they must be kept.
+
+        ## Parameters:
+        - time:float - The server time to rewind to, in seconds.
+
+        ## Returns:
+        - tuple[np.ndarray, np.ndarray] - The hitboxes and the alive flags.
+        """
+        if not self._count:
+            raise LookupError('The history is empty')
+
+        newest = self._times[self._physical(self._count - 1)]
+        oldest = self._times[self._physical(0)]
+        time = min(max(time, oldest, newest - self.max_rewind), newest)
+
+        before = self._search(time)
+        index_a = self._physical(before)
+        if before == self._count - 1 or self._times[index_a] == time:
+            np.copyto(self._out_boxes, self._boxes[index_a])
+            np.copyto(self._out_alive, self._alive[index_a])
+            return self._out_boxes, self._out_alive
+
+        index_b = self._physical(before + 1)
+        time_a = self._times[index_a]
+        ratio = (time - time_a) / (self._times[index_b] - time_a)
+
+        # out = a + (b - a) * ratio, without temporary arrays
+        np.subtract(self._boxes[index_b], self._boxes[index_a], out=self._scratch)
+        np.multiply(self._scratch, ratio, out=self._scratch)
+        np.add(self._boxes[index_a], self._scratch, out=self._out_boxes)
+        # A player is only hittable if he was alive on both records
+        np.logical_and(self._alive[index_a], self._alive[index_b], out=self._out_alive)
+        return self._out_boxes, self._out_alive
+
+    def hitscan(
+            self, time:float, origin:tuple[float, float],
+            direction:tuple[float, float], reach:float, shooter:int=-1
+        ) -> tuple[int, float]:
+        """
+        Find the first player hit by a ray, at the given time.
+
+        ## Parameters:
+        - time:float - The server time seen by the shooter, in seconds.
+        - origin:tuple[float, float] - The start of the ray.
+        - direction:tuple[float, float] - The unit direction of the ray.
+        - reach:float - The length of the ray.
+        - shooter:int - The slot of the shooter, who can't hit himself.
+
+        ## Returns:
+        - tuple[int, float] - The slot of the player hit and the distance of
+        the impact, or (-1, reach) if nobody is hit.
+        """
+        boxes, alive = self.rewind(time)
+        ox, oy = origin
+        dx, dy = direction
+        hit, nearest = -1, reach
+        for slot in range(self.max_players):
+            if slot == shooter or not alive[slot]:
+                continue
+            x, y, width, height = boxes[slot]
+            distance = _ray_box(ox, oy, dx, dy, x, y, x + width, y + height)
+            if distance is not None and distance < nearest:
+                hit, nearest = slot, distance
+        return hit, nearest
+
+
+def _ray_box(
+        ox:float, oy:float, dx:float, dy:float,
+        left:float, top:float, right:float, bottom:float
+    ) -> float|None:
+    """
+    Slab test between a ray and an axis aligned box.
+
+    ## Returns:
+    - float - The distance from the origin to the entry point in the box.
+    - None - If the ray does not hit the box.
+    """
+    near, far = 0.0, math.inf
+    for origin, delta, low, high in ((ox, dx, left, right), (oy, dy, top, bottom)):
+        if delta == 0:
+            if origin < low or origin > high:
+                return None
+            continue
+        t1 = (low - origin) / delta
+        t2 = (high - origin) / delta
+        if t1 > t2:
+            t1, t2 = t2, t1
+        near = max(near, t1)
+        far = min(far, t2)
+        if near > far:
+            return None
+    return near
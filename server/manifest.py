@@ -0,0 +1,150 @@
+"""
+Manifest module
+
+This module contains the manifest of the game files published by the server.
+The clients compare it with their own files to download only the parts which
+changed.
+
+Each file is split in chunks of CHUNK_SIZE bytes, and each chunk is hashed
+with BLAKE2. The hashes are kept with the modification time and the size of
+the file, so a file is only hashed again when it changes.
+
+Classes:
+    Manifest: The hashes of the chunks of the game files.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import hashlib
+import json
+import os
+
+CHUNK_SIZE = 64 * 1024
+DIGEST_SIZE = 16
+
+
+def hash_chunks(path:str, chunk_size:int=CHUNK_SIZE) -> list[str]:
+    """
+    Hash the chunks of a file.
+
+    ## Parameters:
+    - path:str - The path of the file.
+    - chunk_size:int - The size of the chunks.
+
+    ## Returns:
+    - list[str] - The hexadecimal BLAKE2 digest of each chunk.
+    """
+    hashes = list()
+    with open(path, 'rb') as file:
+        while chunk := file.read(chunk_size):
+            hashes.append(hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).hexdigest())
+    return hashes
+
+
+def manifest_digest(files:list[dict]) -> str:
+    """
+    Hash a whole manifest, so a client can check in one message that all
+    its files are up to date.
+
+    ## Parameters:
+    - files:list[dict] - The files of the manifest, sorted by path.
+
+    ## Returns:
+    - str - The hexadecimal BLAKE2 digest.
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for file in files:
+        digest.update(file['path'].encode('utf-8'))
+        digest.update(str(file['size']).encode('utf-8'))
+        for chunk in file['chunks']:
+            digest.update(chunk.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    Manifest class
+
+    The hashes of the chunks of the game files.
+
+    ## Attributes:
+    - root:str - The folder of the game files.
+    - chunk_size:int - The size of the chunks.
+    - files:list[dict] - The files, sorted by path, as dicts with the path
+    (relative to the root, with '/' separators), the size and the chunks.
+    - digest:str - The digest of the whole manifest.
+
+    ## Methods:
+    - refresh(self) -> None: Hash again the files which changed.
+    - to_json(self) -> bytes: Serialize the manifest for the clients.
+    - read_chunk(self, file_index:int, chunk_index:int) -> bytes: Read a
+    chunk of a file.
+    """
+    def __init__(self, root:str, chunk_size:int=CHUNK_SIZE) -> None:
+        """
+        Constructor of the Manifest class. Hash every file of the root.
+
+        ## Parameters:
+        - root:str - The folder of the game files.
+        - chunk_size:int - The size of the chunks.
+        """
+        self.root = root
+        self.chunk_size = chunk_size
+        self.files:list[dict] = list()
+        self.digest = ''
+        self._stats:dict[str, tuple[int, int]] = dict() # path -> (mtime_ns, size) when hashed
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Hash again the files which changed since the last refresh (according
+        to their modification time and size), and drop the removed files.
+        """
+        previous = {file['path']: file for file in self.files}
+        files = list()
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, self.root).replace(os.sep, '/')
+                stat = os.stat(path)
+                key = (stat.st_mtime_ns, stat.st_size)
+                file = previous.get(relative)
+                if file is None or self._stats.get(relative) != key:
+                    file = {'path': relative, 'size': stat.st_size, 'chunks': hash_chunks(path, self.chunk_size)}
+                    self._stats[relative] = key
+                files.append(file)
+        files.sort(key=lambda file: file['path'])
+        self.files = files
+        self.digest = manifest_digest(files)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the manifest for the clients.
+
+        ## Returns:
+        - bytes - The utf-8 JSON manifest.
+        """
+        return json.dumps({
+            'chunk_size': self.chunk_size,
+            'digest': self.digest,
+            'files': self.files,
+        }).encode('utf-8')
+
+    def read_chunk(self, file_index:int, chunk_index:int) -> bytes:
+        """
+        Read a chunk of a file.
+
+        ## Parameters:
+        - file_index:int - The index of the file in the manifest.
+        - chunk_index:int - The index of the chunk in the file.
+
+        ## Returns:
+        - bytes - The content of the chunk.
+        """
+        file = self.files[file_index]
+        if not 0 <= chunk_index < len(file['chunks']):
+            raise IndexError('Chunk index out of range')
+        with open(os.path.join(self.root, file['path']), 'rb') as stream:
+            stream.seek(chunk_index * self.chunk_size)
+            return stream.read(self.chunk_size)
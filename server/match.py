@@ -0,0 +1,314 @@
+"""
+Match module
+
+This module contains the match class, which hosts one game of up to 6 players.
+Each match runs in its own thread, and is clock based (a fixed number of ticks
+per second), not fps based.
+
+Classes:
+    Match: This class will be used to host a game.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import math
+import time
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from entities import Explosion, Projectile
+from interest import InterestArea
+from lag_compensation import HitboxHistory
+from pool import Pool
+from spatial_grid import SpatialGrid
+from spawn_index import SpawnIndex
+from terrain import Terrain
+
+
+class Match:
+    """
+    Match class
+
+    This class will be used to host a game. It keeps the state of the players
+    and the history of their hitboxes, used to validate hit-scan shots at the
+    time seen by the shooter (lag compensation).
+
+    ## Attributes:
+    - tick_rate:int - The number of ticks per second.
+    - terrain:Terrain|None - The destructible terrain of the map.
+    - spawns:SpawnIndex|None - The standing points of the terrain.
+    - hitboxes:np.ndarray - The (MAX_PLAYERS, 4) current hitboxes of the
+    players, as (x, y, width, height).
+    - alive:np.ndarray - The (MAX_PLAYERS,) alive flags of the players.
+    - history:HitboxHistory - The past hitboxes of the players.
+    - projectiles:Pool[Projectile] - The projectiles in flight.
+    - explosions:Pool[Explosion] - The explosions of the current tick.
+    - events:list[str] - The global events of the current tick (kills, ...),
+    sent to every client.
+    - grid:SpatialGrid - The players and projectiles of the current tick.
+    - interests:list[InterestArea] - The area of interest of each slot.
+    - time:float - The server time of the last tick, in seconds.
+    - running:bool - The loop control of the match.
+
+    ## Methods:
+    - spawn_point(self) -> tuple[float, float]: Get a random position where a
+    player can stand.
+    - add_player(self, x:float, y:float) -> int: Add a player to the match.
+    - remove_player(self, slot:int) -> None: Remove a player from the match.
+    - hitscan(self, shooter:int, angle:float, reach:float, view_time:float)
+    -> int: Validate a hit-scan shot.
+    - fire(self, shooter:int, weapon:int, angle:float, velocity:float,
+    ttl:float, ballistic:bool, radius:float) -> Projectile|None: Launch a
+    projectile.
+    - explode(self, x:float, y:float, radius:float, owner:int) -> None: Add
+    an explosion to the current tick.
+    - build_snapshot(self, slot:int, filtered:bool) -> str: Build the
+    snapshot sent to a player.
+    - tick(self) -> None: Advance the match by one tick.
+    - run(self) -> None: Run the match until it is stopped.
+    - stop(self) -> None: Stop the match.
+    """
+    MAX_PLAYERS = 6
+    HITBOX_SIZE = (20, 40)
+    MAX_PROJECTILES = 512
+    MAX_EXPLOSIONS = 128
+
+    def __init__(self, tick_rate:int=60, terrain:Terrain|None=None) -> None:
+        """
+        Constructor of the Match class.
+
+        ## Parameters:
+        - tick_rate:int - The number of ticks per second.
+        - terrain:Terrain|None - The destructible terrain of the map.
+        """
+        self.tick_rate = tick_rate
+        self.terrain = terrain
+        self.spawns = SpawnIndex(terrain, self.HITBOX_SIZE[1]) if terrain is not None else None
+        self.hitboxes = np.zeros((self.MAX_PLAYERS, 4), dtype=np.float32)
+        self.alive = np.zeros(self.MAX_PLAYERS, dtype=np.bool_)
+        self.history = HitboxHistory(self.MAX_PLAYERS, tick_rate)
+        self.projectiles = Pool(Projectile, self.MAX_PROJECTILES)
+        self.explosions = Pool(Explosion, self.MAX_EXPLOSIONS)
+        self.events:list[str] = list()
+        self.grid = SpatialGrid()
+        self.interests = [InterestArea() for _ in range(self.MAX_PLAYERS)]
+        self.time = time.monotonic()
+        self._next_shot = 0
+        self.running = False
+
+    def spawn_point(self) -> tuple[float, float]:
+        """
+        Get a random position where a player can stand.
+
+        ## Returns:
+        - tuple[float, float] - The top left corner of the hitbox.
+        """
+        point = self.spawns.random() if self.spawns is not None else None
+        if point is None:
+            return (0.0, 0.0)
+        return (point[0] - self.HITBOX_SIZE[0] / 2, point[1] - self.HITBOX_SIZE[1])
+
+    def add_player(self, x:float, y:float) -> int:
+        """
+        Add a player to the match.
+
+        ## Parameters:
+        - x:float - The x coordinate of the player.
+        - y:float - The y coordinate of the player.
+
+        ## Returns:
+        - int - The slot of the player.
+        """
+        free = np.flatnonzero(~self.alive)
+        if not len(free):
+            raise ValueError('The match is full')
+        slot = int(free[0])
+        self.hitboxes[slot] = (x, y, *self.HITBOX_SIZE)
+        self.alive[slot] = True
+        self.interests[slot].visible.clear()
+        return slot
+
+    def remove_player(self, slot:int) -> None:
+        """
+        Remove a player from the match.
+
+        ## Parameters:
+        - slot:int - The slot of the player.
+        """
+        self.alive[slot] = False
+
+    def hitscan(
+            self, shooter:int, angle:float, reach:float, view_time:float
+        ) -> int:
+        """
+        Validate a hit-scan shot against the hitboxes seen by the shooter.
+
+        ## Parameters:
+        - shooter:int - The slot of the shooter.
+        - angle:float - The aiming angle, in radians.
+        - reach:float - The reach of the weapon.
+        - view_time:float - The server time of the state displayed by the
+        client when he shot.
+
+        ## Returns:
+        - int - The slot of the player hit, or -1.
+        """
+        x, y, width, height = self.hitboxes[shooter]
+        origin = (x + width / 2, y + height / 2)
+        direction = (math.cos(angle), math.sin(angle))
+        hit, _ = self.history.hitscan(view_time, origin, direction, reach, shooter)
+        return hit
+
+    def fire(
+            self, shooter:int, weapon:int, angle:float, velocity:float,
+            ttl:float, ballistic:bool=False, radius:float=0.0
+        ) -> Projectile|None:
+        """
+        Launch a projectile from the center of the shooter.
+
+        ## Parameters:
+        - shooter:int - The slot of the shooter.
+        - weapon:int - The id of the weapon.
+        - angle:float - The aiming angle, in radians.
+        - velocity:float - The speed of the projectile, in pixels/s.
+        - ttl:float - The lifetime of the projectile, in seconds.
+        - ballistic:bool - Whether the projectile is affected by the gravity.
+        - radius:float - The explosion radius, 0 if it does not explode.
+
+        ## Returns:
+        - Projectile - The projectile.
+        - None - If the projectile pool is exhausted, the shot is dropped.
+        """
+        projectile = self.projectiles.acquire()
+        if projectile is None:
+            return None
+        projectile.id = self._next_shot
+        self._next_shot += 1
+        x, y, width, height = self.hitboxes[shooter]
+        return projectile.reset(
+            shooter, weapon, float(x + width / 2), float(y + height / 2),
+            velocity * math.cos(angle), velocity * math.sin(angle),
+            ttl, ballistic, radius
+        )
+
+    def explode(self, x:float, y:float, radius:float, owner:int) -> None:
+        """
+        Add an explosion to the current tick. The explosion carves the
+        terrain, and the chunks it detaches start to fall.
+
+        ## Parameters:
+        - x:float, y:float - The center of the explosion.
+        - radius:float - The radius of the explosion.
+        - owner:int - The slot of the player who caused it.
+        """
+        explosion = self.explosions.acquire()
+        if explosion is not None:
+            explosion.reset(x, y, radius, owner)
+        if self.terrain is not None:
+            rect = self.terrain.carve(x, y, radius)
+            self.spawns.update(rect)
+            for debris in self.terrain.collapse(rect):
+                self.spawns.update(debris.rect)
+                self.events.append(f'DEBRIS,{debris.id},{debris.x},{debris.y}')
+
+    def tick(self) -> None:
+        """
+        Advance the match by one tick and record the hitboxes of the players.
+
+        The explosions of the previous tick are released, and the projectiles
+        which expire explode (if they have a radius) and go back to the pool.
+        The falling debris move, the clients are told where they stop.
+        """
+        now = time.monotonic()
+        dt = now - self.time
+        self.time = now
+
+        self.explosions.clear()
+        self.events.clear()
+        active = self.projectiles.active
+        for index in range(len(active) - 1, -1, -1): # Backwards, release swaps
+            projectile = active[index]
+            if not projectile.step(dt):
+                if projectile.radius:
+                    self.explode(projectile.x, projectile.y, projectile.radius, projectile.owner)
+                self.projectiles.release(projectile)
+
+        if self.terrain is not None:
+            for debris, rect in self.terrain.step(dt):
+                if rect is None:
+                    self.events.append(f'DEBRIS_LOST,{debris.id}')
+                else:
+                    self.spawns.update(rect)
+                    self.events.append(f'DEBRIS_LANDED,{debris.id},{debris.x},{debris.y}')
+
+        self.history.record(self.time, self.hitboxes, self.alive)
+
+        # Index the entities of the tick for the snapshots
+        self.grid.clear()
+        for slot in np.flatnonzero(self.alive):
+            x, y, width, height = self.hitboxes[slot]
+            self.grid.insert(('P', int(slot)), float(x + width / 2), float(y + height / 2), int(slot))
+        for projectile in self.projectiles.active:
+            self.grid.insert(('B', projectile.id), projectile.x, projectile.y, projectile)
+
+    def build_snapshot(self, slot:int, filtered:bool=True) -> str:
+        """
+        Build the snapshot sent to a player after a tick.
+
+        The snapshot is a list of space separated tokens:
+        - SNAPSHOT <time> - The header, with the server time of the tick.
+        - P<slot>,<x>,<y> - A player.
+        - B<id>,<x>,<y>,<weapon> - A projectile.
+        - X<x>,<y>,<radius> - An explosion (always sent, it changes the map).
+        - G<event> - A global event (always sent).
+
+        ## Parameters:
+        - slot:int - The slot of the player.
+        - filtered:bool - Only send the players and projectiles in the area of
+        interest of the player. Without it, every entity is sent.
+
+        ## Returns:
+        - str - The snapshot.
+        """
+        if filtered:
+            x, y, width, height = self.hitboxes[slot]
+            entries = self.interests[slot].update(self.grid, float(x + width / 2), float(y + height / 2))
+        else:
+            entries = list(self.grid)
+
+        tokens = [f'SNAPSHOT {self.time:.3f}']
+        for key, x, y, entity in entries:
+            if key[0] == 'P':
+                tokens.append(f'P{entity},{x:.0f},{y:.0f}')
+            else:
+                tokens.append(f'B{entity.id},{x:.0f},{y:.0f},{entity.weapon}')
+        for explosion in self.explosions.active:
+            tokens.append(f'X{explosion.x:.0f},{explosion.y:.0f},{explosion.radius:.0f}')
+        for event in self.events:
+            tokens.append(f'G{event}')
+        return ' '.join(tokens)
+
+    def run(self) -> None:
+        """
+        Run the match until it is stopped, at a fixed tick rate.
+        """
+        self.running = True
+        period = 1 / self.tick_rate
+        next_tick = time.monotonic()
+        while self.running:
+            self.tick()
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic() # The match is late, don't try to catch up
+
+    def stop(self) -> None:
+        """
+        Stop the match.
+        """
+        self.running = False
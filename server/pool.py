@@ -0,0 +1,123 @@
+"""
+Pool module
+
+This module contains the object pool used by the matches to reuse the
+projectiles and explosions, instead of creating and discarding an object for
+every shot.
+
+Classes:
+    Pool: Fixed capacity pool of reusable objects.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class Pool(Generic[T]):
+    """
+    Pool class
+
+    Fixed capacity pool of reusable objects. Every object is created when the
+    pool is created. acquire() takes a free object and release() gives it back,
+    so the number of objects never changes during a match.
+
+    The active objects are kept in a list, released objects are swapped with
+    the last active one, so both operations are O(1). When iterating over the
+    active objects to release some of them, iterate backwards.
+
+    ## Attributes:
+    - capacity:int - The number of objects of the pool.
+    - active:list - The objects currently in use (read only).
+    - acquired:int - The total number of successful acquisitions.
+    - exhausted:int - The number of acquisitions that failed because every
+    object was in use.
+    - high_water:int - The highest number of objects in use at the same time.
+
+    ## Methods:
+    - acquire(self) -> T|None: Take a free object from the pool.
+    - release(self, item:T) -> None: Give an object back to the pool.
+    - clear(self) -> None: Release every object.
+    - stats(self) -> dict: Get the usage metrics of the pool.
+    """
+    def __init__(self, factory:Callable[[], T], capacity:int) -> None:
+        """
+        Constructor of the Pool class.
+
+        ## Parameters:
+        - factory:Callable[[], T] - Function creating one object of the pool.
+        - capacity:int - The number of objects of the pool.
+        """
+        self.capacity = capacity
+        self._free:list[T] = [factory() for _ in range(capacity)]
+        self.active:list[T] = list()
+        self._index:dict[int, int] = dict() # id(object) -> index in active
+
+        self.acquired = 0
+        self.exhausted = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def acquire(self) -> T|None:
+        """
+        Take a free object from the pool.
+
+        The object is not reset, the caller must initialize it.
+
+        ## Returns:
+        - T - The object.
+        - None - If every object is in use.
+        """
+        if not self._free:
+            self.exhausted += 1
+            return None
+        item = self._free.pop()
+        self._index[id(item)] = len(self.active)
+        self.active.append(item)
+        self.acquired += 1
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return item
+
+    def release(self, item:T) -> None:
+        """
+        Give an object back to the pool.
+
+        ## Parameters:
+        - item:T - An object acquired from this pool.
+        """
+        index = self._index.pop(id(item))
+        last = self.active.pop()
+        if last is not item:
+            self.active[index] = last
+            self._index[id(last)] = index
+        self._free.append(item)
+
+    def clear(self) -> None:
+        """
+        Release every object.
+        """
+        self._free.extend(self.active)
+        self.active.clear()
+        self._index.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the usage metrics of the pool.
+
+        ## Returns:
+        - dict - The capacity, in use, high water, acquired and exhausted
+        counters.
+        """
+        return {
+            'capacity': self.capacity,
+            'in_use': len(self.active),
+            'high_water': self.high_water,
+            'acquired': self.acquired,
+            'exhausted': self.exhausted,
+        }
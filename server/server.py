@@ -18,6 +18,7 @@ import socket as socket_
 
 # Local imports
 from database import Database, Cosmetic, Weapon
+from manifest import Manifest
 
 
 class Server:
@@ -33,12 +34,15 @@ class Server:
     - server_socket:socket - The socket of the server.
     - clients:list - The list of the clients connected to the server.
     - db:Database - The database of the server.
+    - manifest:Manifest - The hashes of the game files.
 
     ## Methods:
     - broadcast(self, message:str) -> None: This method will broadcast the
     message to all the clients.
     - send(self, client_socket:socket, message:str) -> None: This method will
     send the message to the client.
+    - send_payload(self, client_socket:socket, head:str, data:bytes) -> None:
+    This method will send a message followed by binary data to the client.
     - lobby(self, client_socket:socket) -> None: This method will handle the
     lobby of the client.
     - run(self) -> None: This method will run the server.
@@ -61,10 +65,12 @@ class Server:
         self.server_socket.listen(10)
         self.clients =  list()
         self.db = Database('../data.db')
+        self.manifest = Manifest('../assets')
+        self.manifest_lock = threading.Lock()
 
     def broadcast(self, message:str) -> None:
         """
-        This method will broadcast the message to all the clients.
+        This method will broadcast the message to all the clients, as a line.
         
         ## Parameters:
         - message:str - The message to be broadcasted.
@@ -72,13 +78,14 @@ class Server:
         ## Returns:
         - None
         """
-        message = message.encode('utf-8')
+        message = (message + '\n').encode('utf-8')
         for client in self.clients:
             client.send(message)
 
     def send(self, client_socket:socket_.socket, message:str) -> None:
         """
-        This method will send the message to the client.
+        This method will send the message to the client. The messages are
+        lines, so the client can split them when several arrive together.
         
         ## Parameters:
         - client_socket:socket - The socket of the client.
@@ -87,8 +94,25 @@ class Server:
         ## Returns:
         - None
         """
-        message = message.encode('utf-8')
-        client_socket.send(message)
+        message = (message + '\n').encode('utf-8')
+        client_socket.sendall(message)
+
+    def send_payload(
+            self, client_socket:socket_.socket, head:str, data:bytes
+        ) -> None:
+        """
+        This method will send a message followed by binary data to the client:
+        a '<head> <size>' line, then the data.
+        
+        ## Parameters:
+        - client_socket:socket - The socket of the client.
+        - head:str - The head of the message.
+        - data:bytes - The binary data.
+        
+        ## Returns:
+        - None
+        """
+        client_socket.sendall(f'{head} {len(data)}\n'.encode('utf-8') + data)
 
     def lobby(self, client_socket:socket_.socket) -> None:
         """
@@ -103,12 +127,15 @@ class Server:
         print(f'[DBG] from server.py.Server.lobby : Lobby started for client {client_socket}')
 
         user = -1 # -1 means the user is not logged in
-        login_form = client_socket.recv(1024) # Message recieving from the client
+        # The messages are lines: several messages received together are
+        # read one by one, and a message split in two packets is read whole
+        reader = client_socket.makefile('rb')
+        login_form = reader.readline() # Message recieving from the client
         login_form = login_form.decode('utf-8') # Decoding the message
         login_form = login_form.strip().split() # Splitting the message
         # REGISTER NEW USER
         print(f'[DBG] from server.py.Server.lobby : {login_form=}')
-        if login_form == ["quit"]:
+        if login_form == ["quit"] or not login_form:
             print(f'[DBG] from server.py.Server.lobby : Client {client_socket} disconnected')
             self.clients.remove(client_socket)
             client_socket.close()
@@ -127,8 +154,6 @@ class Server:
             print(f'[DBG] from server.py.Server.lobby : {user=}')
         else:
             # error handling
-            if not login_form:
-                return
             if len(login_form) != 2:
                 self.send(client_socket, 'LOGIN ERROR')
                 return
@@ -147,7 +172,7 @@ class Server:
             # Loop for the client if the authentication is not successful at first
             while user == -1:
                 print(f'[DBG] from server.py.Server.lobby : starting login loop for client {client_socket}')
-                login_form = client_socket.recv(1024)
+                login_form = reader.readline()
                 login_form = login_form.decode('utf-8')
                 login_form = login_form.strip().split()
 
@@ -170,7 +195,12 @@ class Server:
         
         # Loop for the client if the user is logged in
         while True:
-            message = client_socket.recv(1024)
+            message = reader.readline()
+            if not message: # The client closed the connection
+                print(f'[DBG] from server.py.Server.lobby : Client {client_socket} disconnected')
+                self.clients.remove(client_socket)
+                client_socket.close()
+                break
             message = message.decode('utf-8')
             message = message.strip().split()
             if not message:
@@ -188,17 +218,36 @@ class Server:
                             item = body.pop(0)
                             try:
                                 user.inventory[slot] = Weapon(item)
-                            except ValueError as e:
-                                self.send(
-                                    client_socket, f'ERROR ({repr(e)}) HOTBAR '
-                                )
-                            except TypeError as e:
+                            except (ValueError, TypeError, AttributeError) as e:
                                 self.send(
                                     client_socket, f'ERROR ({repr(e)}) HOTBAR '
                                 )
-                            self.send(client_socket, 'OK HOTBAR SET')
+                            else:
+                                self.send(client_socket, 'OK HOTBAR SET')
                         case 'CLOSE':
                             self.send(client_socket, 'HOTBAR CLOSE')
+                case 'UPDATE':
+                    option = body.pop(0) if body else ''
+                    match option:
+                        case 'MANIFEST':
+                            with self.manifest_lock: # Only hash the files which changed
+                                self.manifest.refresh()
+                                digest = self.manifest.digest
+                                data = self.manifest.to_json()
+                            if body and body[0] == digest:
+                                self.send(client_socket, 'MANIFEST OK')
+                            else:
+                                self.send_payload(client_socket, 'MANIFEST', data)
+                        case 'CHUNK':
+                            try:
+                                with self.manifest_lock:
+                                    data = self.manifest.read_chunk(int(body[0]), int(body[1]))
+                            except (ValueError, IndexError, OSError) as e:
+                                self.send(
+                                    client_socket, f'ERROR ({repr(e)}) UPDATE'
+                                )
+                            else:
+                                self.send_payload(client_socket, 'CHUNK', data)
                 case 'SHOP':
                     pass
                 case 'FRIENDS':
@@ -0,0 +1,99 @@
+"""
+Spatial grid module
+
+This module contains the uniform grid used by the matches to find the
+entities around a position without testing every entity of the match.
+
+Classes:
+    SpatialGrid: Uniform grid of entities, rebuilt every tick.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from typing import Any
+
+
+class SpatialGrid:
+    """
+    SpatialGrid class
+
+    Uniform grid of entities. Each cell holds the entries whose position is
+    inside it, as (key, x, y, entity) tuples. The grid is cleared and filled
+    again every tick; the cell lists are kept between ticks, so only the
+    entries are allocated.
+
+    ## Attributes:
+    - cell_size:int - The size of a cell, in pixels.
+
+    ## Methods:
+    - clear(self) -> None: Remove every entry.
+    - insert(self, key, x:float, y:float, entity) -> None: Add an entry.
+    - query(self, left:float, top:float, right:float, bottom:float) -> list:
+    Get the entries of the cells overlapping a rectangle.
+    """
+    def __init__(self, cell_size:int=256) -> None:
+        """
+        Constructor of the SpatialGrid class.
+
+        ## Parameters:
+        - cell_size:int - The size of a cell, in pixels.
+        """
+        self.cell_size = cell_size
+        self._cells:dict[tuple[int, int], list] = dict()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for entries in self._cells.values():
+            yield from entries
+
+    def clear(self) -> None:
+        """
+        Remove every entry, keeping the cells.
+        """
+        for cell in self._cells.values():
+            cell.clear()
+        self._count = 0
+
+    def insert(self, key:Any, x:float, y:float, entity:Any=None) -> None:
+        """
+        Add an entry to the grid.
+
+        ## Parameters:
+        - key - The unique key of the entity (stable between ticks).
+        - x:float, y:float - The position of the entity.
+        - entity - The entity itself.
+        """
+        cell = (int(x // self.cell_size), int(y // self.cell_size))
+        entries = self._cells.get(cell)
+        if entries is None:
+            entries = self._cells[cell] = list()
+        entries.append((key, x, y, entity))
+        self._count += 1
+
+    def query(
+            self, left:float, top:float, right:float, bottom:float
+        ) -> list[tuple]:
+        """
+        Get the entries of the cells overlapping a rectangle.
+
+        The entries are not filtered by their exact position, the caller
+        must test them.
+
+        ## Parameters:
+        - left:float, top:float, right:float, bottom:float - The rectangle.
+
+        ## Returns:
+        - list[tuple] - The (key, x, y, entity) entries.
+        """
+        size = self.cell_size
+        result = list()
+        for cx in range(int(left // size), int(right // size) + 1):
+            for cy in range(int(top // size), int(bottom // size) + 1):
+                entries = self._cells.get((cx, cy))
+                if entries:
+                    result.extend(entries)
+        return result
@@ -0,0 +1,200 @@
+"""
+Spawn index module
+
+This module contains the index of the standing points of the terrain, used to
+spawn the players and the items (amo, shields, heals, building materials) on
+valid ground.
+
+A standing point is a solid cell of the terrain with enough empty cells above
+it for a player (the clearance). The index is built once from the whole map,
+then only the dirty rectangles of the explosions and of the debris are
+recomputed.
+
+Classes:
+    SpawnIndex: Index of the standing points of a terrain.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import math
+import random
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from terrain import Rect, Terrain
+
+
+class SpawnIndex:
+    """
+    SpawnIndex class
+
+    Index of the standing points of a terrain.
+
+    The points are kept in a list (for an O(1) uniform random choice), with a
+    dict of their position in the list (for an O(1) removal, by swapping with
+    the last point), and in buckets of a coarse grid (for the nearest point
+    queries and to find the points of a dirty rectangle).
+
+    ## Attributes:
+    - terrain:Terrain - The indexed terrain.
+    - clearance:int - The number of empty cells needed above a point.
+    - bucket_size:int - The size of the buckets, in pixels.
+
+    ## Methods:
+    - update(self, rect:Rect) -> None: Recompute the points after a change of
+    the terrain inside a rectangle.
+    - random(self) -> tuple[int, int]|None: Get a random standing point.
+    - nearest(self, x:float, y:float, max_distance:float) ->
+    tuple[int, int]|None: Get the nearest standing point.
+    """
+    def __init__(
+            self, terrain:Terrain, clearance:int=40, bucket_size:int=64,
+            rng:random.Random|None=None
+        ) -> None:
+        """
+        Constructor of the SpawnIndex class. Index the whole terrain.
+
+        ## Parameters:
+        - terrain:Terrain - The terrain to index.
+        - clearance:int - The number of empty cells needed above a point.
+        - bucket_size:int - The size of the buckets, in pixels.
+        - rng:random.Random - The random generator of the spawns.
+        """
+        self.terrain = terrain
+        self.clearance = clearance
+        self.bucket_size = bucket_size
+        self._rng = rng or random.Random()
+
+        self._points:list[tuple[int, int]] = list()
+        self._positions:dict[tuple[int, int], int] = dict() # point -> index in _points
+        self._buckets:dict[tuple[int, int], set[tuple[int, int]]] = dict()
+
+        width, height = terrain.size
+        self.update((0, 0, width, height))
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, point:tuple[int, int]) -> bool:
+        return point in self._positions
+
+    def _add(self, point:tuple[int, int]) -> None:
+        self._positions[point] = len(self._points)
+        self._points.append(point)
+        bucket = (point[0] // self.bucket_size, point[1] // self.bucket_size)
+        self._buckets.setdefault(bucket, set()).add(point)
+
+    def _remove(self, point:tuple[int, int]) -> None:
+        index = self._positions.pop(point)
+        last = self._points.pop()
+        if last != point:
+            self._points[index] = last
+            self._positions[last] = index
+        self._buckets[(point[0] // self.bucket_size, point[1] // self.bucket_size)].discard(point)
+
+    def _standing(self, left:int, top:int, right:int, bottom:int) -> np.ndarray:
+        """
+        Compute the standing cells of a rectangle of the terrain.
+
+        The cells above the top of the map count as empty.
+
+        ## Returns:
+        - np.ndarray - The (bottom - top, right - left) bool mask.
+        """
+        base = max(top - self.clearance, 0)
+        block = self.terrain.mask[base:bottom, left:right]
+        # solid[y] counts the solid cells of the rows base..y-1 of each column
+        solid = np.zeros((block.shape[0] + 1, block.shape[1]), dtype=np.int32)
+        np.cumsum(block, axis=0, out=solid[1:])
+        rows = np.arange(top, bottom) - base
+        above = solid[rows] - solid[np.maximum(rows - self.clearance, 0)]
+        return block[rows] & (above == 0)
+
+    def update(self, rect:Rect) -> None:
+        """
+        Recompute the points after a change of the terrain inside a rectangle.
+
+        A change of a cell can make the cells under it (up to the clearance)
+        become standing points, or stop being.
+
+        ## Parameters:
+        - rect:Rect - The changed rectangle (left, top, right, bottom).
+        """
+        width, height = self.terrain.size
+        left, top = max(rect[0], 0), max(rect[1], 0)
+        right, bottom = min(rect[2], width), min(rect[3] + self.clearance, height)
+        if left >= right or top >= bottom:
+            return
+
+        ys, xs = np.nonzero(self._standing(left, top, right, bottom))
+        fresh = set(zip((xs + left).tolist(), (ys + top).tolist()))
+
+        size = self.bucket_size
+        for bx in range(left // size, (right - 1) // size + 1):
+            for by in range(top // size, (bottom - 1) // size + 1):
+                bucket = self._buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for point in [p for p in bucket if left <= p[0] < right and top <= p[1] < bottom]:
+                    if point in fresh:
+                        fresh.discard(point) # Already indexed
+                    else:
+                        self._remove(point)
+        for point in fresh:
+            self._add(point)
+
+    def random(self) -> tuple[int, int]|None:
+        """
+        Get a uniformly random standing point, in O(1).
+
+        ## Returns:
+        - tuple[int, int] - The (x, y) solid cell to stand on.
+        - None - If the terrain has no standing point.
+        """
+        if not self._points:
+            return None
+        return self._points[self._rng.randrange(len(self._points))]
+
+    def nearest(
+            self, x:float, y:float, max_distance:float=math.inf
+        ) -> tuple[int, int]|None:
+        """
+        Get the nearest standing point of a position.
+
+        The buckets are searched in rings around the position, until the ring
+        is further than the best point found.
+
+        ## Parameters:
+        - x:float, y:float - The position.
+        - max_distance:float - The maximum distance of the point.
+
+        ## Returns:
+        - tuple[int, int] - The (x, y) solid cell to stand on.
+        - None - If no point is close enough.
+        """
+        if not self._points:
+            return None
+        size = self.bucket_size
+        width, height = self.terrain.size
+        cx, cy = int(x // size), int(y // size)
+        max_ring = (max(width, height) + abs(x) + abs(y)) // size + 1
+        if max_distance != math.inf:
+            max_ring = min(max_ring, int(max_distance // size) + 1)
+
+        best, best_distance = None, max_distance ** 2
+        ring = 0
+        while ring <= max_ring:
+            # Every point of this ring is at least (ring - 1) buckets away
+            if best is not None and ((ring - 1) * size) ** 2 > best_distance:
+                break
+            for bx in range(cx - ring, cx + ring + 1):
+                for by in (range(cy - ring, cy + ring + 1) if bx in (cx - ring, cx + ring) else (cy - ring, cy + ring)):
+                    for point in self._buckets.get((bx, by), ()):
+                        distance = (point[0] - x) ** 2 + (point[1] - y) ** 2
+                        if distance <= best_distance:
+                            best, best_distance = point, distance
+            ring += 1
+        return best